@@ -1,23 +1,32 @@
-from typing import Dict, Optional
+import logging
+
+from typing import Dict, List, Optional
+
+from django.db import IntegrityError, transaction
 
 from activitylogs.manager import default_manager
 from constants import user_system
 from events.event import Event
 from events.event_service import EventService
 
+_logger = logging.getLogger('polyaxon.activitylogs')
+
 
 class ActivityLogService(EventService):
+    __all__ = EventService.__all__ + ('record_many',)
+
     event_manager = default_manager
 
     def __init__(self):
         self.activity_log_manager = None
+        self._batch = None
 
     def record_event(self, event: Event) -> Optional[Dict]:
         if not event.ref_id:
             return
         assert event.actor_id is not None
         actor_id = event.data[event.actor_id]
-        return self.activity_log_manager.create(
+        activity_log = self.activity_log_manager.model(
             ref=event.ref_id,
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
@@ -26,6 +35,41 @@ class ActivityLogService(EventService):
             object_id=event.instance_id,
             content_type_id=event.instance_contenttype
         )
+        if self._batch is not None:
+            self._batch.append(activity_log)
+        else:
+            activity_log.save(force_insert=True)
+        return activity_log
+
+    def record_many(self, events_data: List[Dict]) -> None:
+        """Record a batch of serialized events, the activities are created in bulk."""
+        if not self.is_setup:
+            return
+        self._batch = []
+        try:
+            for event_data in events_data:
+                self.record(event_type=event_data['type'], event_data=event_data)
+            batch = self._batch
+        finally:
+            self._batch = None
+        if not batch:
+            return
+        try:
+            with transaction.atomic():
+                self.activity_log_manager.bulk_create(batch)
+        except IntegrityError:
+            # Do not lose the batch because of one activity, e.g. its actor was deleted
+            self._create_one_by_one(batch)
+
+    @staticmethod
+    def _create_one_by_one(activity_logs: List['ActivityLog']) -> None:
+        for activity_log in activity_logs:
+            try:
+                with transaction.atomic():
+                    activity_log.save(force_insert=True)
+            except IntegrityError:
+                _logger.warning('Could not record the activity `%s` of `%s`.',
+                                activity_log.event_type, activity_log.ref)
 
     def setup(self) -> None:
         super().setup()
@@ -8,6 +8,7 @@ class APIConfig(AppConfig):
 
     def ready(self):
         import signals.build_jobs  # noqa
+        import signals.config_options  # noqa
         import signals.experiments  # noqa
         import signals.experiment_groups  # noqa
         import signals.jobs  # noqa
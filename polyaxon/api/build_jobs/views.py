@@ -30,7 +30,7 @@ from api.endpoint.base import (
 from api.endpoint.build import BuildEndpoint, BuildResourceEndpoint, BuildResourceListEndpoint
 from api.endpoint.project import ProjectResourceListEndpoint
 from api.filters import OrderingFilter, QueryFilter
-from api.utils.files import stream_file
+from api.utils.logs import stream_logs
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
 from db.models.build_jobs import BuildJob, BuildJobStatus
 from db.redis.heartbeat import RedisHeartBeat
@@ -248,7 +248,10 @@ class BuildLogsView(BuildEndpoint, RetrieveEndpoint):
             process_logs(build=self.build, temp=True)
             log_path = stores.get_job_logs_path(job_name=job_name, temp=True)
 
-        return stream_file(file_path=log_path, logger=_logger)
+        return stream_logs(log_path=log_path,
+                           logger=_logger,
+                           request=request,
+                           is_done=self.build.is_done)
 
 
 class BuildStopView(BuildEndpoint, CreateEndpoint):
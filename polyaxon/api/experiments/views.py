@@ -12,6 +12,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from django.utils.dateparse import parse_datetime
+
 import auditor
 import stores
 import workers
@@ -55,6 +57,7 @@ from api.filters import OrderingFilter, QueryFilter
 from api.paginator import LargeLimitOffsetPagination
 from api.utils.files import stream_file
 from api.utils.gzip import gzip
+from api.utils.logs import stream_logs
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
 from api.utils.views.protected import ProtectedView
 from db.models.experiment_groups import ExperimentGroup
@@ -63,6 +66,7 @@ from db.models.experiments import (
     Experiment,
     ExperimentChartView,
     ExperimentMetric,
+    ExperimentMetricSeries,
     ExperimentStatus
 )
 from db.models.tokens import Token
@@ -89,6 +93,7 @@ from events.registry.experiment import (
 from events.registry.experiment_group import EXPERIMENT_GROUP_EXPERIMENTS_VIEWED
 from events.registry.experiment_job import EXPERIMENT_JOB_STATUSES_VIEWED, EXPERIMENT_JOB_VIEWED
 from events.registry.project import PROJECT_EXPERIMENTS_VIEWED
+from libs import downsampling
 from libs.archive import archive_logs_file, archive_outputs, archive_outputs_file
 from libs.spec_validation import validate_experiment_spec_config
 from lifecycles.experiments import ExperimentLifeCycle
@@ -542,6 +547,85 @@ class ExperimentMetricListView(ExperimentResourceEndpoint,
         return response
 
 
+class ExperimentMetricSeriesView(ExperimentEndpoint, RetrieveEndpoint):
+    """
+    get:
+        Get the metrics of an experiment as series downsampled to a target resolution.
+
+        query params:
+            * names: comma separated metric names, defaults to all metrics.
+            * start, end: time range, iso datetimes or timestamps.
+            * start_step, end_step: step range.
+            * resolution: the max number of points per metric.
+            * method: the downsampling method, `lttb` or `minmax`.
+    """
+    DEFAULT_RESOLUTION = 1000
+    MAX_RESOLUTION = 10000
+
+    @staticmethod
+    def _get_timestamp(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        value = parse_datetime(value)
+        if not value:
+            raise ValidationError('Received a non valid datetime.')
+        return value.timestamp()
+
+    @staticmethod
+    def _get_int(value: Optional[str], name: str) -> Optional[int]:
+        if value is None or value == '':
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError('`{}` should be an integer.'.format(name))
+
+    def get(self, request, *args, **kwargs):
+        query_params = request.query_params
+        start = self._get_timestamp(query_params.get('start'))
+        end = self._get_timestamp(query_params.get('end'))
+        start_step = self._get_int(query_params.get('start_step'), 'start_step')
+        end_step = self._get_int(query_params.get('end_step'), 'end_step')
+        resolution = self._get_int(query_params.get('resolution'), 'resolution')
+        resolution = min(resolution or self.DEFAULT_RESOLUTION, self.MAX_RESOLUTION)
+        method = query_params.get('method') or downsampling.LTTB
+        if method not in downsampling.DOWNSAMPLING_METHODS:
+            raise ValidationError('`{}` is not a valid downsampling method.'.format(method))
+
+        names = query_params.get('names')
+        if names:
+            names = [name.strip() for name in names.split(',')]
+        series = ExperimentMetricSeries.get_series(experiment_id=self.experiment.id,
+                                                   names=names,
+                                                   start=start,
+                                                   end=end,
+                                                   start_step=start_step,
+                                                   end_step=end_step)
+
+        data = {}
+        for name in sorted(series):
+            steps, timestamps, values = series[name]
+            indices = downsampling.downsample(x=timestamps,
+                                              y=values,
+                                              threshold=resolution,
+                                              method=method)
+            data[name] = {
+                'steps': steps[indices].tolist(),
+                'timestamps': timestamps[indices].tolist(),
+                'values': values[indices].tolist(),
+            }
+
+        auditor.record(event_type=EXPERIMENT_METRICS_VIEWED,
+                       instance=self.experiment,
+                       actor_id=request.user.id,
+                       actor_name=request.user.username)
+        return Response(data=data, status=status.HTTP_200_OK)
+
+
 class ExperimentStatusDetailView(ExperimentResourceEndpoint, RetrieveEndpoint):
     """Get experiment status details."""
     queryset = ExperimentStatus.objects
@@ -598,7 +682,7 @@ def get_experiment_logs_path(experiment: Experiment) -> Optional[str]:
             log_path=log_path,
             namepath=experiment_name)
     elif experiment.is_managed:
-        process_logs(experiment=experiment, temp=True)
+        process_logs(experiment=experiment, temp=True, incremental=True)
         logs_path = stores.get_experiment_logs_path(experiment_name=experiment_name, temp=True)
     else:
         return None
@@ -616,7 +700,7 @@ def get_experiment_job_logs_path(experiment: Experiment, job: ExperimentJob) ->
             log_path=log_path,
             namepath=job_name)
     elif experiment.is_managed:
-        process_experiment_job_logs(experiment_job=job, temp=True)
+        process_experiment_job_logs(experiment_job=job, temp=True, incremental=True)
         logs_path = stores.get_experiment_job_logs_path(experiment_job_name=job_name, temp=True)
     else:
         logs_path = None
@@ -646,7 +730,10 @@ class ExperimentLogsView(ExperimentEndpoint, RetrieveEndpoint, PostEndpoint):
             return Response(status=status.HTTP_404_NOT_FOUND,
                             data='Experiment has no logs.')
 
-        return stream_file(file_path=logs_path, logger=_logger)
+        return stream_logs(log_path=logs_path,
+                           logger=_logger,
+                           request=request,
+                           is_done=self.experiment.is_done)
 
     def post(self, request, *args, **kwargs):
         log_lines = request.data
@@ -769,7 +856,10 @@ class ExperimentJobLogsView(ExperimentJobResourceEndpoint,
             return Response(status=status.HTTP_404_NOT_FOUND,
                             data='Experiment has no logs.')
 
-        return stream_file(file_path=logs_path, logger=_logger)
+        return stream_logs(log_path=logs_path,
+                           logger=_logger,
+                           request=request,
+                           is_done=self.experiment.is_done)
 
 
 class ExperimentStopView(ExperimentEndpoint, CreateEndpoint):
@@ -34,6 +34,7 @@ from api.jobs.serializers import (
     JobStatusSerializer
 )
 from api.utils.files import stream_file
+from api.utils.logs import stream_logs
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
 from api.utils.views.protected import ProtectedView
 from db.models.jobs import Job, JobStatus
@@ -304,7 +305,10 @@ class JobLogsView(JobEndpoint, RetrieveEndpoint):
             process_logs(job=self.job, temp=True)
             log_path = stores.get_job_logs_path(job_name=job_name, temp=True)
 
-        return stream_file(file_path=log_path, logger=_logger)
+        return stream_logs(log_path=log_path,
+                           logger=_logger,
+                           request=request,
+                           is_done=self.job.is_done)
 
 
 class JobStopView(JobEndpoint, PostEndpoint):
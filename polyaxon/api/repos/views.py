@@ -7,7 +7,8 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
-from django.http import Http404, HttpResponseServerError
+from django.http import Http404, HttpResponseNotModified, HttpResponseServerError
+from django.utils.http import parse_etags
 
 import auditor
 import ci
@@ -27,7 +28,7 @@ from api.utils.views.protected import ProtectedView
 from api.utils.views.upload import UploadView
 from db.models.repos import ExternalRepo, Repo
 from events.registry.repo import REPO_CREATED, REPO_DOWNLOADED
-from libs.archive import archive_repo
+from libs.archive import archive_repo, get_repo_commit
 from libs.repos import git
 from libs.repos.git import GitCloneException
 from options.registry.notebooks import NOTEBOOKS_MOUNT_CODE
@@ -97,11 +98,25 @@ class RepoDownloadView(ProjectResourceListEndpoint, ProtectedView):
 
     def get(self, request, *args, **kwargs):
         repo = self.get_object()
+        repo_git = repo.git
         commit = self.request.query_params.get('commit', None)
-        archived_path, archive_name = archive_repo(repo_git=repo.git,
+        # The archive of a commit never changes, its hash is used as etag
+        commit_hash = get_repo_commit(repo_git=repo_git, commit=commit)
+        etag = '"{}"'.format(commit_hash) if commit_hash else None
+        if etag:
+            etags = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+            if etag in etags or '*' in etags:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                return response
+
+        archived_path, archive_name = archive_repo(repo_git=repo_git,
                                                    repo_name=self.project.name,
-                                                   commit=commit)
-        return self.redirect(path='{}/{}'.format(archived_path, archive_name))
+                                                   commit=commit_hash or commit)
+        response = self.redirect(path='{}/{}'.format(archived_path, archive_name))
+        if etag:
+            response['ETag'] = etag
+        return response
 
 
 class ExternalRepoSetView(ProjectResourceListEndpoint, CreateEndpoint):
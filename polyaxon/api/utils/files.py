@@ -1,23 +1,105 @@
 import mimetypes
 import os
+import re
 
-from typing import Any, Union
+from typing import Any, Iterable, Optional, Tuple, Union
 from wsgiref.util import FileWrapper
 
 from rest_framework import status
 from rest_framework.response import Response
 
-from django.http import StreamingHttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
+CHUNK_SIZE = 8192
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
 
-def stream_file(file_path: str, logger: Any) -> Union[Response, StreamingHttpResponse]:
+
+def get_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """Return the (start, end) inclusive offsets of a single bytes range, None if it is invalid."""
+    match = RANGE_RE.match(range_header.strip())
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if not start:
+        # Suffix range, the last `end` bytes
+        start, end = max(file_size - int(end), 0), file_size - 1
+    else:
+        start = int(start)
+        end = min(int(end), file_size - 1) if end else file_size - 1
+    if start > end or start >= file_size:
+        return None
+    return start, end
+
+
+def read_range(file_path: str, start: int, length: int) -> Iterable[bytes]:
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+            yield chunk
+
+
+def read_tail(file_path: str, n_lines: int) -> bytes:
+    """Return the last `n_lines` lines of a file, reading it backwards by chunks."""
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        # One extra line break for a trailing new line
+        while position > 0 and data.count(b'\n') <= n_lines:
+            chunk_size = min(CHUNK_SIZE, position)
+            position -= chunk_size
+            f.seek(position)
+            data = f.read(chunk_size) + data
+    lines = data.splitlines(keepends=True)
+    return b''.join(lines[-n_lines:])
+
+
+def get_tail_lines(request: Any) -> Optional[int]:
+    tail = request.query_params.get('tail') if request else None
+    if not tail:
+        return None
+    try:
+        tail = int(tail)
+    except (TypeError, ValueError):
+        return None
+    return tail if tail > 0 else None
+
+
+def stream_file(file_path: str,
+                logger: Any,
+                request: Any = None) -> Union[Response, HttpResponse, StreamingHttpResponse]:
+    """Stream a file, the request can ask for the last lines with `?tail=N`,
+    or for a single bytes range with the `Range` header.
+    """
     filename = os.path.basename(file_path)
-    chunk_size = 8192
+    content_type = mimetypes.guess_type(file_path)[0]
     try:
-        wrapped_file = FileWrapper(open(file_path, 'rb'), chunk_size)
-        response = StreamingHttpResponse(wrapped_file,
-                                         content_type=mimetypes.guess_type(file_path)[0])
-        response['Content-Length'] = os.path.getsize(file_path)
+        file_size = os.path.getsize(file_path)
+        tail = get_tail_lines(request)
+        range_header = request.META.get('HTTP_RANGE') if request else None
+        if tail:
+            response = HttpResponse(read_tail(file_path, tail), content_type=content_type)
+        elif range_header:
+            file_range = get_range(range_header, file_size)
+            if not file_range:
+                response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+                response['Content-Range'] = 'bytes */{}'.format(file_size)
+                return response
+            start, end = file_range
+            response = StreamingHttpResponse(read_range(file_path, start, end - start + 1),
+                                             status=status.HTTP_206_PARTIAL_CONTENT,
+                                             content_type=content_type)
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, file_size)
+        else:
+            wrapped_file = FileWrapper(open(file_path, 'rb'), CHUNK_SIZE)
+            response = StreamingHttpResponse(wrapped_file, content_type=content_type)
+            response['Content-Length'] = file_size
+        response['Accept-Ranges'] = 'bytes'
         response['Content-Disposition'] = "attachment; filename={}".format(filename)
         return response
     except FileNotFoundError:
@@ -0,0 +1,78 @@
+import os
+
+from collections import deque
+from typing import Any, Iterable, Union
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from api.utils.files import get_tail_lines, stream_file
+from logs_handlers.segments import filter_log_lines, read_logs
+
+
+def get_datetime_param(request: Any, param: str):
+    value = request.query_params.get(param)
+    if not value:
+        return None
+    try:
+        value = parse_datetime(value)
+    except ValueError:
+        value = None
+    if not value:
+        raise ValidationError('`{}` must be a valid datetime.'.format(param))
+    if timezone.is_naive(value):
+        # The logs timestamps are in UTC
+        value = timezone.make_aware(value, timezone.utc)
+    return value
+
+
+def read_log_file(log_path: str, **filters) -> Iterable[str]:
+    with open(log_path) as log_file:
+        yield from filter_log_lines(log_file, **filters)
+
+
+def stream_logs(log_path: str,
+                logger: Any,
+                request: Any,
+                is_done: bool) -> Union[Response, StreamingHttpResponse]:
+    """Stream a log file, the request can filter its lines by replica,
+    e.g. `?replica=worker.1`, by time window with `?since=...&until=...`, and ask for a tail.
+
+    The logs of done runs are read through their compressed segments,
+    so that only the segments matching the filters are read,
+    the collected logs are only stored as segments.
+    """
+    name = request.query_params.get('replica')
+    since = get_datetime_param(request, 'since')
+    until = get_datetime_param(request, 'until')
+    tail = get_tail_lines(request)
+    is_segments = os.path.isdir(log_path)
+    if not (name or since or until or (tail and is_done) or is_segments):
+        return stream_file(file_path=log_path, logger=logger, request=request)
+
+    try:
+        if is_done or is_segments:
+            log_lines = read_logs(log_path, tail=tail, since=since, until=until, name=name)
+        elif tail:
+            log_lines = deque(read_log_file(log_path, since=since, until=until, name=name),
+                              maxlen=tail)
+        else:
+            # Raise early if the file does not exist
+            os.path.getsize(log_path)
+            log_lines = read_log_file(log_path, since=since, until=until, name=name)
+    except FileNotFoundError:
+        logger.warning('File not found: file_path=%s', log_path)
+        return Response(status=status.HTTP_404_NOT_FOUND,
+                        data='File not found: file_path={}'.format(log_path))
+    except OSError:
+        return Response(
+            status=status.HTTP_400_BAD_REQUEST,
+            data='Could not get the file, an error was encountered.')
+
+    return StreamingHttpResponse((log_line.encode('utf-8') for log_line in log_lines),
+                                 content_type='text/plain')
@@ -0,0 +1,57 @@
+import os
+import threading
+
+from typing import Callable, Dict, List
+
+
+class EventsBuffer(object):
+    """Buffers the serialized events of a process and flushes them in batches.
+
+    The events are flushed when the buffer reaches `batch_size`,
+    or `interval` seconds after the first buffered event.
+    """
+
+    def __init__(self,
+                 flush_events: Callable[[List[Dict]], None],
+                 batch_size: int,
+                 interval: float) -> None:
+        self.flush_events = flush_events
+        self.batch_size = max(batch_size, 1)
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._events = []
+        self._timer = None
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        # The events and the timer of the parent process are not inherited by a forked child
+        if self._pid != os.getpid():
+            self._lock = threading.RLock()
+            self._events = []
+            self._timer = None
+            self._pid = os.getpid()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event: Dict) -> None:
+        self._check_pid()
+        with self._lock:
+            self._events.append(event)
+            should_flush = len(self._events) >= self.batch_size
+            if not should_flush and self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        self._check_pid()
+        with self._lock:
+            events, self._events = self._events, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if events:
+            self.flush_events(events)
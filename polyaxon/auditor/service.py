@@ -1,5 +1,8 @@
-from typing import Dict
+import atexit
 
+from typing import Dict, List
+
+from auditor.buffer import EventsBuffer
 from auditor.manager import default_manager
 from events.event import Event
 from events.event_service import EventService
@@ -7,7 +10,8 @@ from events.event_service import EventService
 
 class AuditorService(EventService):
     """An service that just passes the event to author services."""
-    __all__ = EventService.__all__ + ('log', 'notify', 'track')
+    __all__ = EventService.__all__ + (
+        'log', 'notify', 'track', 'log_many', 'notify_many', 'track_many', 'flush')
 
     event_manager = default_manager
 
@@ -17,6 +21,7 @@ class AuditorService(EventService):
         self.notifier = None
         self.tracker = None
         self.ref_id = None
+        self.buffer = None
 
     def get_ref_id(self) -> str:
         if self.ref_id:
@@ -32,30 +37,37 @@ class AuditorService(EventService):
 
     def record_event(self, event: Event) -> None:
         """
-        Record the event async.
+        Record the event async, the events are buffered and sent in batches to the handlers.
         """
-        import workers
-
-        from polyaxon.settings import EventsCeleryTasks
-
         if not event.ref_id:
             event.ref_id = self.get_ref_id()
         serialized_event = event.serialize(dumps=False,
                                            include_actor_name=True,
                                            include_instance_info=True)
 
+        self.buffer.add(serialized_event)
+        # We include the instance in the serialized event for executor
+        serialized_event = dict(serialized_event, instance=event.instance)
+        self.executor.record(event_type=event.event_type, event_data=serialized_event)
+
+    def send_events(self, events: List[Dict]) -> None:
+        import workers
+
+        from polyaxon.settings import EventsCeleryTasks
+
         workers.send(EventsCeleryTasks.EVENTS_TRACK,
-                     kwargs={'event': serialized_event},
+                     kwargs={'events': events},
                      countdown=None)
         workers.send(EventsCeleryTasks.EVENTS_LOG,
-                     kwargs={'event': serialized_event},
+                     kwargs={'events': events},
                      countdown=None)
         workers.send(EventsCeleryTasks.EVENTS_NOTIFY,
-                     kwargs={'event': serialized_event},
+                     kwargs={'events': events},
                      countdown=None)
-        # We include the instance in the serialized event for executor
-        serialized_event['instance'] = event.instance
-        self.executor.record(event_type=event.event_type, event_data=serialized_event)
+
+    def flush(self, **kwargs) -> None:
+        if self.buffer is not None:
+            self.buffer.flush()
 
     def notify(self, event: Dict) -> None:
         self.notifier.record(event_type=event['type'], event_data=event)
@@ -66,6 +78,16 @@ class AuditorService(EventService):
     def log(self, event: Dict) -> None:
         self.activitylogs.record(event_type=event['type'], event_data=event)
 
+    def notify_many(self, events: List[Dict]) -> None:
+        self.notifier.record_many(events_data=events)
+
+    def track_many(self, events: List[Dict]) -> None:
+        for event in events:
+            self.track(event)
+
+    def log_many(self, events: List[Dict]) -> None:
+        self.activitylogs.record_many(events_data=events)
+
     def setup(self) -> None:
         super().setup()
         # Load default event types
@@ -80,3 +102,20 @@ class AuditorService(EventService):
         self.tracker = tracker
         self.activitylogs = activitylogs
         self.executor = executor
+
+        if self.buffer is not None:
+            return
+
+        from celery.signals import task_postrun
+        from django.conf import settings
+        from django.core.signals import request_finished
+
+        # Eager tasks are executed in process, the events are sent without delay
+        batch_size = 1 if settings.CELERY_TASK_ALWAYS_EAGER else settings.AUDITOR_EVENTS_BATCH_SIZE
+        self.buffer = EventsBuffer(flush_events=self.send_events,
+                                   batch_size=batch_size,
+                                   interval=settings.AUDITOR_EVENTS_BATCH_INTERVAL)
+        # The pending events are flushed at the end of each request and task
+        request_finished.connect(self.flush, weak=False, dispatch_uid='auditor_flush_request')
+        task_postrun.connect(self.flush, weak=False, dispatch_uid='auditor_flush_task')
+        atexit.register(self.flush)
@@ -1,4 +1,8 @@
+import logging
+import os
+
 from collections import namedtuple
+from datetime import timedelta
 from typing import Any
 
 from hestia.datetime_typing import AwareDT
@@ -6,7 +10,15 @@ from hestia.datetime_typing import AwareDT
 from django.utils import timezone
 
 from conf.exceptions import ConfException
-from options.option import OptionStores
+from options.option import (
+    NAMESPACE_DB_CONFIG_MARKER,
+    NAMESPACE_DB_OPTION_MARKER,
+    NAMESPACE_ENV_MARKER,
+    NAMESPACE_SETTINGS_MARKER,
+    OptionStores
+)
+
+_logger = logging.getLogger('polyaxon.conf')
 
 
 class CachedOptionSpec(namedtuple("CachedOptionSpec", "value datetime")):
@@ -14,19 +26,32 @@ class CachedOptionSpec(namedtuple("CachedOptionSpec", "value datetime")):
 
 
 class ConfCacheManager(object):
+    """Caches the option values in process, for `CACHE_INTERVAL` seconds by default.
+
+    When an option is set or deleted, the key is cleared locally,
+    and an invalidation is published on redis so that the other processes clear it as well.
+    """
     CACHE_INTERVAL = 20
     INVALIDED_OPTION = 'INVALIDED_OPTION'
+    STORE_MARKERS = {
+        OptionStores.ENV: NAMESPACE_ENV_MARKER,
+        OptionStores.DB_OPTION: NAMESPACE_DB_OPTION_MARKER,
+        OptionStores.DB_CONFIG: NAMESPACE_DB_CONFIG_MARKER,
+        OptionStores.SETTINGS: NAMESPACE_SETTINGS_MARKER,
+    }
 
     def __init__(self):
         self._state = {}
+        self._listener = None
+        self._listener_pid = None
 
     def clear_namespace(self, namespace: str, store: str) -> None:
         if store not in OptionStores.VALUES:
             raise ConfException('`{}` is an invalid store.'.format(store))
-        marker_namespace = '{}{}'.format(namespace, store)
-        for key in self._state:
-            if key.startswith[marker_namespace]:
-                del self._state[key]
+        marker_namespace = '{}{}'.format(namespace, self.STORE_MARKERS[store])
+        for key in list(self._state):
+            if key.startswith(marker_namespace):
+                self._state.pop(key, None)
 
     def clear_key(self, key: str) -> None:
         self._state.pop(key, None)
@@ -49,8 +74,45 @@ class ConfCacheManager(object):
         self.clear_key(key=key)
         return self.INVALIDED_OPTION
 
-    def set_to_cache(self, key: str, namespace: str = None) -> None:
-        pass
+    def set_to_cache(self, key: str, value: Any, ttl: int = None) -> None:
+        ttl = self.CACHE_INTERVAL if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._listen()
+        self._state[key] = CachedOptionSpec(value=value,
+                                            datetime=timezone.now() + timedelta(seconds=ttl))
+
+    def invalidate(self, key: str) -> None:
+        """Clear the key in this process and publish the invalidation to the other processes."""
+        from db.redis.conf_cache import RedisConfCache
+
+        self.clear_key(key=key)
+        try:
+            RedisConfCache.publish(key=key)
+        except RedisConfCache.ERRORS as e:
+            _logger.warning('Could not publish the invalidation of the option `%s`: %s', key, e)
+
+    def _on_invalidation(self, message: dict) -> None:
+        key = message['data']
+        self.clear_key(key=key.decode('utf-8') if isinstance(key, bytes) else key)
+
+    def _listen(self) -> None:
+        """Subscribe to the invalidations, once per process (the thread is lost on fork)."""
+        from db.redis.conf_cache import RedisConfCache
+
+        if self._listener_pid == os.getpid() and (
+                self._listener is None or self._listener.is_alive()):
+            # Already listening, or redis was not reachable and the ttl bounds the staleness
+            return
+
+        # Values cached without a listener could miss an invalidation
+        self.clear()
+        self._listener_pid = os.getpid()
+        try:
+            self._listener = RedisConfCache.listen(handler=self._on_invalidation)
+        except RedisConfCache.ERRORS as e:
+            self._listener = None
+            _logger.warning('Could not subscribe to the options invalidations: %s', e)
 
 
 conf_cache_manager = ConfCacheManager()
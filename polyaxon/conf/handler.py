@@ -2,6 +2,8 @@ from typing import Any
 
 
 class BaseHandler(object):
+    # Whether the values read from this store should be cached by the option service
+    is_cached = False
 
     def get(self, option: 'Option') -> Any:
         raise NotImplementedError()
@@ -7,6 +7,8 @@ from conf.handler import BaseHandler
 
 
 class ClusterOptionsHandler(BaseHandler):
+    is_cached = True
+
     def __init__(self):
         self._model = None
         self._owner = None
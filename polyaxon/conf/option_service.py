@@ -18,6 +18,10 @@ class OptionService(Service):
     def __init__(self):
         self.stores = {}
 
+    def setup(self) -> None:
+        super().setup()
+        self.cache_manager.clear()
+
     def get_options_handler(self):
         return None
 
@@ -40,13 +44,13 @@ class OptionService(Service):
             raise ConfException('{} service request an unknown key `{}`.'.format(
                 self.service_name, key))
 
-        value = self.cache_manager.get_from_cache(key=key)
-        if self.cache_manager.is_valid_value(value=value):
-            return value
-
         option = self.get_option(key=key)
-        store = self.get_store(option=option)
-        value = store.get(option=option)
+        value = self.cache_manager.get_from_cache(key=key)
+        if not self.cache_manager.is_valid_value(value=value):
+            store = self.get_store(option=option)
+            value = store.get(option=option)
+            if store.is_cached:
+                self.cache_manager.set_to_cache(key=key, value=value, ttl=option.cache_ttl)
         if not to_dict:
             return value
         option_dict = option.to_dict(value=value)
@@ -70,6 +74,7 @@ class OptionService(Service):
 
         store = self.get_store(option=option)
         store.set(option=option, value=value)
+        self.cache_manager.invalidate(key=key)
 
     def delete(self, key: str) -> None:
         if not self.is_setup:
@@ -81,3 +86,4 @@ class OptionService(Service):
         option = self.get_option(key=key)
         store = self.get_store(option=option)
         store.delete(option=option)
+        self.cache_manager.invalidate(key=key)
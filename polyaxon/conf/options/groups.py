@@ -4,3 +4,5 @@ from options.registry import groups
 
 conf.subscribe(groups.GroupsCheckInterval)
 conf.subscribe(groups.GroupsChunks)
+conf.subscribe(groups.GroupsBOProcesses)
+conf.subscribe(groups.GroupsHyperbandAsync)
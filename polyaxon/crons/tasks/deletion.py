@@ -1,6 +1,7 @@
 import conf
 import workers
 
+from constants.cloning_strategies import CloningStrategy
 from crons.tasks.utils import get_date_check
 from db.models.build_jobs import BuildJob
 from db.models.experiment_groups import ExperimentGroup
@@ -9,6 +10,7 @@ from db.models.jobs import Job
 from db.models.notebooks import NotebookJob
 from db.models.projects import Project
 from db.models.tensorboards import TensorboardJob
+from libs.deletion import delete_runs
 from options.registry.cleaning import CLEANING_INTERVALS_ARCHIVES
 from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
 
@@ -39,66 +41,63 @@ def delete_archived_experiment_groups() -> None:
 @workers.app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENTS, ignore_result=True)
 def delete_archived_experiments() -> None:
     last_date = get_date_check(days=conf.get(CLEANING_INTERVALS_ARCHIVES))
-    ids = Experiment.archived.filter(
+    experiments = Experiment.archived.filter(
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).exclude(
         # We exclude as well experiments that will be deleted in groups
         experiment_group__deleted=False,
-    ).values_list('id', flat=True)
-    for _id in ids:
-        workers.send(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_EXPERIMENT,
-            kwargs={'experiment_id': _id})
+    )
+    # The experiments resumed from the deleted ones are deleted with their receivers
+    clone_ids = list(Experiment.all.filter(
+        original_experiment__in=experiments,
+        cloning_strategy=CloningStrategy.RESUME).exclude(
+        id__in=experiments).values_list('id', flat=True))
+    # The storage of the experiments in archived groups is deleted with their groups
+    delete_runs(experiments.filter(experiment_group__isnull=False),
+                content_type='experiment',
+                outputs=False,
+                logs=False)
+    delete_runs(experiments.filter(experiment_group__isnull=True), content_type='experiment')
+    for experiment in Experiment.all.filter(id__in=clone_ids):
+        experiment.delete()
 
 
 @workers.app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_JOBS, ignore_result=True)
 def delete_archived_jobs() -> None:
     last_date = get_date_check(days=conf.get(CLEANING_INTERVALS_ARCHIVES))
-    ids = Job.archived.filter(
+    jobs = Job.archived.filter(
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
-        updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        workers.send(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_JOB,
-            kwargs={'job_id': _id})
+        updated_at__lte=last_date)
+    delete_runs(jobs, content_type='job')
 
 
 @workers.app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_BUILD_JOBS, ignore_result=True)
 def delete_archived_build_jobs() -> None:
     last_date = get_date_check(days=conf.get(CLEANING_INTERVALS_ARCHIVES))
-    ids = BuildJob.archived.filter(
+    jobs = BuildJob.archived.filter(
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
-        updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        workers.send(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_BUILD_JOB,
-            kwargs={'job_id': _id})
+        updated_at__lte=last_date)
+    delete_runs(jobs, content_type='buildjob', outputs=False)
 
 
 @workers.app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_NOTEBOOK_JOBS, ignore_result=True)
 def delete_archived_notebook_jobs() -> None:
     last_date = get_date_check(days=conf.get(CLEANING_INTERVALS_ARCHIVES))
-    ids = NotebookJob.archived.filter(
+    jobs = NotebookJob.archived.filter(
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
-        updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        workers.send(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_NOTEBOOK_JOB,
-            kwargs={'job_id': _id})
+        updated_at__lte=last_date)
+    delete_runs(jobs, content_type='notebookjob', outputs=False, logs=False)
 
 
 @workers.app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_TENSORBOARD_JOBS, ignore_result=True)
 def delete_archived_tensorboard_jobs() -> None:
     last_date = get_date_check(days=conf.get(CLEANING_INTERVALS_ARCHIVES))
-    ids = TensorboardJob.archived.filter(
+    jobs = TensorboardJob.archived.filter(
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
-        updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        workers.send(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_TENSORBOARD_JOB,
-            kwargs={'job_id': _id})
+        updated_at__lte=last_date)
+    delete_runs(jobs, content_type='tensorboardjob', outputs=False, logs=False)
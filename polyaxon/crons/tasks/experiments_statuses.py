@@ -1,18 +1,44 @@
+from typing import Dict
+
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.db.models import Count
 
 import workers
 
 from db.models.experiments import Experiment
 from lifecycles.experiments import ExperimentLifeCycle
-from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
+from polyaxon.settings import CronsCeleryTasks
+
+
+def get_calculated_statuses(experiments) -> Dict[int, str]:
+    """Return the experiments with a calculated status different from their current status.
+
+    The statuses of the jobs of all the experiments are aggregated in a single query,
+    ordered by creation so that the first job is the master.
+    """
+    experiments = experiments.annotate(
+        num_jobs=Count('jobs'),
+        job_statuses=ArrayAgg('jobs__status__status', ordering='jobs__created_at')
+    ).filter(num_jobs__gt=0).values_list('id', 'status__status', 'job_statuses')
+
+    calculated_statuses = {}
+    for experiment_id, current_status, job_statuses in experiments:
+        calculated_status = ExperimentLifeCycle.calculated_status(
+            master_status=job_statuses[0],
+            job_statuses=[status for status in job_statuses if status is not None],
+            current_status=current_status)
+        if calculated_status != current_status:
+            calculated_statuses[experiment_id] = calculated_status
+    return calculated_statuses
 
 
 @workers.app.task(name=CronsCeleryTasks.EXPERIMENTS_SYNC_JOBS_STATUSES, ignore_result=True)
 def experiments_sync_jobs_statuses() -> None:
     experiments = Experiment.objects.exclude(
         status__status__in=ExperimentLifeCycle.DONE_STATUS)
-    experiments = experiments.annotate(num_jobs=Count('jobs')).filter(num_jobs__gt=0)
-    for experiment in experiments:
-        workers.send(
-            SchedulerCeleryTasks.EXPERIMENTS_CHECK_STATUS,
-            kwargs={'experiment_id': experiment.id})
+    calculated_statuses = get_calculated_statuses(experiments)
+    if not calculated_statuses:
+        return
+
+    for experiment in Experiment.objects.filter(id__in=calculated_statuses.keys()):
+        experiment.set_calculated_status(calculated_statuses[experiment.id])
@@ -3,33 +3,49 @@ import workers
 from db.models.build_jobs import BuildJob
 from db.models.experiments import Experiment
 from db.models.jobs import Job
+from db.redis.heartbeat import RedisHeartBeat
 from lifecycles.experiments import ExperimentLifeCycle
 from lifecycles.jobs import JobLifeCycle
-from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
+from polyaxon.settings import CronsCeleryTasks
 
 
 @workers.app.task(name=CronsCeleryTasks.HEARTBEAT_EXPERIMENTS, ignore_result=True)
 def heartbeat_experiments() -> None:
     experiments = Experiment.objects.filter(status__status__in=ExperimentLifeCycle.HEARTBEAT_STATUS)
-    for experiment in experiments.values_list('id', flat=True):
-        workers.send(
-            SchedulerCeleryTasks.EXPERIMENTS_CHECK_HEARTBEAT,
-            kwargs={'experiment_id': experiment})
+    experiment_ids = list(experiments.values_list('id', flat=True))
+    zombie_ids = set(experiment_ids) - RedisHeartBeat.experiments_are_alive(experiment_ids)
+    if not zombie_ids:
+        return
+
+    for experiment in Experiment.objects.filter(id__in=zombie_ids):
+        # Experiment is zombie status
+        experiment.set_status(ExperimentLifeCycle.FAILED,
+                              message='Experiment is in zombie state (no heartbeat was reported).')
 
 
 @workers.app.task(name=CronsCeleryTasks.HEARTBEAT_JOBS, ignore_result=True)
 def heartbeat_jobs() -> None:
     jobs = Job.objects.filter(status__status__in=JobLifeCycle.HEARTBEAT_STATUS)
-    for job in jobs.values_list('id', flat=True):
-        workers.send(
-            SchedulerCeleryTasks.JOBS_CHECK_HEARTBEAT,
-            kwargs={'job_id': job})
+    job_ids = list(jobs.values_list('id', flat=True))
+    zombie_ids = set(job_ids) - RedisHeartBeat.jobs_are_alive(job_ids)
+    if not zombie_ids:
+        return
+
+    for job in Job.objects.filter(id__in=zombie_ids):
+        # Job is zombie status
+        job.set_status(JobLifeCycle.FAILED,
+                       message='Job is in zombie state (no heartbeat was reported).')
 
 
 @workers.app.task(name=CronsCeleryTasks.HEARTBEAT_BUILDS, ignore_result=True)
 def heartbeat_builds() -> None:
     build_jobs = BuildJob.objects.filter(status__status__in=JobLifeCycle.HEARTBEAT_STATUS)
-    for build_job in build_jobs.values_list('id', flat=True):
-        workers.send(
-            SchedulerCeleryTasks.BUILD_JOBS_CHECK_HEARTBEAT,
-            kwargs={'build_job_id': build_job})
+    build_job_ids = list(build_jobs.values_list('id', flat=True))
+    zombie_ids = set(build_job_ids) - RedisHeartBeat.builds_are_alive(build_job_ids)
+    if not zombie_ids:
+        return
+
+    for build_job in BuildJob.objects.filter(id__in=zombie_ids):
+        # BuildJob is zombie status
+        build_job.set_status(JobLifeCycle.FAILED,
+                             message='BuildJob is in zombie state (no heartbeat was reported).')
@@ -0,0 +1,79 @@
+# Generated by Django 2.2.2 on 2019-07-02 10:12
+
+import numpy as np
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# The chunk size of the series at the time of this migration
+CHUNK_SIZE = 1000
+
+
+def create_metric_series(apps, schema_editor):
+    ExperimentMetric = apps.get_model('db', 'ExperimentMetric')
+    ExperimentMetricSeries = apps.get_model('db', 'ExperimentMetricSeries')
+
+    def create_series(experiment_id, points):
+        chunks = []
+        for name, name_points in points.items():
+            for chunk, start in enumerate(range(0, len(name_points), CHUNK_SIZE)):
+                chunk_points = name_points[start:start + CHUNK_SIZE]
+                chunks.append(ExperimentMetricSeries(
+                    experiment_id=experiment_id,
+                    name=name,
+                    chunk=chunk,
+                    first_step=start,
+                    min_timestamp=chunk_points[0][0],
+                    max_timestamp=chunk_points[-1][0],
+                    timestamps=np.asarray([p[0] for p in chunk_points], dtype='<f8').tobytes(),
+                    values=np.asarray([p[1] for p in chunk_points], dtype='<f8').tobytes()))
+        ExperimentMetricSeries.objects.bulk_create(chunks)
+
+    experiment_id = None
+    points = {}
+    metrics = ExperimentMetric.objects.order_by('experiment_id', 'created_at').values_list(
+        'experiment_id', 'created_at', 'values')
+    for metric_experiment_id, created_at, values in metrics.iterator():
+        if metric_experiment_id != experiment_id:
+            if points:
+                create_series(experiment_id=experiment_id, points=points)
+            experiment_id = metric_experiment_id
+            points = {}
+        for name, value in (values or {}).items():
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            points.setdefault(name, []).append((created_at.timestamp(), value))
+    if points:
+        create_series(experiment_id=experiment_id, points=points)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0023_auto_20190530_1125'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExperimentMetricSeries',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=256)),
+                ('chunk', models.PositiveIntegerField(default=0)),
+                ('first_step', models.PositiveIntegerField(default=0)),
+                ('min_timestamp', models.FloatField(blank=True, null=True)),
+                ('max_timestamp', models.FloatField(blank=True, null=True)),
+                ('timestamps', models.BinaryField(default=bytes)),
+                ('values', models.BinaryField(default=bytes)),
+                ('experiment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='metric_series', to='db.Experiment')),
+            ],
+            options={
+                'verbose_name_plural': 'Experiment Metric Series',
+                'unique_together': {('experiment', 'name', 'chunk')},
+            },
+        ),
+        migrations.RunPython(create_metric_series, migrations.RunPython.noop),
+    ]
@@ -371,11 +371,20 @@ class ExperimentGroup(DiffModel,
     def get_experiments_declarations(self, experiment_ids: List[int] = None):
         return self.experiments.filter(id__in=experiment_ids).values_list('id', 'declarations')
 
+    @cached_property
+    def is_asha(self) -> bool:
+        from hpsearch.utils import is_asha
+
+        iteration = self.iteration
+        return is_asha(search_algorithm=self.search_algorithm,
+                       iteration=iteration.data if iteration else None)
+
     @cached_property
     def search_manager(self) -> 'BaseSearchAlgorithmManager':
         from hpsearch.search_managers import get_search_algorithm_manager
 
-        return get_search_algorithm_manager(hptuning_config=self.hptuning_config)
+        return get_search_algorithm_manager(hptuning_config=self.hptuning_config,
+                                            asha=self.is_asha)
 
     @cached_property
     def iteration_manager(self) -> 'BaseIterationManager':
@@ -1,12 +1,13 @@
+import numpy as np
 import uuid
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hestia.datetime_typing import AwareDT
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.functional import cached_property
 
@@ -36,7 +37,6 @@ from events.registry.experiment import EXPERIMENT_COPIED, EXPERIMENT_RESTARTED,
 from libs.paths.experiments import get_experiment_subpath
 from libs.spec_validation import validate_experiment_spec_config
 from lifecycles.experiments import ExperimentLifeCycle
-from lifecycles.jobs import JobLifeCycle
 from schemas import ExperimentSpecification, PodResourcesConfig, TaskType
 
 
@@ -206,12 +206,9 @@ class Experiment(DiffModel,
     @property
     def calculated_status(self) -> str:
         master_status = self.jobs.order_by('created_at').first().last_status
-        calculated_status = master_status if JobLifeCycle.is_done(master_status) else None
-        if calculated_status is None:
-            calculated_status = ExperimentLifeCycle.jobs_status(self.last_job_statuses)
-        if calculated_status is None:
-            return self.last_status
-        return calculated_status
+        return ExperimentLifeCycle.calculated_status(master_status=master_status,
+                                                     job_statuses=self.last_job_statuses,
+                                                     current_status=self.last_status)
 
     @property
     def is_clone(self) -> bool:
@@ -239,8 +236,11 @@ class Experiment(DiffModel,
         return self.experiment_group is None
 
     def update_status(self) -> bool:
+        return self.set_calculated_status(self.calculated_status)
+
+    def set_calculated_status(self, calculated_status: str) -> bool:
+        """Set the status calculated from the jobs' statuses if it's a new status."""
         current_status = self.last_status
-        calculated_status = self.calculated_status
         if calculated_status != current_status:
             if calculated_status == ExperimentLifeCycle.UNSCHEDULABLE:
                 # Add details augmentation if the it's UNSCHEDULABLE
@@ -416,6 +416,171 @@ class ExperimentMetric(models.Model):
         ordering = ['created_at']
 
 
+class ExperimentMetricSeries(models.Model):
+    """A model that stores the reported values of an experiment metric as packed float arrays.
+
+    The timestamps (seconds since epoch) and the values are float64 arrays,
+    a series is sorted by time and split in chunks of `CHUNK_SIZE` points,
+    so that new values only rewrite the series' last chunk,
+    the position of a value in the series is its step.
+    Every chunk keeps its time range and its first step to read only the chunks of a range.
+    """
+    DTYPE = '<f8'
+    CHUNK_SIZE = 1000
+
+    experiment = models.ForeignKey(
+        'db.Experiment',
+        on_delete=models.CASCADE,
+        related_name='metric_series')
+    name = models.CharField(max_length=256)
+    chunk = models.PositiveIntegerField(default=0)
+    first_step = models.PositiveIntegerField(default=0)
+    min_timestamp = models.FloatField(blank=True, null=True)
+    max_timestamp = models.FloatField(blank=True, null=True)
+    timestamps = models.BinaryField(default=bytes)
+    values = models.BinaryField(default=bytes)
+
+    class Meta:
+        app_label = 'db'
+        verbose_name_plural = 'Experiment Metric Series'
+        unique_together = (('experiment', 'name', 'chunk'),)
+
+    def __str__(self) -> str:
+        return '{} <{}:{}>'.format(self.experiment.unique_name, self.name, self.chunk)
+
+    @property
+    def n_points(self) -> int:
+        return len(self.values) // np.dtype(self.DTYPE).itemsize
+
+    def get_chunk_series(self) -> Tuple[np.ndarray, np.ndarray]:
+        return (np.frombuffer(bytes(self.timestamps), dtype=self.DTYPE),
+                np.frombuffer(bytes(self.values), dtype=self.DTYPE))
+
+    def set_chunk_series(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Set the points of the chunk, the timestamps must be sorted."""
+        self.timestamps = np.asarray(timestamps, dtype=self.DTYPE).tobytes()
+        self.values = np.asarray(values, dtype=self.DTYPE).tobytes()
+        self.min_timestamp = float(timestamps[0]) if len(timestamps) else None
+        self.max_timestamp = float(timestamps[-1]) if len(timestamps) else None
+
+    @classmethod
+    def get_series(cls,
+                   experiment_id: int,
+                   names: List[str] = None,
+                   start: float = None,
+                   end: float = None,
+                   start_step: int = None,
+                   end_step: int = None) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Return the steps, the timestamps and the values of the experiment's series,
+        between the `start` and `end` timestamps included, and from `start_step` to `end_step`.
+
+        Only the chunks overlapping the ranges are read.
+        """
+        chunks = cls.objects.filter(experiment_id=experiment_id)
+        if names:
+            chunks = chunks.filter(name__in=names)
+        if start is not None:
+            chunks = chunks.filter(max_timestamp__gte=start)
+        if end is not None:
+            chunks = chunks.filter(min_timestamp__lte=end)
+        if start_step is not None:
+            # All the chunks but the last one of a series are full
+            chunks = chunks.filter(first_step__gt=start_step - cls.CHUNK_SIZE)
+        if end_step is not None:
+            chunks = chunks.filter(first_step__lt=end_step)
+        series_chunks = {}
+        for name, first_step, timestamps, values in chunks.order_by('name', 'chunk').values_list(
+                'name', 'first_step', 'timestamps', 'values'):
+            series_chunks.setdefault(name, []).append(
+                (first_step, bytes(timestamps), bytes(values)))
+
+        series = {}
+        for name, name_chunks in series_chunks.items():
+            timestamps = np.frombuffer(b''.join(c[1] for c in name_chunks), dtype=cls.DTYPE)
+            values = np.frombuffer(b''.join(c[2] for c in name_chunks), dtype=cls.DTYPE)
+            # The chunks overlapping the ranges are consecutive
+            steps = name_chunks[0][0] + np.arange(len(timestamps))
+            first = 0 if start_step is None else int(np.searchsorted(steps, start_step))
+            last = len(steps) if end_step is None else int(np.searchsorted(steps, end_step))
+            if start is not None:
+                first = max(first, int(np.searchsorted(timestamps, start, side='left')))
+            if end is not None:
+                last = min(last, int(np.searchsorted(timestamps, end, side='right')))
+            series[name] = (steps[first:last], timestamps[first:last], values[first:last])
+        return series
+
+    @classmethod
+    def add_metrics(cls, experiment_id: int, metrics: List['ExperimentMetric']) -> None:
+        """Add the numeric values of the metrics to the experiment's series."""
+        points = {}
+        for metric in metrics:
+            timestamp = metric.created_at.timestamp()
+            for name, value in (metric.values or {}).items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                points.setdefault(name, []).append((timestamp, value))
+        if not points:
+            return
+        points = {name: np.asarray(sorted(name_points, key=lambda p: p[0]), dtype=cls.DTYPE)
+                  for name, name_points in points.items()}
+
+        with transaction.atomic():
+            # Create the first chunk of the missing series,
+            # and lock it to serialize the appends to the series
+            cls.objects.bulk_create([cls(experiment_id=experiment_id, name=name)
+                                     for name in points],
+                                    ignore_conflicts=True)
+            list(cls.objects.select_for_update().filter(
+                experiment_id=experiment_id, name__in=points, chunk=0).values_list('id'))
+
+            # The series are kept sorted, the chunks from the first one ending after
+            # the earliest new point are rewritten, usually only the last chunk
+            start_chunks = {}
+            for name, chunk, max_timestamp in cls.objects.filter(
+                    experiment_id=experiment_id, name__in=points).order_by(
+                    '-chunk').values_list('name', 'chunk', 'max_timestamp'):
+                if name not in start_chunks or (max_timestamp is not None and
+                                                max_timestamp > points[name][0, 0]):
+                    start_chunks[name] = chunk
+            rewrite_query = models.Q()
+            for name, chunk in start_chunks.items():
+                rewrite_query |= models.Q(name=name, chunk__gte=chunk)
+            series_chunks = {}
+            for instance in cls.objects.filter(
+                    rewrite_query, experiment_id=experiment_id).order_by('chunk'):
+                series_chunks.setdefault(instance.name, []).append(instance)
+
+            new_chunks = []
+            for name, instances in series_chunks.items():
+                chunk_series = [instance.get_chunk_series() for instance in instances]
+                timestamps = np.concatenate([c[0] for c in chunk_series] + [points[name][:, 0]])
+                values = np.concatenate([c[1] for c in chunk_series] + [points[name][:, 1]])
+                # The new values reported at the same time as existing ones come after them
+                order = np.argsort(timestamps, kind='mergesort')
+                timestamps, values = timestamps[order], values[order]
+                first = instances[0]
+                for i, start in enumerate(range(0, len(timestamps), cls.CHUNK_SIZE)):
+                    if i < len(instances):
+                        instance = instances[i]
+                    else:
+                        instance = cls(experiment_id=experiment_id,
+                                       name=name,
+                                       chunk=first.chunk + i)
+                        new_chunks.append(instance)
+                    instance.first_step = first.first_step + start
+                    instance.set_chunk_series(timestamps=timestamps[start:start + cls.CHUNK_SIZE],
+                                              values=values[start:start + cls.CHUNK_SIZE])
+                    if instance.pk:
+                        instance.save(update_fields=['first_step',
+                                                     'min_timestamp',
+                                                     'max_timestamp',
+                                                     'timestamps',
+                                                     'values'])
+            cls.objects.bulk_create(new_chunks)
+
+
 class ExperimentChartView(ChartViewModel):
     """A model that represents an experiment chart view."""
     experiment = models.ForeignKey(
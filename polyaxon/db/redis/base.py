@@ -8,9 +8,14 @@ class BaseRedisDb(object):
 
     @classmethod
     def _get_redis(cls) -> Any:
-        return redis.Redis(connection_pool=cls.REDIS_POOL,
-                           retry_on_timeout=True,
-                           socket_keepalive=True)
+        # The client is thread safe and reused, connections are taken from the class' pool
+        red = cls.__dict__.get('_redis')
+        if red is None:
+            red = redis.Redis(connection_pool=cls.REDIS_POOL,
+                              retry_on_timeout=True,
+                              socket_keepalive=True)
+            cls._redis = red
+        return red
 
     @classmethod
     def connection(cls) -> Any:
@@ -0,0 +1,28 @@
+from typing import Any, Callable
+
+import redis
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisConfCache(BaseRedisDb):
+    """
+    RedisConfCache provides a channel to invalidate the options cached by the other processes.
+    """
+    CHANNEL = 'conf.invalidations'
+    LISTEN_INTERVAL = 1
+
+    ERRORS = (redis.exceptions.RedisError, OSError)
+
+    REDIS_POOL = RedisPools.CONF_CACHE
+
+    @classmethod
+    def publish(cls, key: str) -> None:
+        cls.connection().publish(cls.CHANNEL, key)
+
+    @classmethod
+    def listen(cls, handler: Callable[[dict], None]) -> Any:
+        pubsub = cls.connection().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{cls.CHANNEL: handler})
+        return pubsub.run_in_thread(sleep_time=cls.LISTEN_INTERVAL, daemon=True)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from db.redis.base import BaseRedisDb
 from polyaxon.settings import RedisPools
@@ -41,6 +41,27 @@ class RedisJobContainers(BaseRedisDb):
             return job_uuid, experiment_uuid
         return None, None
 
+    @classmethod
+    def get_jobs(cls, container_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Same as `get_job` for several containers with two HMGET calls."""
+        if not container_ids:
+            return {}
+        red = cls._get_redis()
+        job_uuids = [job_uuid.decode('utf-8') if job_uuid else None
+                     for job_uuid in red.hmget(cls.KEY_CONTAINERS_TO_JOBS, container_ids)]
+        experiment_uuids = {}
+        uuids = list({job_uuid for job_uuid in job_uuids if job_uuid})
+        if uuids:
+            experiment_uuids = {
+                job_uuid: experiment_uuid.decode('utf-8') if experiment_uuid else None
+                for job_uuid, experiment_uuid in zip(
+                    uuids, red.hmget(cls.KEY_JOBS_TO_EXPERIMENTS, uuids))
+            }
+        return {
+            container_id: (job_uuid, experiment_uuids.get(job_uuid)) if job_uuid else (None, None)
+            for container_id, job_uuid in zip(container_ids, job_uuids)
+        }
+
     @classmethod
     def remove_container(cls, container_id: str, red=None) -> None:
         red = red or cls._get_redis()
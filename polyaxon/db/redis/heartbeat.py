@@ -1,3 +1,5 @@
+from typing import Iterable, Set
+
 import conf
 
 from db.redis.base import BaseRedisDb
@@ -16,6 +18,9 @@ class RedisHeartBeat(BaseRedisDb):
     # A Run should report under this value, otherwise it could be considered zombie
     REDIS_POOL = RedisPools.HEARTBEAT
 
+    # The heartbeats of several runs are read with MGET calls of this number of keys
+    CHUNK_SIZE = 1000
+
     def __init__(self, experiment: int = None, job: int = None, build: int = None) -> None:
         if len([1 for i in [experiment, job, build] if i]) != 1:
             raise ValueError('RedisHeartBeat expects an experiment, build or a job.')
@@ -98,3 +103,27 @@ class RedisHeartBeat(BaseRedisDb):
     def build_is_alive(cls, build_id) -> bool:
         heart_beat = RedisHeartBeat(build=build_id)
         return heart_beat.is_alive()
+
+    @classmethod
+    def _get_alive(cls, key: str, ids: Iterable[int]) -> Set[int]:
+        """Return the ids with a heartbeat, the chunks of keys are read in a single round trip."""
+        ids = list(ids)
+        if not ids:
+            return set()
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for i in range(0, len(ids), cls.CHUNK_SIZE):
+            pipe.mget([key.format(_id) for _id in ids[i:i + cls.CHUNK_SIZE]])
+        values = [value for chunk_values in pipe.execute() for value in chunk_values]
+        return {_id for _id, value in zip(ids, values) if value}
+
+    @classmethod
+    def experiments_are_alive(cls, experiment_ids: Iterable[int]) -> Set[int]:
+        return cls._get_alive(cls.KEY_EXPERIMENT, experiment_ids)
+
+    @classmethod
+    def jobs_are_alive(cls, job_ids: Iterable[int]) -> Set[int]:
+        return cls._get_alive(cls.KEY_JOB, job_ids)
+
+    @classmethod
+    def builds_are_alive(cls, build_ids: Iterable[int]) -> Set[int]:
+        return cls._get_alive(cls.KEY_BUILD, build_ids)
@@ -1,6 +1,6 @@
 import json
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 from db.redis.base import BaseRedisDb
 from polyaxon.settings import RedisPools
@@ -65,6 +65,25 @@ class RedisToStream(BaseRedisDb):
     def is_monitored_experiment_logs(cls, experiment_uuid: str) -> bool:
         return cls._is_monitored(cls.KEY_EXPERIMENT_LOGS, experiment_uuid)
 
+    @classmethod
+    def get_monitored(cls, *keys: str) -> List[Set[str]]:
+        """Return the ids monitored for each key in a single round trip."""
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for key in keys:
+            pipe.smembers(key)
+        return [{object_id.decode('utf-8') for object_id in object_ids}
+                for object_ids in pipe.execute()]
+
+    @classmethod
+    def get_monitored_resources(cls) -> List[Set[str]]:
+        """Return the job and the experiment ids currently monitored for resources."""
+        return cls.get_monitored(cls.KEY_JOB_RESOURCES, cls.KEY_EXPERIMENT_RESOURCES)
+
+    @classmethod
+    def get_monitored_logs(cls) -> List[Set[str]]:
+        """Return the job and the experiment ids currently monitored for logs."""
+        return cls.get_monitored(cls.KEY_JOB_LOGS, cls.KEY_EXPERIMENT_LOGS)
+
     @classmethod
     def _remove_object(cls, key: str, object_id: str) -> None:
         red = cls._get_redis()
@@ -100,20 +119,37 @@ class RedisToStream(BaseRedisDb):
             return resources if as_json else json.dumps(resources)
         return None
 
+    @classmethod
+    def get_latest_jobs_resources(cls, jobs: List[Dict]) -> List[Dict]:
+        """Return the latest resources of several jobs with a single HMGET."""
+        if not jobs:
+            return []
+        red = cls._get_redis()
+        jobs_resources = red.hmget(cls.KEY_JOB_LATEST_STATS, [job['uuid'] for job in jobs])
+        stats = []
+        for job, resources in zip(jobs, jobs_resources):
+            if resources:
+                resources = json.loads(resources.decode('utf-8'))
+                resources['job_name'] = job['name']
+                stats.append(resources)
+        return stats
+
     @classmethod
     def get_latest_experiment_resources(cls,
                                         jobs: List[Dict],
                                         as_json: bool = False) -> List[Optional[Union[str, Dict]]]:
-        stats = []
-        for job in jobs:
-            job_resources = cls.get_latest_job_resources(job=job['uuid'],
-                                                         job_name=job['name'],
-                                                         as_json=True)
-            if job_resources:
-                stats.append(job_resources)
+        stats = cls.get_latest_jobs_resources(jobs)
         return stats if as_json else json.dumps(stats)
 
     @classmethod
     def set_latest_job_resources(cls, job: str, payload: Dict) -> None:
         red = cls._get_redis()
         red.hset(cls.KEY_JOB_LATEST_STATS, job, json.dumps(payload))
+
+    @classmethod
+    def set_latest_jobs_resources(cls, payloads: Dict[str, Dict]) -> None:
+        if not payloads:
+            return
+        red = cls._get_redis()
+        red.hmset(cls.KEY_JOB_LATEST_STATS,
+                  {job: json.dumps(payload) for job, payload in payloads.items()})
@@ -32,6 +32,7 @@ EXPERIMENT_GROUP_NEW_STATUS = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
 EXPERIMENT_GROUP_EXPERIMENTS_VIEWED = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
                                                      event_actions.EXPERIMENTS_VIEWED)
 EXPERIMENT_GROUP_ITERATION = '{}.new_iteration'.format(event_subjects.EXPERIMENT_GROUP)
+EXPERIMENT_GROUP_NEW_EXPERIMENTS = '{}.new_experiments'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_RANDOM = '{}.random'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_GRID = '{}.grid'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_HYPERBAND = '{}.hyperband'.format(event_subjects.EXPERIMENT_GROUP)
@@ -67,6 +68,7 @@ EVENTS = {
     EXPERIMENT_GROUP_NEW_STATUS,
     EXPERIMENT_GROUP_EXPERIMENTS_VIEWED,
     EXPERIMENT_GROUP_ITERATION,
+    EXPERIMENT_GROUP_NEW_EXPERIMENTS,
     EXPERIMENT_GROUP_RANDOM,
     EXPERIMENT_GROUP_GRID,
     EXPERIMENT_GROUP_HYPERBAND,
@@ -360,6 +362,23 @@ class ExperimentGroupIterationEvent(Event):
     )
 
 
+class ExperimentGroupNewExperimentsEvent(Event):
+    event_type = EXPERIMENT_GROUP_NEW_EXPERIMENTS
+    attributes = (
+        Attribute('id'),
+        Attribute('project.id'),
+        Attribute('project.user.id'),
+        Attribute('user.id'),
+        Attribute('backend', attr_type=bool),
+        Attribute('is_managed', attr_type=bool),
+        Attribute('updated_at', is_datetime=True),
+        Attribute('concurrency', is_required=False),
+        Attribute('search_algorithm', is_required=False),
+        Attribute('last_status'),
+        Attribute('n_experiments', attr_type=int),
+    )
+
+
 class ExperimentGroupExperimentsViewedEvent(Event):
     event_type = EXPERIMENT_GROUP_EXPERIMENTS_VIEWED
     actor = True
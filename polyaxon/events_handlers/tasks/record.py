@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from django.db import IntegrityError
 
 import auditor
@@ -7,18 +9,29 @@ from polyaxon.settings import EventsCeleryTasks
 
 
 @workers.app.task(name=EventsCeleryTasks.EVENTS_NOTIFY, ignore_result=True)
-def events_notify(event: 'Event') -> None:
-    auditor.notify(event)
+def events_notify(event: Dict = None, events: List[Dict] = None) -> None:
+    if events is not None:
+        auditor.notify_many(events)
+    else:
+        auditor.notify(event)
+
 
+@workers.app.task(name=EventsCeleryTasks.EVENTS_LOG, bind=True, max_retries=3, ignore_result=True)
+def events_log(self, event: Dict = None, events: List[Dict] = None) -> None:
+    if events is not None:
+        # The activities failing in a batch are skipped, retrying would duplicate the others
+        auditor.log_many(events)
+        return
 
-@workers.app.task(name=EventsCeleryTasks.EVENTS_LOG,
-                  autoretry_for=(IntegrityError,),
-                  max_retries=3,
-                  ignore_result=True)
-def events_log(event: 'Event') -> None:
-    auditor.log(event)
+    try:
+        auditor.log(event)
+    except IntegrityError as exc:
+        self.retry(exc=exc)
 
 
 @workers.app.task(name=EventsCeleryTasks.EVENTS_TRACK, ignore_result=True)
-def events_track(event: 'Event') -> None:
-    auditor.track(event)
+def events_track(event: Dict = None, events: List[Dict] = None) -> None:
+    if events is not None:
+        auditor.track_many(events)
+    else:
+        auditor.track(event)
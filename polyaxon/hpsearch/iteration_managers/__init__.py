@@ -1,3 +1,4 @@
+from hpsearch.iteration_managers.asha import ASHAIterationManager
 from hpsearch.iteration_managers.base import BaseIterationManager
 from hpsearch.iteration_managers.bayesian_optimization import BOIterationManager
 from hpsearch.iteration_managers.hyperband import HyperbandIterationManager
@@ -5,6 +6,8 @@ from schemas import SearchAlgorithms
 
 
 def get_search_iteration_manager(experiment_group):
+    if experiment_group.is_asha:
+        return ASHAIterationManager(experiment_group=experiment_group)
     if SearchAlgorithms.is_hyperband(experiment_group.search_algorithm):
         return HyperbandIterationManager(experiment_group=experiment_group)
     if SearchAlgorithms.is_bo(experiment_group.search_algorithm):
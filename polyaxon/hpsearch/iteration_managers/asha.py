@@ -0,0 +1,82 @@
+from hpsearch.iteration_managers.base import BaseIterationManager
+from hpsearch.iteration_managers.logger import logger
+from hpsearch.schemas import ASHAIterationConfig
+from lifecycles.experiments import ExperimentLifeCycle
+
+
+class ASHAIterationManager(BaseIterationManager):
+    def get_metric_name(self):
+        return self.experiment_group.hptuning_config.hyperband.metric.name
+
+    def create_iteration(self, num_suggestions=0):
+        """Create the single iteration of the experiment group."""
+        from db.models.experiment_groups import ExperimentGroupIteration
+
+        iteration_config = ASHAIterationConfig(iteration=0,
+                                               num_suggestions=num_suggestions,
+                                               experiment_ids=[],
+                                               promotions=[],
+                                               asha=True)
+        return ExperimentGroupIteration.objects.create(
+            experiment_group=self.experiment_group,
+            data=iteration_config.to_dict())
+
+    def update_iteration(self):
+        """ASHA reads the metrics of the done experiments when it needs to promote."""
+
+    def get_rungs_metrics(self, iteration_config):
+        """Return the metrics of the iteration's done experiments grouped by rung."""
+        search_manager = self.experiment_group.search_manager
+        metric = self.get_metric_name()
+        resource_name = self.experiment_group.hptuning_config.hyperband.resource.name
+        experiments = self.experiment_group.get_annotated_experiments_with_metric(
+            metric=metric,
+            experiment_ids=iteration_config.experiment_ids
+        ).filter(status__status__in=ExperimentLifeCycle.DONE_STATUS)
+
+        rungs_metrics = {}
+        for experiment_id, declarations, value in experiments.values_list(
+                'id', 'declarations', metric):
+            if value is None or not declarations or resource_name not in declarations:
+                continue
+            rung = search_manager.get_rung(resources=declarations[resource_name])
+            rungs_metrics.setdefault(rung, []).append((experiment_id, value))
+        return rungs_metrics
+
+    def promote(self, iteration_config, promotions):
+        """Resume or restart the promoted experiments with the resources of their new rung."""
+        hptuning_config = self.experiment_group.hptuning_config
+        search_manager = self.experiment_group.search_manager
+        resource_name = hptuning_config.hyperband.resource.name
+        experiments = self.experiment_group.experiments.in_bulk(
+            [experiment_id for experiment_id, _ in promotions])
+
+        new_promotions = []
+        for experiment_id, rung in promotions:
+            experiment = experiments.get(experiment_id)
+            if not experiment:
+                logger.warning('Experiment `%s` could not be promoted, it does not exist anymore.',
+                               experiment_id)
+                continue
+            declarations = experiment.declarations
+            declarations[resource_name] = search_manager.get_rung_resources(rung=rung)
+            declarations_spec = {'declarations': declarations}
+            specification = experiment.specification.patch(declarations_spec)
+            if hptuning_config.hyperband.resume:
+                new_experiment = experiment.resume(
+                    declarations=declarations,
+                    content=specification.raw_data)
+            else:
+                new_experiment = experiment.restart(
+                    experiment_group=self.experiment_group,
+                    declarations=declarations,
+                    content=specification.raw_data)
+            new_promotions.append([experiment_id, new_experiment.id])
+
+        if not new_promotions:
+            return []
+        iteration_config.promotions = (iteration_config.promotions or []) + new_promotions
+        self._update_config(iteration_config)
+        new_experiment_ids = [promotion[1] for promotion in new_promotions]
+        self.add_iteration_experiments(experiment_ids=new_experiment_ids)
+        return new_experiment_ids
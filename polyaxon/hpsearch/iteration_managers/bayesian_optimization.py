@@ -23,6 +23,9 @@ class BOIterationManager(BaseIterationManager):
             old_experiments_configs = iteration_config.combined_experiments_configs
             old_experiments_metrics = iteration_config.combined_experiments_metrics
 
+        # Carry the surrogate state computed while making this iteration's suggestions
+        surrogate_state = getattr(self.experiment_group.search_manager, 'surrogate_state', None)
+
         # Create a new iteration config
         iteration_config = BOIterationConfig(
             iteration=iteration,
@@ -32,6 +35,7 @@ class BOIterationManager(BaseIterationManager):
             old_experiments_metrics=old_experiments_metrics,
             experiment_ids=[],
             experiments_configs=[],
+            surrogate_state=surrogate_state,
         )
         return ExperimentGroupIteration.objects.create(
             experiment_group=self.experiment_group,
@@ -1,6 +1,8 @@
+from hpsearch.schemas.asha import ASHAIterationConfig
 from hpsearch.schemas.base_iteration import BaseIterationConfig
 from hpsearch.schemas.bayesian_optimization import BOIterationConfig
 from hpsearch.schemas.hyperband import HyperbandIterationConfig
+from hpsearch.utils import is_asha
 from schemas import SearchAlgorithms
 
 
@@ -8,6 +10,8 @@ def get_iteration_config(search_algorithm, iteration=None):
     if SearchAlgorithms.is_hyperband(search_algorithm):
         if not iteration:
             raise ValueError('No iteration was provided')
+        if is_asha(search_algorithm, iteration=iteration):
+            return ASHAIterationConfig.from_dict(iteration)
         return HyperbandIterationConfig.from_dict(iteration)
     if SearchAlgorithms.is_bo(search_algorithm):
         if not iteration:
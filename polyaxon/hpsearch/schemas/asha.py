@@ -0,0 +1,49 @@
+from marshmallow import fields, post_dump, post_load, validate
+
+from hpsearch.schemas.base_iteration import BaseIterationConfig, BaseIterationSchema
+
+
+class ASHAIterationSchema(BaseIterationSchema):
+    asha = fields.Bool()
+    promotions = fields.List(fields.List(fields.Int(), validate=validate.Length(equal=2)),
+                             allow_none=True)
+
+    @post_load
+    def make(self, data):
+        return ASHAIterationConfig(**data)
+
+    @post_dump
+    def unmake(self, data):
+        return ASHAIterationConfig.remove_reduced_attrs(data)
+
+
+class ASHAIterationConfig(BaseIterationConfig):
+    """ASHA runs in a single iteration.
+
+    `num_suggestions` is the number of configs sampled in the bottom rung,
+    and `promotions` keeps the pairs [experiment_id, promoted_experiment_id].
+    `asha` marks the iteration of a hyperband group running asynchronous successive halving.
+    """
+    SCHEMA = ASHAIterationSchema
+
+    def __init__(self,
+                 iteration,
+                 num_suggestions,
+                 experiment_ids=None,
+                 promotions=None,
+                 asha=True):
+        super().__init__(iteration=iteration,
+                         num_suggestions=num_suggestions,
+                         experiment_ids=experiment_ids)
+        self.promotions = promotions
+        self.asha = asha
+
+    @property
+    def promoted_ids(self):
+        return [promotion[0] for promotion in self.promotions or []]
+
+    @property
+    def num_suggestions_in_flight(self):
+        """The number of bottom rung suggestions not created yet."""
+        n_created = len(self.experiment_ids or []) - len(self.promotions or [])
+        return max((self.num_suggestions or 0) - n_created, 0)
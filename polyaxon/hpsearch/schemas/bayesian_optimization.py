@@ -17,6 +17,7 @@ class BOIterationSchema(BaseIterationSchema):
     experiments_metrics = fields.List(
         fields.List(fields.Raw(), validate=validate.Length(equal=2)),
         allow_none=True)
+    surrogate_state = fields.Dict(allow_none=True)
 
     @post_load
     def make(self, data):
@@ -29,6 +30,7 @@ class BOIterationSchema(BaseIterationSchema):
 
 class BOIterationConfig(BaseIterationConfig):
     SCHEMA = BOIterationSchema
+    REDUCED_ATTRIBUTES = ['surrogate_state']
 
     def __init__(self,
                  iteration,
@@ -38,7 +40,8 @@ class BOIterationConfig(BaseIterationConfig):
                  old_experiments_configs=None,
                  experiment_ids=None,
                  experiments_metrics=None,
-                 experiments_configs=None):
+                 experiments_configs=None,
+                 surrogate_state=None):
         super().__init__(iteration=iteration,
                          num_suggestions=num_suggestions,
                          experiment_ids=experiment_ids)
@@ -47,6 +50,7 @@ class BOIterationConfig(BaseIterationConfig):
         self.old_experiments_configs = old_experiments_configs
         self.experiments_configs = experiments_configs
         self.experiments_metrics = experiments_metrics
+        self.surrogate_state = surrogate_state
 
     @property
     def combined_experiment_ids(self):
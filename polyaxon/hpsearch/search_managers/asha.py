@@ -0,0 +1,99 @@
+import math
+
+from hpsearch.search_managers.hyperband import HyperbandSearchManager
+from hpsearch.search_managers.utils import get_random_suggestions
+from schemas import Optimization
+
+
+class ASHASearchManager(HyperbandSearchManager):
+    """Asynchronous successive halving (ASHA) algorithm manager.
+
+    It uses the same configuration as hyperband (`max_iter`, `eta`, `resource` and `metric`),
+    but instead of waiting for all the experiments of a rung to finish,
+    an experiment is promoted to the next rung as soon as it ranks in the top `1 / eta`
+    of the experiments that finished in its rung. When no promotion is possible,
+    a new configuration is started in the bottom rung, until the budget of
+    the most exploratory hyperband bracket is consumed.
+
+    def get_job(self):
+        for rung in reversed(range(self.n_rungs - 1)):
+            candidates = top_k(rung, k=len(rung) / eta) - promoted(rung)
+            if candidates:
+                return candidates[0], rung + 1
+        return new_suggestion(), 0
+    """
+
+    @property
+    def n_rungs(self):
+        return self.s_max + 1
+
+    @property
+    def max_configs(self):
+        """The number of configurations sampled in the bottom rung."""
+        return self.get_n_configs(bracket=self.s_max)
+
+    def get_rung_resources(self, rung):
+        n_resources = self.get_n_resources(n_resources=self.get_resources(bracket=self.s_max),
+                                           bracket_iteration=rung)
+        return self.hptuning_config.hyperband.resource.cast_value(n_resources)
+
+    def get_rung(self, resources):
+        """Return the rung of an experiment based on its resource declaration."""
+        min_resources = self.get_resources(bracket=self.s_max)
+        rung = int(round(math.log(float(resources) / min_resources, self.eta)))
+        return min(max(rung, 0), self.n_rungs - 1)
+
+    def get_num_suggestions_left(self, iteration_config):
+        return max(self.max_configs - (iteration_config.num_suggestions or 0), 0)
+
+    def get_suggestions(self, iteration_config=None, n_suggestions=None):
+        """Return a list of new suggestions to run in the bottom rung."""
+        num_suggestions = iteration_config.num_suggestions if iteration_config else 0
+        n_suggestions = n_suggestions or self.hptuning_config.concurrency or 1
+        n_suggestions = min(n_suggestions, self.max_configs - num_suggestions)
+        if n_suggestions <= 0:
+            return []
+
+        suggestion_params = {
+            self.hptuning_config.hyperband.resource.name: self.get_rung_resources(rung=0)
+        }
+        seed = self.hptuning_config.seed
+        if seed:
+            # Suggestions are made in several calls, a fixed seed would repeat the same configs
+            seed += num_suggestions
+        return get_random_suggestions(matrix=self.hptuning_config.matrix,
+                                      n_suggestions=n_suggestions,
+                                      suggestion_params=suggestion_params,
+                                      seed=seed)
+
+    def get_promotions(self, rungs_metrics, promoted_ids, n_promotions):
+        """Return a list of (experiment_id, rung) to promote, starting from the top rungs.
+
+        Params:
+            rungs_metrics: `dict` {rung: [(experiment_id, metric), ...]} of the done experiments.
+            promoted_ids: the experiment ids already promoted.
+            n_promotions: the maximum number of promotions to return.
+        """
+        reverse = Optimization.maximize(self.hptuning_config.hyperband.metric.optimization)
+        promoted_ids = set(promoted_ids)
+        promotions = []
+        for rung in reversed(range(self.n_rungs - 1)):
+            experiments_metrics = rungs_metrics.get(rung) or []
+            n_configs_to_keep = int(len(experiments_metrics) / self.eta)
+            if n_configs_to_keep <= 0:
+                continue
+            experiments_metrics = sorted(experiments_metrics, key=lambda x: x[1], reverse=reverse)
+            for experiment_id, _ in experiments_metrics[:n_configs_to_keep]:
+                if len(promotions) >= n_promotions:
+                    return promotions
+                if experiment_id not in promoted_ids:
+                    promotions.append((experiment_id, rung + 1))
+        return promotions
+
+    def should_reschedule(self, iteration, bracket_iteration):
+        """ASHA runs in a single iteration."""
+        return False
+
+    def should_reduce_configs(self, iteration, bracket_iteration):
+        """ASHA promotes configs continuously, there's no synchronous reduction."""
+        return False
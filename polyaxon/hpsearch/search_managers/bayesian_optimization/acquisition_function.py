@@ -1,10 +1,15 @@
+import logging
 import numpy as np
 
+from contextlib import contextmanager
+
+from billiard import Pool
 from scipy.optimize import minimize
 from scipy.stats import norm
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF, Matern
 
+from hpsearch.search_managers.bayesian_optimization.surrogate import GaussianProcessSurrogate
 from hpsearch.search_managers.utils import get_random_generator
 from schemas import (
     AcquisitionFunctions,
@@ -13,8 +18,12 @@ from schemas import (
     UtilityFunctionConfig
 )
 
+_logger = logging.getLogger('polyaxon.hpsearch.search_managers')
+
 
 class UtilityFunction(object):
+    # Maximum number of random points evaluated at once during the warm up
+    WARMUP_CHUNK_SIZE = 10000
 
     def __init__(self, config, seed=None):
         if not isinstance(config, UtilityFunctionConfig):
@@ -45,29 +54,53 @@ class UtilityFunction(object):
             random_state=random_generator
         )
 
-    def _compute_ucb(self, x):
-        mean, std = self.gaussian_process.predict(x, return_std=True)
-        return mean + self.kappa * std
-
-    def _compute_ei(self, x, y_max):
-        mean, std = self.gaussian_process.predict(x, return_std=True)
-        z = (mean - y_max - self.eps) / std
-        return (mean - y_max - self.eps) * norm.cdf(z) + std * norm.pdf(z)
-
-    def _compute_poi(self, x, y_max):
-        mean, std = self.gaussian_process.predict(x, return_std=True)
-        z = (mean - y_max - self.eps) / std
-        return norm.cdf(z)
-
-    def compute(self, x, y_max):
-        if AcquisitionFunctions.is_ucb(self.acquisition_function):
-            return self._compute_ucb(x=x)
-        if AcquisitionFunctions.is_ei(self.acquisition_function):
-            return self._compute_ei(x=x, y_max=y_max)
-        if AcquisitionFunctions.is_poi(self.acquisition_function):
-            return self._compute_poi(x=x, y_max=y_max)
-
-    def max_compute(self, y_max, bounds, n_warmup=100000, n_iter=250):
+    def get_acquisition(self):
+        return self.acquisition_function, self.kappa, self.eps
+
+    def compute(self, x, y_max, gaussian_process=None):
+        return compute_acquisition(acquisition=self.get_acquisition(),
+                                   x=x,
+                                   y_max=y_max,
+                                   gaussian_process=gaussian_process or self.gaussian_process)
+
+    def _warmup(self, y_max, bounds, n_warmup, gaussian_process):
+        """Evaluate the acquisition function on random points in vectorized chunks."""
+        x_max = None
+        max_acq = None
+        for start in range(0, n_warmup, self.WARMUP_CHUNK_SIZE):
+            size = min(self.WARMUP_CHUNK_SIZE, n_warmup - start)
+            x_tries = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
+                                                    size=(size, bounds.shape[0]))
+            ys = self.compute(x_tries, y_max=y_max, gaussian_process=gaussian_process)
+            index = ys.argmax()
+            if max_acq is None or ys[index] > max_acq:
+                x_max = x_tries[index]
+                max_acq = ys[index]
+        return x_max, max_acq
+
+    def _minimize_seeds(self, x_seeds, y_max, bounds, gaussian_process, pool):
+        acquisition = self.get_acquisition()
+        if (pool is not None and len(x_seeds) > 1 and
+                isinstance(gaussian_process, GaussianProcessSurrogate)):
+            # Only plain values are sent to the workers, the regressor holds
+            # the global numpy random module when the group is not seeded
+            model = gaussian_process.get_state()
+            return pool.map(_minimize_seed,
+                            [(acquisition, model, x_try, y_max, bounds) for x_try in x_seeds])
+        gaussian_process = gaussian_process or self.gaussian_process
+        return [minimize_acquisition(acquisition=acquisition,
+                                     x_try=x_try,
+                                     y_max=y_max,
+                                     bounds=bounds,
+                                     gaussian_process=gaussian_process) for x_try in x_seeds]
+
+    def max_compute(self,
+                    y_max,
+                    bounds,
+                    n_warmup=100000,
+                    n_iter=250,
+                    gaussian_process=None,
+                    pool=None):
         """A function to find the maximum of the acquisition function
 
         It uses a combination of random sampling (cheap) and the 'L-BFGS-B' optimization method.
@@ -80,36 +113,97 @@ class UtilityFunction(object):
             bounds: The variables bounds to limit the search of the acq max.
             n_warmup: The number of times to randomly sample the acquisition function
             n_iter: The number of times to run scipy.minimize
+            gaussian_process: The fitted model to use, defaults to the utility's regressor.
+            pool: The pool of processes to use for running scipy.minimize, see `get_process_pool`.
 
         Returns
             x_max: The arg max of the acquisition function.
         """
         # Warm up with random points
-        x_tries = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
-                                                size=(n_warmup, bounds.shape[0]))
-        ys = self.compute(x_tries, y_max=y_max)
-        x_max = x_tries[ys.argmax()]
-        max_acq = ys.max()
+        x_max, max_acq = self._warmup(y_max=y_max,
+                                      bounds=bounds,
+                                      n_warmup=n_warmup,
+                                      gaussian_process=gaussian_process)
 
         # Explore the parameter space more throughly
         x_seeds = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
                                                 size=(n_iter, bounds.shape[0]))
-        for x_try in x_seeds:
-            # Find the minimum of minus the acquisition function
-            res = minimize(lambda x: -self.compute(x.reshape(1, -1), y_max=y_max),
-                           x_try.reshape(1, -1),
-                           bounds=bounds,
-                           method="L-BFGS-B")
-
-            # See if success
-            if not res.success:
+        results = self._minimize_seeds(x_seeds=x_seeds,
+                                       y_max=y_max,
+                                       bounds=bounds,
+                                       gaussian_process=gaussian_process,
+                                       pool=pool)
+        for result in results:
+            if result is None:
                 continue
 
             # Store it if better than previous minimum(maximum).
-            if max_acq is None or -res.fun[0] >= max_acq:
-                x_max = res.x
-                max_acq = -res.fun[0]
+            x_try, acq = result
+            if max_acq is None or acq >= max_acq:
+                x_max = x_try
+                max_acq = acq
 
         # Clip output to make sure it lies within the bounds. Due to floating
         # point technicalities this is not always the case.
         return np.clip(x_max, bounds[:, 0], bounds[:, 1])
+
+
+def compute_acquisition(acquisition, x, y_max, gaussian_process):
+    """Compute the acquisition function `(name, kappa, eps)` on the points `x`."""
+    acquisition_function, kappa, eps = acquisition
+    mean, std = gaussian_process.predict(x, return_std=True)
+    if AcquisitionFunctions.is_ucb(acquisition_function):
+        return mean + kappa * std
+    z = (mean - y_max - eps) / std
+    if AcquisitionFunctions.is_ei(acquisition_function):
+        return (mean - y_max - eps) * norm.cdf(z) + std * norm.pdf(z)
+    if AcquisitionFunctions.is_poi(acquisition_function):
+        return norm.cdf(z)
+
+
+def minimize_acquisition(acquisition, x_try, y_max, bounds, gaussian_process):
+    """Run L-BFGS-B from `x_try`, returns the local arg max and its value, or None."""
+    # Find the minimum of minus the acquisition function
+    res = minimize(lambda x: -compute_acquisition(acquisition=acquisition,
+                                                  x=x.reshape(1, -1),
+                                                  y_max=y_max,
+                                                  gaussian_process=gaussian_process),
+                   x_try.reshape(1, -1),
+                   bounds=bounds,
+                   method="L-BFGS-B")
+
+    # See if success
+    if not res.success:
+        return None
+    return res.x, -np.ravel(res.fun)[0]
+
+
+def _minimize_seed(args):
+    acquisition, model, x_try, y_max, bounds = args
+    return minimize_acquisition(acquisition=acquisition,
+                                x_try=x_try,
+                                y_max=y_max,
+                                bounds=bounds,
+                                gaussian_process=GaussianProcessSurrogate.from_state(model))
+
+
+@contextmanager
+def get_process_pool(n_jobs):
+    """Yield a pool of `n_jobs` processes to run the acquisition restarts, or None.
+
+    The processes of billiard, unlike the ones of multiprocessing,
+    can be started from the daemonic processes of the celery workers.
+    """
+    pool = None
+    if n_jobs and n_jobs > 1:
+        try:
+            pool = Pool(processes=n_jobs)
+        except OSError as e:
+            _logger.warning('Could not start a process pool for the acquisition restarts, '
+                            'falling back to a sequential optimization: %s', e)
+    try:
+        yield pool
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
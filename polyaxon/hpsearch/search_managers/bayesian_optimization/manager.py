@@ -1,6 +1,9 @@
+import conf
+
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
 from hpsearch.search_managers.utils import get_random_suggestions
+from options.registry.groups import GROUPS_BO_PROCESSES
 from schemas import SearchAlgorithms
 
 
@@ -13,28 +16,41 @@ class BOSearchManager(BaseSearchAlgorithmManager):
         super().__init__(hptuning_config=hptuning_config)
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.n_iterations = self.hptuning_config.bo.n_iterations
+        # The surrogate state to persist on the next iteration, set after making suggestions
+        self.surrogate_state = None
 
     def get_suggestions(self, iteration_config=None):
         if not iteration_config:
             return get_random_suggestions(matrix=self.hptuning_config.matrix,
                                           n_suggestions=self.n_initial_trials,
                                           seed=self.hptuning_config.seed)
-        # Use the iteration_config to construct observed point and metrics
+        optimizer = BOOptimizer(hptuning_config=self.hptuning_config,
+                                surrogate_state=iteration_config.surrogate_state)
+        observed_ids = set(optimizer.observation_ids)
+        # Use the iteration_config to construct the new observed points and metrics,
+        # the points already observed are part of the surrogate state
         experiments_configs = dict(iteration_config.combined_experiments_configs)
         experiments_metrics = dict(iteration_config.combined_experiments_metrics)
+        observation_ids = []
         configs = []
         metrics = []
         for key in experiments_metrics.keys():
-            if key in experiments_configs:
+            if key in experiments_configs and key not in observed_ids:
+                observation_ids.append(key)
                 configs.append(experiments_configs[key])
                 metrics.append(experiments_metrics[key])
 
-        if not configs or not metrics:
+        if not observed_ids and (not configs or not metrics):
             return None
-        optimizer = BOOptimizer(hptuning_config=self.hptuning_config)
-        optimizer.add_observations(configs=configs, metrics=metrics)
-        suggestion = optimizer.get_suggestion()
-        return [suggestion] if suggestion else None
+        if configs:
+            optimizer.add_observations(configs=configs,
+                                       metrics=metrics,
+                                       observation_ids=observation_ids)
+        # Propose as many points as the group can run concurrently
+        suggestions = optimizer.get_suggestions(n_suggestions=self.hptuning_config.concurrency or 1,
+                                                n_jobs=conf.get(GROUPS_BO_PROCESSES))
+        self.surrogate_state = optimizer.get_surrogate_state()
+        return suggestions or None
 
     def should_reschedule(self, iteration):
         """Return a boolean to indicate if we need to reschedule another iteration."""
@@ -1,10 +1,18 @@
-from hpsearch.search_managers.bayesian_optimization.acquisition_function import UtilityFunction
+import numpy as np
+
+from scipy.linalg import LinAlgError
+
+from hpsearch.search_managers.bayesian_optimization.acquisition_function import (
+    UtilityFunction,
+    get_process_pool
+)
 from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
+from hpsearch.search_managers.bayesian_optimization.surrogate import GaussianProcessSurrogate
 
 
 class BOOptimizer(object):
 
-    def __init__(self, hptuning_config):
+    def __init__(self, hptuning_config, surrogate_state=None):
         self.hptuning_config = hptuning_config
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.space = SearchSpace(hptuning_config=hptuning_config)
@@ -12,22 +20,66 @@ class BOOptimizer(object):
             config=hptuning_config.bo.utility_function, seed=hptuning_config.seed)
         self.n_warmup = hptuning_config.bo.utility_function.n_warmup or 5
         self.n_iter = hptuning_config.bo.utility_function.n_iter or 10
+        surrogate_state = surrogate_state or {}
+        self.observation_ids = list(surrogate_state.get('observation_ids') or [])
+        self.surrogate = GaussianProcessSurrogate.from_dict(
+            gaussian_process=self.utility_function.gaussian_process,
+            data=surrogate_state.get('gaussian_process'))
 
-    def _maximize(self):
+    def _maximize(self, surrogate=None, pool=None):
         """ Find argmax of the acquisition function."""
-        if not self.space.is_observations_valid():
+        surrogate = surrogate or self.surrogate
+        if surrogate.n_observations == 0:
             return None
-        y_max = self.space.y.max()
-        self.utility_function.gaussian_process.fit(self.space.x, self.space.y)
+        y_max = surrogate.y.max()
         return self.utility_function.max_compute(y_max=y_max,
                                                  bounds=self.space.bounds,
                                                  n_warmup=self.n_warmup,
-                                                 n_iter=self.n_iter)
+                                                 n_iter=self.n_iter,
+                                                 gaussian_process=surrogate,
+                                                 pool=pool)
 
-    def add_observations(self, configs, metrics):
+    def add_observations(self, configs, metrics, observation_ids=None):
         # Turn configs and metrics into data points
         self.space.add_observations(configs=configs, metrics=metrics)
+        if not self.space.is_observations_valid():
+            return
+        self.surrogate.update(np.asarray(self.space.x), np.asarray(self.space.y))
+        self.observation_ids += list(observation_ids or [])
 
-    def get_suggestion(self):
-        x = self._maximize()
+    def get_surrogate_state(self):
+        return {
+            'observation_ids': self.observation_ids,
+            'gaussian_process': self.surrogate.to_dict(),
+        }
+
+    def get_suggestion(self, n_jobs=1):
+        with get_process_pool(n_jobs=n_jobs) as pool:
+            x = self._maximize(pool=pool)
         return self.space.get_suggestion(x)
+
+    def get_suggestions(self, n_suggestions, n_jobs=1):
+        """Propose a batch of `n_suggestions` points using the constant liar heuristic.
+
+        After each proposal, a fantasy observation with the worst observed value
+        is added to a copy of the surrogate, which pushes the next proposals away from
+        the points already selected in the batch.
+        The same process pool is used for all the proposals.
+        """
+        if self.surrogate.n_observations == 0:
+            return []
+        surrogate = self.surrogate.copy()
+        lie = self.surrogate.y.min()
+        suggestions = []
+        with get_process_pool(n_jobs=n_jobs) as pool:
+            for _ in range(n_suggestions):
+                x = self._maximize(surrogate=surrogate, pool=pool)
+                suggestion = self.space.get_suggestion(x)
+                if suggestion and suggestion not in suggestions:
+                    suggestions.append(suggestion)
+                try:
+                    surrogate.update(np.asarray([x]), np.asarray([lie]), refit=False)
+                except LinAlgError:
+                    # The fantasy collapsed on an existing point, no more diversity to gain
+                    break
+        return suggestions
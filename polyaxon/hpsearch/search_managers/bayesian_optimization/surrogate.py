@@ -0,0 +1,163 @@
+import copy
+import numpy as np
+
+from scipy.linalg import LinAlgError, cho_solve, cholesky, solve_triangular
+
+
+class GaussianProcessSurrogate(object):
+    """A gaussian process surrogate that can be updated incrementally.
+
+    The kernel hyperparams are only optimized (full O(n^3) fit) when the number of observations
+    doubles since the last fit, in between, new observations extend the cached Cholesky factor
+    of the kernel matrix in O(n^2) per observation.
+
+    The surrogate exposes the same `predict` api as `GaussianProcessRegressor`,
+    and its state can be serialized to be stored on the experiment group's iteration,
+    the factor is stored as its packed lower triangle, so that loading the state
+    and extending it with the new observations does not refactorize the kernel matrix.
+    """
+
+    REFIT_RATIO = 2
+
+    def __init__(self, gaussian_process):
+        self.gaussian_process = gaussian_process
+        self.kernel = None
+        self.x = None
+        self.y = None
+        self.cholesky = None
+        self.dual_coef = None
+        self.n_fitted = 0
+
+    @property
+    def n_observations(self):
+        return 0 if self.x is None else len(self.x)
+
+    @property
+    def noise(self):
+        return self.gaussian_process.alpha
+
+    def _compute_dual_coef(self):
+        self.dual_coef = cho_solve((self.cholesky, True), self.y)
+
+    def _factorize(self):
+        k = self.kernel(self.x)
+        k[np.diag_indices_from(k)] += self.noise
+        self.cholesky = cholesky(k, lower=True)
+        self._compute_dual_coef()
+
+    def fit(self, x, y):
+        """Optimize the kernel hyperparams and factorize the kernel matrix."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.gaussian_process.fit(x, y)
+        self.kernel = self.gaussian_process.kernel_
+        self.x = x
+        self.y = y
+        self._factorize()
+        self.n_fitted = len(x)
+
+    def _extend_cholesky(self, x):
+        k_cross = self.kernel(self.x, x)
+        k_new = self.kernel(x)
+        k_new[np.diag_indices_from(k_new)] += self.noise
+        l_cross = solve_triangular(self.cholesky, k_cross, lower=True).T
+        l_new = cholesky(k_new - l_cross.dot(l_cross.T), lower=True)
+        n, m = self.cholesky.shape[0], l_new.shape[0]
+        factor = np.zeros((n + m, n + m))
+        factor[:n, :n] = self.cholesky
+        factor[n:, :n] = l_cross
+        factor[n:, n:] = l_new
+        return factor
+
+    def copy(self):
+        """Return a copy sharing the (immutable) arrays, used to add fantasy observations."""
+        return copy.copy(self)
+
+    def update(self, x, y, refit=True):
+        """Add new observations to the surrogate.
+
+        If `refit` is False, the kernel hyperparams are kept even if they are stale,
+        and a `LinAlgError` is raised if the kernel matrix can not be extended.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if not len(x):
+            return
+        if self.cholesky is None:
+            self.fit(x, y)
+            return
+
+        all_x = np.vstack([self.x, x])
+        all_y = np.concatenate([self.y, y])
+        if refit and len(all_x) >= self.REFIT_RATIO * self.n_fitted:
+            self.fit(all_x, all_y)
+            return
+
+        try:
+            factor = self._extend_cholesky(x)
+        except (LinAlgError, ValueError):
+            # The extended kernel matrix is not numerically positive definite
+            if not refit:
+                raise LinAlgError('The kernel matrix could not be extended.')
+            self.fit(all_x, all_y)
+            return
+        self.x = all_x
+        self.y = all_y
+        self.cholesky = factor
+        self._compute_dual_coef()
+
+    def predict(self, x, return_std=False):
+        k_trans = self.kernel(x, self.x)
+        mean = k_trans.dot(self.dual_coef)
+        if not return_std:
+            return mean
+
+        v = solve_triangular(self.cholesky, k_trans.T, lower=True)
+        variance = self.kernel.diag(x) - np.einsum('ij,ij->j', v, v)
+        variance[variance < 0] = 0.
+        return mean, np.sqrt(variance)
+
+    def get_state(self):
+        """Return the fitted posterior, only made of picklable values, to predict in workers."""
+        return {
+            'kernel': self.kernel,
+            'x': self.x,
+            'cholesky': self.cholesky,
+            'dual_coef': self.dual_coef,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Restore a surrogate that can only `predict` from the state of `get_state`."""
+        surrogate = cls(gaussian_process=None)
+        surrogate.kernel = state['kernel']
+        surrogate.x = state['x']
+        surrogate.cholesky = state['cholesky']
+        surrogate.dual_coef = state['dual_coef']
+        return surrogate
+
+    def to_dict(self):
+        if self.cholesky is None:
+            return None
+        return {
+            'theta': self.kernel.theta.tolist(),
+            'x': self.x.tolist(),
+            'y': self.y.tolist(),
+            'cholesky': self.cholesky[np.tril_indices(self.n_observations)].tolist(),
+            'n_fitted': self.n_fitted,
+        }
+
+    @classmethod
+    def from_dict(cls, gaussian_process, data):
+        surrogate = cls(gaussian_process=gaussian_process)
+        if not data:
+            return surrogate
+        surrogate.kernel = gaussian_process.kernel.clone_with_theta(np.asarray(data['theta']))
+        surrogate.x = np.asarray(data['x'], dtype=float)
+        surrogate.y = np.asarray(data['y'], dtype=float)
+        n = len(surrogate.x)
+        surrogate.cholesky = np.zeros((n, n))
+        surrogate.cholesky[np.tril_indices(n)] = data['cholesky']
+        surrogate.n_fitted = data['n_fitted']
+        surrogate._compute_dual_coef()  # pylint:disable=protected-access
+        return surrogate
@@ -1,14 +1,100 @@
 import itertools
 
+from functools import reduce
+from operator import mul
+
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from schemas import SearchAlgorithms
 
 
+class GridSpace(object):
+    """A lazy view over the cartesian product of a matrix.
+
+    The combinations are never materialized, every suggestion is computed
+    from its position in the grid using a mixed-radix decomposition of the index,
+    the last key of the matrix being the fastest changing one (same order as `itertools.product`).
+    """
+
+    def __init__(self, matrix):
+        self.keys = list(matrix.keys())
+        self.values = [v.to_numpy() for v in matrix.values()]
+        self.radices = [len(v) for v in self.values]
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def size(self):
+        if not self.radices:
+            return 0
+        return reduce(mul, self.radices)
+
+    def get_suggestion(self, index):
+        """Return the suggestion at position `index` of the grid."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Grid index `{}` is out of range.'.format(index))
+
+        suggestion = {}
+        for key, values, radix in zip(reversed(self.keys),
+                                      reversed(self.values),
+                                      reversed(self.radices)):
+            index, position = divmod(index, radix)
+            suggestion[key] = values[position]
+        return {key: suggestion[key] for key in self.keys}
+
+    def iter_suggestions(self, offset=0, limit=None):
+        """Stream the suggestions of the grid starting from `offset`."""
+        if offset == 0:
+            # Fast path, product is lazy and avoids the index decomposition
+            suggestions = (dict(zip(self.keys, v)) for v in itertools.product(*self.values))
+            return itertools.islice(suggestions, limit)
+
+        stop = self.size if limit is None else min(self.size, offset + limit)
+        return (self.get_suggestion(index) for index in range(offset, stop))
+
+    def get_page(self, page, page_size):
+        """Return the suggestions of the `page`-th page of size `page_size`."""
+        return list(self.iter_suggestions(offset=page * page_size, limit=page_size))
+
+
 class GridSearchManager(BaseSearchAlgorithmManager):
     """Grid search algorithm manager for hyperparameter optimization."""
 
     NAME = SearchAlgorithms.GRID
 
+    def __init__(self, hptuning_config):
+        super().__init__(hptuning_config=hptuning_config)
+        self._space = None
+
+    def get_space(self):
+        if self._space is None:
+            self._space = GridSpace(matrix=self.hptuning_config.matrix)
+        return self._space
+
+    def get_n_suggestions(self):
+        """Return the number of suggestions without enumerating the grid."""
+        size = self.get_space().size
+        n_suggestions = self._get_n_experiments()
+        return min(size, n_suggestions) if n_suggestions else size
+
+    def _get_n_experiments(self):
+        if self.hptuning_config.grid_search:
+            return self.hptuning_config.grid_search.n_experiments
+        return None
+
+    def iter_suggestions(self, offset=0, limit=None):
+        """Stream the suggestions, bounded by `grid_search.n_experiments` if set."""
+        space = self.get_space()
+        n_suggestions = self._get_n_experiments()
+        if n_suggestions:
+            if offset >= n_suggestions:
+                return iter([])
+            limit = n_suggestions - offset if limit is None else min(limit,
+                                                                      n_suggestions - offset)
+        return space.iter_suggestions(offset=offset, limit=limit)
+
     def get_suggestions(self, iteration_config=None):
         """Return a list of suggestions based on grid search.
 
@@ -16,16 +102,4 @@ class GridSearchManager(BaseSearchAlgorithmManager):
             matrix: `dict` representing the {hyperparam: hyperparam matrix config}.
             n_suggestions: number of suggestions to make.
         """
-        matrix = self.hptuning_config.matrix
-
-        suggestions = []
-        keys = list(matrix.keys())
-        values = [v.to_numpy() for v in matrix.values()]
-        for v in itertools.product(*values):
-            suggestions.append(dict(zip(keys, v)))
-
-        if self.hptuning_config.grid_search:
-            n_suggestions = self.hptuning_config.grid_search.n_experiments
-            if n_suggestions:
-                return suggestions[:n_suggestions]
-        return suggestions
+        return list(self.iter_suggestions())
@@ -1,10 +1,12 @@
-import copy
 import numpy as np
 import uuid
 
 from functools import reduce
 from operator import mul
 
+# Above this ratio of the discrete space, suggestions are drawn without replacement
+WITHOUT_REPLACEMENT_RATIO = 0.5
+
 
 class Suggestion(object):
     """A structure that defines an experiment hyperparam suggestion."""
@@ -38,27 +40,77 @@ def get_random_generator(seed=None):
     return np.random.RandomState(seed) if seed else np.random
 
 
+def get_space_size(matrix):
+    """Return the size of the matrix if all its values are discrete, `None` otherwise."""
+    if any(v.is_continuous for v in matrix.values()):
+        return None
+    return reduce(mul, [v.length for v in matrix.values()])
+
+
+def sample_values(matrix_config, size, rand_generator):
+    """Draw `size` values of a hyperparam.
+
+    Values that are lists themselves, e.g. `values: [[64, 32], [128, 64]]`,
+    can not be drawn by `choice`, they are drawn by index instead.
+    """
+    values = matrix_config.values
+    if values and any(isinstance(value, (list, tuple)) for value in values):
+        indices = rand_generator.randint(0, len(values), size=size)
+        return [values[index] for index in indices]
+
+    values = matrix_config.sample(size=size, rand_generator=rand_generator)
+    if size == 1:
+        # A single draw returns the value itself
+        return [values]
+    return list(values)
+
+
+def sample_suggestions_batch(matrix, size, rand_generator):
+    """Draw `size` values for every hyperparam of the matrix at once."""
+    keys = list(matrix.keys())
+    columns = [sample_values(matrix_config=matrix[key], size=size, rand_generator=rand_generator)
+               for key in keys]
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def get_grid_random_suggestions(matrix, n_suggestions, rand_generator):
+    """Sample without replacement from the enumerated discrete space."""
+    from hpsearch.search_managers.grid import GridSpace
+
+    space = GridSpace(matrix=matrix)
+    indices = rand_generator.choice(space.size, size=n_suggestions, replace=False)
+    return [space.get_suggestion(int(index)) for index in indices]
+
+
 def get_random_suggestions(matrix, n_suggestions, suggestion_params=None, seed=None):
     if not n_suggestions:
         raise ValueError('This search algorithm requires `n_experiments`.')
-    suggestions = []
     suggestion_params = suggestion_params or {}
     rand_generator = get_random_generator(seed=seed)
     # Validate number of suggestions and total space
-    all_discrete = True
-    for v in matrix.values():
-        if v.is_continuous:
-            all_discrete = False
-            break
-    if all_discrete:
-        space = reduce(mul, [v.length for v in matrix.values()])
+    space = get_space_size(matrix)
+    if space is not None:
         n_suggestions = n_suggestions if n_suggestions <= space else space
+        # The grid can not enumerate distributions, e.g. `pvalues`, nor apply their weights
+        with_distributions = any(v.is_distribution for v in matrix.values())
+        if not with_distributions and n_suggestions >= space * WITHOUT_REPLACEMENT_RATIO:
+            # Rejection sampling would livelock close to the exhaustion of the space
+            suggestions = get_grid_random_suggestions(matrix=matrix,
+                                                      n_suggestions=n_suggestions,
+                                                      rand_generator=rand_generator)
+            return [dict(suggestion_params, **suggestion) for suggestion in suggestions]
 
-    while n_suggestions > 0:
-        params = copy.deepcopy(suggestion_params)
-        params.update({k: v.sample(rand_generator=rand_generator) for k, v in matrix.items()})
-        suggestion = Suggestion(params=params)
-        if suggestion not in suggestions:
-            suggestions.append(suggestion)
-            n_suggestions -= 1
+    suggestions = []
+    seen = set()
+    while len(suggestions) < n_suggestions:
+        batch = sample_suggestions_batch(matrix=matrix,
+                                         size=n_suggestions - len(suggestions),
+                                         rand_generator=rand_generator)
+        for params in batch:
+            suggestion = Suggestion(params=dict(suggestion_params, **params))
+            if suggestion not in seen:
+                seen.add(suggestion)
+                suggestions.append(suggestion)
+                if len(suggestions) == n_suggestions:
+                    break
     return [suggestion.params for suggestion in suggestions]
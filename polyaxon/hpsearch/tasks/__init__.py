@@ -8,7 +8,7 @@ from events.registry.experiment_group import (
     EXPERIMENT_GROUP_HYPERBAND,
     EXPERIMENT_GROUP_RANDOM
 )
-from hpsearch.tasks import bo, grid, health, hyperband, random  # noqa
+from hpsearch.tasks import asha, bo, grid, health, hyperband, random  # noqa
 from polyaxon.settings import HPCeleryTasks, Intervals
 from schemas import SearchAlgorithms
 
@@ -33,6 +33,10 @@ def create(experiment_group):
         auditor.record(event_type=EXPERIMENT_GROUP_RANDOM,
                        instance=experiment_group)
         return random.create(experiment_group=experiment_group)
+    elif experiment_group.is_asha:
+        auditor.record(event_type=EXPERIMENT_GROUP_HYPERBAND,
+                       instance=experiment_group)
+        return asha.create(experiment_group=experiment_group)
     elif SearchAlgorithms.is_hyperband(experiment_group.search_algorithm):
         auditor.record(event_type=EXPERIMENT_GROUP_HYPERBAND,
                        instance=experiment_group)
@@ -59,6 +63,8 @@ def start(experiment_group):
         task = HPCeleryTasks.HP_GRID_SEARCH_START
     elif SearchAlgorithms.is_random(experiment_group.search_algorithm):
         task = HPCeleryTasks.HP_RANDOM_SEARCH_START
+    elif experiment_group.is_asha:
+        task = HPCeleryTasks.HP_ASHA_START
     elif SearchAlgorithms.is_hyperband(experiment_group.search_algorithm):
         task = HPCeleryTasks.HP_HYPERBAND_START
     elif SearchAlgorithms.is_bo(experiment_group.search_algorithm):
@@ -0,0 +1,132 @@
+import conf
+import workers
+
+from db.getters.experiment_groups import get_running_experiment_group
+from hpsearch.exceptions import ExperimentGroupException
+from hpsearch.tasks import base
+from hpsearch.tasks.logger import logger
+from lifecycles.experiment_groups import ExperimentGroupLifeCycle
+from options.registry.groups import GROUPS_CHUNKS
+from polyaxon.settings import HPCeleryTasks, Intervals
+
+
+def create_suggestions(experiment_group, n_suggestions=None):
+    """Create new configs in the bottom rung, returns the number of suggestions made."""
+    iteration_config = experiment_group.iteration_config
+    suggestions = experiment_group.search_manager.get_suggestions(
+        iteration_config=iteration_config,
+        n_suggestions=n_suggestions)
+    if not suggestions:
+        return 0
+
+    suggestions = base.sanitize_suggestions(suggestions)
+    experiment_group.iteration_manager.update_iteration_num_suggestions(
+        num_suggestions=iteration_config.num_suggestions + len(suggestions))
+
+    chunk_size = conf.get(GROUPS_CHUNKS)
+    for i in range(0, len(suggestions), chunk_size):
+        workers.send(
+            HPCeleryTasks.HP_ASHA_CREATE_EXPERIMENTS,
+            kwargs={'experiment_group_id': experiment_group.id,
+                    'suggestions': suggestions[i: i + chunk_size]})
+    return len(suggestions)
+
+
+def create(experiment_group):
+    experiment_group.iteration_manager.create_iteration()
+    if not create_suggestions(experiment_group=experiment_group):
+        logger.error('Experiment group `%s` could not create any suggestion.',
+                     experiment_group.id)
+        experiment_group.set_status(ExperimentGroupLifeCycle.FAILED,
+                                    message='Experiment group could not create new suggestions.')
+        return
+
+    workers.send(
+        HPCeleryTasks.HP_ASHA_START,
+        kwargs={'experiment_group_id': experiment_group.id, 'auto_retry': True})
+
+
+def schedule(experiment_group):
+    """Fill the free slots of the group with promotions first, and then with new configs.
+
+    Returns a boolean to indicate if the group still has work to do.
+    """
+    iteration_config = experiment_group.iteration_config
+    iteration_manager = experiment_group.iteration_manager
+    search_manager = experiment_group.search_manager
+
+    n_in_flight = iteration_config.num_suggestions_in_flight
+    n_free = (experiment_group.concurrency -
+              experiment_group.non_done_experiments.count() -
+              n_in_flight)
+    promotions = []
+    if n_free > 0:
+        promotions = search_manager.get_promotions(
+            rungs_metrics=iteration_manager.get_rungs_metrics(iteration_config=iteration_config),
+            promoted_ids=iteration_config.promoted_ids,
+            n_promotions=n_free)
+        if promotions:
+            iteration_manager.promote(iteration_config=iteration_config, promotions=promotions)
+            n_free -= len(promotions)
+
+    n_suggestions = 0
+    if n_free > 0:
+        n_suggestions = create_suggestions(experiment_group=experiment_group,
+                                           n_suggestions=n_free)
+
+    return bool(promotions or n_suggestions or n_in_flight)
+
+
+@workers.app.task(name=HPCeleryTasks.HP_ASHA_CREATE_EXPERIMENTS, ignore_result=True)
+def hp_asha_create_experiments(experiment_group_id, suggestions):
+    experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
+    if not experiment_group:
+        return
+
+    try:
+        experiments = base.create_group_experiments(experiment_group=experiment_group,
+                                                    suggestions=suggestions)
+    except ExperimentGroupException:  # The experiments will be stopped
+        return
+
+    experiment_group.iteration_manager.add_iteration_experiments(
+        experiment_ids=[xp.id for xp in experiments])
+
+
+@workers.app.task(name=HPCeleryTasks.HP_ASHA_CREATE, ignore_result=True)
+def hp_asha_create(experiment_group_id):
+    experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
+    if not experiment_group:
+        return
+
+    create(experiment_group=experiment_group)
+
+
+@workers.app.task(name=HPCeleryTasks.HP_ASHA_START,
+                  bind=True,
+                  max_retries=None,
+                  ignore_result=True)
+def hp_asha_start(self, experiment_group_id, auto_retry=False):
+    if not base.should_group_start(experiment_group_id=experiment_group_id,
+                                   task=HPCeleryTasks.HP_ASHA_START,
+                                   auto_retry=auto_retry):
+        return
+
+    experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
+    if not experiment_group:
+        return
+
+    # Promotions and new configs are scheduled as soon as an experiment is done,
+    # unless the group should stop early
+    has_work = False
+    if not experiment_group.should_stop_early():
+        has_work = schedule(experiment_group=experiment_group)
+
+    should_retry = base.start_group_experiments(experiment_group=experiment_group)
+    if should_retry or has_work or experiment_group.non_done_experiments.exists():
+        if auto_retry:
+            # Schedule another task
+            self.retry(countdown=Intervals.EXPERIMENTS_SCHEDULER)
+        return
+
+    base.check_group_experiments_done(experiment_group_id, auto_retry=auto_retry)
@@ -3,16 +3,27 @@ import traceback
 from hestia.np_utils import sanitize_np_types
 from rest_framework.exceptions import ValidationError
 
+from django.db import transaction
+
+import auditor
 import conf
 import workers
 
-from db.models.experiments import Experiment
+from db.models.experiments import Experiment, ExperimentStatus
 from db.redis.group_check import GroupChecks
+from events.registry.experiment_group import EXPERIMENT_GROUP_NEW_EXPERIMENTS
 from hpsearch.exceptions import ExperimentGroupException
 from hpsearch.tasks.logger import logger
 from lifecycles.experiment_groups import ExperimentGroupLifeCycle
+from lifecycles.experiments import ExperimentLifeCycle
 from options.registry.groups import GROUPS_CHECK_INTERVAL
 from polyaxon.settings import SchedulerCeleryTasks
+from signals.experiments import set_experiment_defaults
+
+
+def sanitize_suggestions(suggestions):
+    # We sanitize numpy types to be able to jsonify and split the scheduling of different tasks
+    return [{k: sanitize_np_types(v) for k, v in suggestion.items()} for suggestion in suggestions]
 
 
 def get_suggestions(experiment_group):
@@ -26,32 +37,65 @@ def get_suggestions(experiment_group):
                      extra={'stack': True})
         return
 
-    # We sanitize numpy types to be able to jsonify and split the scheduling of different tasks
-    return [{k: sanitize_np_types(v) for k, v in suggestion.items()} for suggestion in suggestions]
+    return sanitize_suggestions(suggestions)
+
+
+def bulk_create_group_experiments(experiment_group, experiments):
+    """Insert the group's experiments and their initial statuses in bulk.
+
+    The per instance `pre_save`/`post_save` signals are not triggered,
+    instead the specification defaults are set on each instance before the insert,
+    and a single event is recorded for all the new experiments of the group.
+    """
+    if not experiments:
+        return []
+
+    for experiment in experiments:
+        set_experiment_defaults(instance=experiment)
+
+    with transaction.atomic():
+        experiments = Experiment.objects.bulk_create(experiments)
+        statuses = ExperimentStatus.objects.bulk_create([
+            ExperimentStatus(experiment=experiment, status=ExperimentLifeCycle.CREATED)
+            for experiment in experiments
+        ])
+        for experiment, status in zip(experiments, statuses):
+            experiment.status = status
+        Experiment.objects.bulk_update(experiments, ['status'])
+
+    auditor.record(event_type=EXPERIMENT_GROUP_NEW_EXPERIMENTS,
+                   instance=experiment_group,
+                   n_experiments=len(experiments))
+    return experiments
 
 
 def create_group_experiments(experiment_group, suggestions):
     # Parse polyaxonfile content and create the experiments
     specification = experiment_group.specification
 
-    experiments = []
-    for suggestion in suggestions:
-        # We need to check if we should create or restart
-        try:
-            experiment = Experiment.objects.create(
+    try:
+        # All the specs are validated before inserting any row
+        experiments = []
+        for suggestion in suggestions:
+            experiment_spec = specification.get_experiment_spec(matrix_declaration=suggestion)
+            experiment = Experiment(
                 project_id=experiment_group.project_id,
                 user_id=experiment_group.user_id,
                 experiment_group=experiment_group,
-                content=specification.get_experiment_spec(matrix_declaration=suggestion).raw_data,
+                content=experiment_spec.raw_data,
                 code_reference_id=experiment_group.code_reference_id)
-        except ValidationError:
-            experiment_group.set_status(
-                ExperimentGroupLifeCycle.FAILED,
-                message='Experiment group could not create experiments, '
-                        'encountered a validation error.',
-                traceback=traceback.format_exc())
-            raise ExperimentGroupException()
-        experiments.append(experiment)
+            # Avoid parsing the content again
+            experiment.specification = experiment_spec
+            experiments.append(experiment)
+        experiments = bulk_create_group_experiments(experiment_group=experiment_group,
+                                                    experiments=experiments)
+    except ValidationError:
+        experiment_group.set_status(
+            ExperimentGroupLifeCycle.FAILED,
+            message='Experiment group could not create experiments, '
+                    'encountered a validation error.',
+            traceback=traceback.format_exc())
+        raise ExperimentGroupException()
 
     return experiments
 
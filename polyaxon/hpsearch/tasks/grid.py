@@ -11,32 +11,27 @@ from polyaxon.settings import HPCeleryTasks, Intervals
 
 
 def create(experiment_group):
-    suggestions = base.get_suggestions(experiment_group=experiment_group)
-    if not suggestions:
+    search_manager = experiment_group.search_manager
+    n_suggestions = search_manager.get_n_suggestions()
+    if not n_suggestions:
         logger.error('Experiment group `%s` could not create any suggestion.',
                      experiment_group.id)
         experiment_group.set_status(ExperimentGroupLifeCycle.FAILED,
                                     message='Experiment group could not create new suggestions.')
         return
 
-    experiment_group.iteration_manager.create_iteration(num_suggestions=len(suggestions))
+    experiment_group.iteration_manager.create_iteration(num_suggestions=n_suggestions)
 
-    def send_chunk():
+    # We stream the grid by chunks instead of materializing the whole matrix
+    chunk_size = conf.get(GROUPS_CHUNKS)
+    for offset in range(0, n_suggestions, chunk_size):
+        chunk_suggestions = base.sanitize_suggestions(
+            search_manager.iter_suggestions(offset=offset, limit=chunk_size))
         workers.send(
             HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS,
             kwargs={'experiment_group_id': experiment_group.id,
                     'suggestions': chunk_suggestions})
 
-    chunk_suggestions = []
-    for suggestion in suggestions:
-        chunk_suggestions.append(suggestion)
-        if len(chunk_suggestions) == conf.get(GROUPS_CHUNKS):
-            send_chunk()
-            chunk_suggestions = []
-
-    if chunk_suggestions:
-        send_chunk()
-
     workers.send(
         HPCeleryTasks.HP_GRID_SEARCH_START,
         kwargs={'experiment_group_id': experiment_group.id, 'auto_retry': True})
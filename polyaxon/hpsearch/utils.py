@@ -0,0 +1,18 @@
+import conf
+
+from options.registry.groups import GROUPS_HYPERBAND_ASYNC
+from schemas import SearchAlgorithms
+
+
+def is_asha(search_algorithm, iteration=None):
+    """Hyperband groups run asynchronous successive halving if enabled on the cluster.
+
+    The cluster option is only read when the group starts, i.e. before it has an iteration,
+    afterwards the choice is read from the `asha` flag of the group's iteration,
+    so that updating the option does not switch the algorithm of running groups.
+    """
+    if not SearchAlgorithms.is_hyperband(search_algorithm):
+        return False
+    if iteration is None:
+        return bool(conf.get(GROUPS_HYPERBAND_ASYNC))
+    return bool(iteration.get('asha'))
@@ -1,15 +1,23 @@
+import fcntl
 import os
+import shutil
 import tarfile
+import tempfile
 
-from typing import Any, List, Tuple
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
 
+from git import BadName, GitCommandError
 from hestia.paths import check_or_create_path
 from polystores.exceptions import PolyaxonStoresException
 from rest_framework.exceptions import ValidationError
 
+from django.conf import settings
+
 import conf
 import stores
 
+from logs_handlers.segments import INDEX_NAME
 from options.registry.archives import ARCHIVES_ROOT_ARTIFACTS, ARCHIVES_ROOT_REPOS
 from options.registry.downloads import DOWNLOADS_ROOT_ARTIFACTS, DOWNLOADS_ROOT_LOGS
 from stores.exceptions import VolumeNotFoundError  # pylint:disable=ungrouped-imports
@@ -30,12 +38,92 @@ def get_files_in_path(path: str) -> List[str]:
     return result_files
 
 
+def get_repo_commit(repo_git: Any, commit: str = None) -> Optional[str]:
+    """Return the hash of a commit, the last commit if None, or None if it can't be resolved."""
+    try:
+        return repo_git.commit(commit).hexsha
+    except (BadName, GitCommandError, ValueError):
+        return None
+
+
+@contextmanager
+def lock_path(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on the file `path`, it's created if it does not exist."""
+    with open(path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def evict_repo_archives(archive_root: str, max_size: int, keep: str) -> None:
+    """Delete the least recently used archives until their total size is below `max_size`."""
+    archives = []
+    for archive_name in os.listdir(archive_root):
+        if not archive_name.endswith('.tar.gz'):
+            continue
+        try:
+            stat = os.stat(os.path.join(archive_root, archive_name))
+        except OSError:
+            continue
+        archives.append((stat.st_mtime, stat.st_size, archive_name))
+
+    total_size = sum(size for _, size, _ in archives)
+    for _, size, archive_name in sorted(archives):
+        if total_size <= max_size:
+            return
+        if archive_name == keep:
+            continue
+        try:
+            os.remove(os.path.join(archive_root, archive_name))
+        except OSError:
+            pass
+        total_size -= size
+
+
 def archive_repo(repo_git: Any, repo_name: str, commit: str = None) -> Tuple[str, str]:
+    """Archive a repo, the archives are cached by commit hash.
+
+    Concurrent requests for a missing archive wait for the first one to write it,
+    and the least recently used archives are evicted to keep the cache under
+    `ARCHIVES_REPOS_MAX_SIZE`.
+    """
     archive_root = conf.get(ARCHIVES_ROOT_REPOS)
     check_or_create_path(archive_root)
-    archive_name = '{}-{}.tar.gz'.format(repo_name, commit or 'master')
-    with open(os.path.join(archive_root, archive_name), 'wb') as fp:
-        repo_git.archive(fp, format='tgz', treeish=commit)
+    commit_hash = get_repo_commit(repo_git=repo_git, commit=commit)
+    archive_name = '{}-{}.tar.gz'.format(repo_name, commit_hash or commit or 'master')
+    archive_path = os.path.join(archive_root, archive_name)
+
+    def is_cached():
+        try:
+            # Mark the archive as recently used
+            os.utime(archive_path)
+            return commit_hash is not None
+        except OSError:
+            return False
+
+    if is_cached():
+        return archive_root, archive_name
+
+    # Only the requests for the same archive wait for each other
+    with lock_path(os.path.join(archive_root, '.{}.lock'.format(archive_name))):
+        if is_cached():
+            return archive_root, archive_name
+        fd, tmp_path = tempfile.mkstemp(dir=archive_root, prefix='.{}-'.format(repo_name))
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                repo_git.archive(fp, format='tgz', treeish=commit_hash or commit)
+            os.chmod(tmp_path, settings.FILE_UPLOAD_PERMISSIONS)
+            os.rename(tmp_path, archive_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    with lock_path(os.path.join(archive_root, '.lock')):
+        evict_repo_archives(archive_root=archive_root,
+                            max_size=settings.ARCHIVES_REPOS_MAX_SIZE,
+                            keep=archive_name)
 
     return archive_root, archive_name
 
@@ -93,9 +181,14 @@ def archive_logs_file(log_path: str, namepath: str, persistence_logs: str = 'def
     check_or_create_path(download_dir)
     try:
         store_manager = stores.get_logs_store(persistence_logs=persistence_logs)
-        store_manager.download_file(log_path, download_filepath)
+        if store_manager.store.is_local_store:
+            return log_path
+        # The collected logs are stored as a directory of segments
+        store_manager.download_dir(log_path, download_filepath, use_basename=False)
+        if not os.path.exists(os.path.join(download_filepath, INDEX_NAME)):
+            # The logs collected before their segments were stored
+            shutil.rmtree(download_filepath, ignore_errors=True)
+            store_manager.download_file(log_path, download_filepath)
     except (PolyaxonStoresException, VolumeNotFoundError) as e:
         raise ValidationError(e)
-    if store_manager.store.is_local_store:
-        return log_path
     return download_filepath
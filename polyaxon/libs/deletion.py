@@ -0,0 +1,185 @@
+import threading
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Iterable, List, Set, Tuple
+
+import workers
+
+from constants.cloning_strategies import CloningStrategy
+from db.models.build_jobs import BuildJob
+from db.models.experiment_groups import ExperimentGroup
+from db.models.experiments import Experiment
+from db.models.jobs import Job
+from db.models.notebooks import NotebookJob
+from db.models.tensorboards import TensorboardJob
+from polyaxon.settings import SchedulerCeleryTasks
+from signals.bookmarks import remove_bookmarks_many
+
+# The rows are deleted by batches of this size, each batch in its own transaction
+DELETION_BATCH_SIZE = 100
+
+_state = threading.local()
+
+
+def is_bulk_deletion() -> bool:
+    return getattr(_state, 'depth', 0) > 0
+
+
+@contextmanager
+def bulk_deletion():
+    """The per instance deletion receivers are skipped in this context,
+    the caller is responsible for the storage, the bookmarks, and the events.
+    """
+    _state.depth = getattr(_state, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+
+
+def ignore_bulk_deletion(f):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if is_bulk_deletion():
+            return None
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+def delete_in_batches(queryset) -> List[int]:
+    """Delete the rows of a queryset by batches, and return their ids."""
+    ids = list(queryset.values_list('id', flat=True))
+    for i in range(0, len(ids), DELETION_BATCH_SIZE):
+        queryset.model.all.filter(id__in=ids[i:i + DELETION_BATCH_SIZE]).delete()
+    return ids
+
+
+def get_persistences(querysets: Iterable) -> Set[Tuple[str, str]]:
+    """Return the distinct (outputs, logs) persistences used by the rows of the querysets."""
+    persistences = set()
+    for queryset in querysets:
+        for persistence in queryset.values_list('persistence', flat=True).distinct():
+            instance = queryset.model(persistence=persistence)
+            persistences.add((instance.persistence_outputs, instance.persistence_logs))
+    return persistences
+
+
+def schedule_storage_deletion(instance, querysets: Iterable) -> None:
+    """Delete the storage of the runs under the subpath of their root instance.
+
+    The root's own storage is deleted by its receivers,
+    this only schedules the deletion for the other persistences used by the runs.
+    """
+    root_persistence = (instance.persistence_outputs, instance.persistence_logs)
+    for persistence_outputs, persistence_logs in get_persistences(querysets):
+        if persistence_outputs != root_persistence[0]:
+            workers.send(
+                SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
+                kwargs={
+                    'persistence': persistence_outputs,
+                    'subpath': instance.subpath,
+                })
+        if persistence_logs != root_persistence[1]:
+            workers.send(
+                SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
+                kwargs={
+                    'persistence': persistence_logs,
+                    'subpath': instance.subpath,
+                })
+
+
+def schedule_runs_storage_deletion(runs: Iterable, outputs: bool = True, logs: bool = True) -> None:
+    """Delete the storage of runs under their own subpaths, with one task per persistence."""
+    outputs_subpaths = defaultdict(list)
+    logs_subpaths = defaultdict(list)
+    for run in runs:
+        if outputs:
+            outputs_subpaths[run.persistence_outputs].append(run.subpath)
+        if logs:
+            logs_subpaths[run.persistence_logs].append(run.subpath)
+    for persistence, subpaths in outputs_subpaths.items():
+        workers.send(
+            SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
+            kwargs={
+                'persistence': persistence,
+                'subpaths': subpaths,
+            })
+    for persistence, subpaths in logs_subpaths.items():
+        workers.send(
+            SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
+            kwargs={
+                'persistence': persistence,
+                'subpaths': subpaths,
+            })
+
+
+def delete_runs(queryset, content_type: str, outputs: bool = True, logs: bool = True) -> List[int]:
+    """Delete runs by batches without their receivers, and return their ids.
+
+    The storage of the runs is deleted by one task per persistence,
+    and no deletion event is recorded.
+    """
+    if outputs or logs:
+        schedule_runs_storage_deletion(queryset.select_related('project__user'),
+                                       outputs=outputs,
+                                       logs=logs)
+    with bulk_deletion():
+        ids = delete_in_batches(queryset)
+        remove_bookmarks_many(object_ids=ids, content_type=content_type)
+    return ids
+
+
+def delete_experiment_group(experiment_group: 'ExperimentGroup') -> None:
+    """Delete a group with its experiments.
+
+    The experiments are deleted by batches without their receivers,
+    their storage is under the group's subpath,
+    and only the group's deletion event is recorded.
+    """
+    if experiment_group.is_selection:
+        experiment_group.delete()
+        return
+
+    experiments = Experiment.all.filter(experiment_group=experiment_group)
+    # The experiments resumed outside of the group are deleted with their receivers,
+    # their own storage and resumed experiments
+    clone_ids = list(Experiment.all.filter(
+        original_experiment__in=experiments,
+        cloning_strategy=CloningStrategy.RESUME).exclude(
+        experiment_group=experiment_group).values_list('id', flat=True))
+    schedule_storage_deletion(experiment_group, [experiments])
+    with bulk_deletion():
+        remove_bookmarks_many(object_ids=delete_in_batches(experiments),
+                              content_type='experiment')
+    for experiment in Experiment.all.filter(id__in=clone_ids):
+        experiment.delete()
+    experiment_group.delete()
+
+
+def delete_project(project: 'Project') -> None:
+    """Delete a project with all its runs.
+
+    The runs are deleted by batches without their receivers,
+    their storage is under the project's subpath,
+    and only the project's deletion event is recorded.
+    """
+    runs = [
+        (Experiment, 'experiment'),
+        (ExperimentGroup, 'experimentgroup'),
+        (Job, 'job'),
+        (BuildJob, 'buildjob'),
+        (NotebookJob, 'notebookjob'),
+        (TensorboardJob, 'tensorboardjob'),
+    ]
+    schedule_storage_deletion(project, [Experiment.all.filter(project=project),
+                                        ExperimentGroup.all.filter(project=project),
+                                        Job.all.filter(project=project),
+                                        BuildJob.all.filter(project=project)])
+    with bulk_deletion():
+        for model, content_type in runs:
+            remove_bookmarks_many(object_ids=delete_in_batches(model.all.filter(project=project)),
+                                  content_type=content_type)
+    project.delete()
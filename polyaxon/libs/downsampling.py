@@ -0,0 +1,71 @@
+import numpy as np
+
+LTTB = 'lttb'
+MIN_MAX = 'minmax'
+
+
+def _get_buckets(n_points, n_buckets):
+    """Return the (start, end) indices of `n_buckets` contiguous buckets over `n_points`."""
+    edges = np.linspace(0, n_points, n_buckets + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def lttb(x, y, threshold):
+    """Largest triangle three buckets, returns the indices of the points to keep.
+
+    The first and last points are always kept, and in each bucket of the points in between,
+    the point forming the largest triangle with the previously selected point and
+    the average point of the next bucket is selected.
+    """
+    n_points = len(x)
+    if threshold >= n_points or threshold < 3:
+        return np.arange(n_points)
+
+    buckets = _get_buckets(n_points - 2, threshold - 2)
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n_points - 1
+    previous = 0
+    for i, (start, end) in enumerate(buckets):
+        # Offset by one, the first point is not part of the buckets
+        start, end = start + 1, end + 1
+        if i + 1 < len(buckets):
+            next_start, next_end = buckets[i + 1]
+            next_start, next_end = next_start + 1, next_end + 1
+        else:
+            next_start, next_end = n_points - 1, n_points
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        areas = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+    return indices
+
+
+def min_max(x, y, threshold):
+    """Keep the min and the max of `threshold / 2` buckets, returns the indices of the points."""
+    n_points = len(y)
+    if threshold >= n_points or threshold < 2:
+        return np.arange(n_points)
+
+    indices = []
+    for start, end in _get_buckets(n_points, threshold // 2):
+        bucket = y[start:end]
+        indices += sorted({start + int(np.argmin(bucket)), start + int(np.argmax(bucket))})
+    return np.asarray(indices, dtype=int)
+
+
+DOWNSAMPLING_METHODS = {
+    LTTB: lttb,
+    MIN_MAX: min_max,
+}
+
+
+def downsample(x, y, threshold, method=LTTB):
+    """Return the sorted indices of at most `threshold` points representing the series (x, y)."""
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError('`{}` is not a valid downsampling method.'.format(method))
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return DOWNSAMPLING_METHODS[method](x, y, threshold)
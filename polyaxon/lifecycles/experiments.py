@@ -147,3 +147,16 @@ class ExperimentLifeCycle(BaseStatuses):
             return cls.RUNNING
 
         return cls.UNKNOWN
+
+    @classmethod
+    def calculated_status(cls,
+                          master_status: Optional[str],
+                          job_statuses: List[str],
+                          current_status: Optional[str]) -> Optional[str]:
+        """The status of an experiment based on the status of its master job and of all its jobs."""
+        calculated_status = master_status if JobLifeCycle.is_done(master_status) else None
+        if calculated_status is None:
+            calculated_status = cls.jobs_status(job_statuses)
+        if calculated_status is None:
+            return current_status
+        return calculated_status
@@ -1,3 +1,5 @@
+import stores
+
 from db.models.build_jobs import BuildJob
 from db.models.experiment_jobs import ExperimentJob
 from db.models.experiments import Experiment
@@ -7,6 +9,27 @@ from logs_handlers.log_queries.experiment import process_experiment_jobs_logs
 from logs_handlers.log_queries.experiment import process_logs as process_experiment_logs
 from logs_handlers.log_queries.experiment_job import process_logs as process_experiment_job_logs
 from logs_handlers.log_queries.job import process_logs as process_job_logs
+from logs_handlers.segments import persist_segments
+
+
+def persist_experiment_logs(experiment_name: str) -> None:
+    persist_segments(
+        log_path=stores.get_experiment_logs_path(experiment_name=experiment_name, temp=True),
+        persisted_log_path=stores.get_experiment_logs_path(experiment_name=experiment_name,
+                                                           temp=False))
+
+
+def persist_experiment_job_logs(experiment_job_name: str) -> None:
+    persist_segments(
+        log_path=stores.get_experiment_job_logs_path(experiment_job_name=experiment_job_name,
+                                                     temp=True),
+        persisted_log_path=stores.get_experiment_job_logs_path(
+            experiment_job_name=experiment_job_name, temp=False))
+
+
+def persist_job_logs(job_name: str) -> None:
+    persist_segments(log_path=stores.get_job_logs_path(job_name=job_name, temp=True),
+                     persisted_log_path=stores.get_job_logs_path(job_name=job_name, temp=False))
 
 
 def logs_collect_experiment_jobs(experiment_uuid: str) -> None:
@@ -19,9 +42,12 @@ def logs_collect_experiment_jobs(experiment_uuid: str) -> None:
         return
 
     if experiment.jobs.count() > 1:
-        process_experiment_jobs_logs(experiment=experiment, temp=False)
+        process_experiment_jobs_logs(experiment=experiment, temp=True)
+        for experiment_job in experiment.jobs.all():
+            persist_experiment_job_logs(experiment_job_name=experiment_job.unique_name)
     else:
-        process_experiment_logs(experiment=experiment, temp=False)
+        process_experiment_logs(experiment=experiment, temp=True)
+        persist_experiment_logs(experiment_name=experiment.unique_name)
 
 
 def logs_collect_experiment_job(experiment_job_uuid: str) -> None:
@@ -33,9 +59,11 @@ def logs_collect_experiment_job(experiment_job_uuid: str) -> None:
         return
 
     if experiment.jobs.count() > 1:
-        process_experiment_job_logs(experiment_job=experiment_job, temp=False)
+        process_experiment_job_logs(experiment_job=experiment_job, temp=True)
+        persist_experiment_job_logs(experiment_job_name=experiment_job.unique_name)
     else:
-        process_experiment_logs(experiment=experiment, temp=False)
+        process_experiment_logs(experiment=experiment, temp=True)
+        persist_experiment_logs(experiment_name=experiment.unique_name)
 
 
 def logs_collect_job(job_uuid: str) -> None:
@@ -47,7 +75,8 @@ def logs_collect_job(job_uuid: str) -> None:
     if not job.is_managed:
         return
 
-    process_job_logs(job=job, temp=False)
+    process_job_logs(job=job, temp=True)
+    persist_job_logs(job_name=job.unique_name)
 
 
 def logs_collect_build_job(build_uuid: str) -> None:
@@ -59,4 +88,5 @@ def logs_collect_build_job(build_uuid: str) -> None:
     if not build.is_managed:
         return
 
-    process_build_logs(build=build, temp=False)
+    process_build_logs(build=build, temp=True)
+    persist_job_logs(job_name=build.unique_name)
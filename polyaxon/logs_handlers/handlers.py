@@ -5,12 +5,24 @@ from db.models.experiments import Experiment
 from db.models.jobs import Job
 from logs_handlers.tasks.logger import logger
 from logs_handlers.utils import safe_log_experiment, safe_log_job
+from logs_handlers.writer import log_writer
 
 
 def handle_experiment_job_log(experiment_name: str,
                               experiment_uuid: str,
                               log_lines: Optional[Union[str, Iterable[str]]],
-                              temp: bool = True) -> None:
+                              temp: bool = True,
+                              buffered: bool = False) -> None:
+    if buffered:
+        if not log_writer.run_exists(
+                run_uuid=experiment_uuid,
+                exists=Experiment.objects.filter(uuid=experiment_uuid).exists):
+            return
+        log_writer.log_experiment(experiment_name=experiment_name,
+                                  log_lines=log_lines,
+                                  temp=temp)
+        return
+
     if not Experiment.objects.filter(uuid=experiment_uuid).exists():
         return
 
@@ -24,7 +36,15 @@ def handle_experiment_job_log(experiment_name: str,
 def handle_job_logs(job_uuid: str,
                     job_name: str,
                     log_lines: Optional[Union[str, Iterable[str]]],
-                    temp: bool = True) -> None:
+                    temp: bool = True,
+                    buffered: bool = False) -> None:
+    if buffered:
+        if not log_writer.run_exists(run_uuid=job_uuid,
+                                     exists=Job.objects.filter(uuid=job_uuid).exists):
+            return
+        log_writer.log_job(job_name=job_name, log_lines=log_lines, temp=temp)
+        return
+
     if not Job.objects.filter(uuid=job_uuid).exists():
         return
 
@@ -35,7 +55,15 @@ def handle_job_logs(job_uuid: str,
 def handle_build_job_logs(job_uuid: str,
                           job_name: str,
                           log_lines: Optional[Union[str, Iterable[str]]],
-                          temp: bool = True) -> None:
+                          temp: bool = True,
+                          buffered: bool = False) -> None:
+    if buffered:
+        if not log_writer.run_exists(run_uuid=job_uuid,
+                                     exists=BuildJob.objects.filter(uuid=job_uuid).exists):
+            return
+        log_writer.log_job(job_name=job_name, log_lines=log_lines, temp=temp)
+        return
+
     if not BuildJob.objects.filter(uuid=job_uuid).exists():
         return
 
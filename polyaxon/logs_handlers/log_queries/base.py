@@ -1,21 +1,38 @@
-from typing import Any, Iterable
+import fcntl
+import os
 
+from typing import Any, Iterable, Optional, Tuple
+
+from hestia.datetime_typing import AwareDT
 from hestia.logging_utils import LogSpec
 from kubernetes.client.rest import ApiException
 
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
 from polyaxon_k8s.exceptions import PolyaxonK8SError
 
+# Margin for the clock skew between the api and the k8s nodes, the overlap is discarded
+SINCE_SECONDS_MARGIN = 5
+LAST_LINE_BLOCK_SIZE = 64 * 1024
+
 
 def query_logs(k8s_manager: 'K8SManager',
                pod_id: str,
                container_job_name: str,
-               stream: bool = False) -> Any:
+               stream: bool = False,
+               since_seconds: int = None,
+               tail_lines: int = None) -> Any:
     params = {}
     if stream:
         params = {
             'follow': True,
             '_preload_content': False
         }
+    if since_seconds:
+        params['since_seconds'] = since_seconds
+    if tail_lines:
+        params['tail_lines'] = tail_lines
 
     return k8s_manager.k8s_api.read_namespaced_pod_log(
         pod_id,
@@ -66,7 +83,9 @@ def process_logs(k8s_manager: 'K8SManager',
                  pod_id: str,
                  container_job_name: str,
                  task_type: str = None,
-                 task_idx: int = None) -> str:
+                 task_idx: int = None,
+                 since_seconds: int = None,
+                 tail_lines: int = None) -> str:
     logs = None
     retries = 0
     no_logs = True
@@ -74,7 +93,9 @@ def process_logs(k8s_manager: 'K8SManager',
         try:
             logs = query_logs(k8s_manager=k8s_manager,
                               pod_id=pod_id,
-                              container_job_name=container_job_name)
+                              container_job_name=container_job_name,
+                              since_seconds=since_seconds,
+                              tail_lines=tail_lines)
             no_logs = False
         except (PolyaxonK8SError, ApiException):
             retries += 1
@@ -89,3 +110,104 @@ def process_logs(k8s_manager: 'K8SManager',
                 process_log_line(log_line=log_line, task_type=task_type, task_idx=task_idx))
 
     return '\n'.join(log_lines)
+
+
+def get_log_timestamp(log_line: str) -> Optional[AwareDT]:
+    """Return the k8s timestamp of a log line, it can be prefixed with the replica's name."""
+    for value in log_line.split(' ', 3)[:3]:
+        try:
+            timestamp = parse_datetime(value)
+        except ValueError:
+            timestamp = None
+        if timestamp:
+            return timestamp
+    return None
+
+
+def get_last_log_line(log_path: str) -> Optional[str]:
+    try:
+        with open(log_path, 'rb') as log_file:
+            log_file.seek(0, os.SEEK_END)
+            log_file.seek(max(log_file.tell() - LAST_LINE_BLOCK_SIZE, 0))
+            log_lines = log_file.read().decode('utf-8', errors='replace').splitlines()
+    except OSError:
+        return None
+    for log_line in reversed(log_lines):
+        if log_line.strip():
+            return log_line.strip()
+    return None
+
+
+def process_new_logs(k8s_manager: 'K8SManager',
+                     pod_id: str,
+                     container_job_name: str,
+                     log_path: str,
+                     task_type: str = None,
+                     task_idx: int = None) -> Tuple[str, bool]:
+    """Return the log lines that are not yet in the local log file,
+    and whether they should be appended to the file.
+
+    Only the lines logged since the timestamp of the file's last line are requested,
+    if the file does not exist, or its last timestamp is unknown, all the logs are requested.
+    """
+    last_log_line = get_last_log_line(log_path)
+    last_timestamp = get_log_timestamp(last_log_line) if last_log_line else None
+    if not last_timestamp:
+        return process_logs(k8s_manager=k8s_manager,
+                            pod_id=pod_id,
+                            container_job_name=container_job_name,
+                            task_type=task_type,
+                            task_idx=task_idx), False
+
+    since_seconds = int((timezone.now() - last_timestamp).total_seconds()) + SINCE_SECONDS_MARGIN
+    log_lines = process_logs(k8s_manager=k8s_manager,
+                             pod_id=pod_id,
+                             container_job_name=container_job_name,
+                             task_type=task_type,
+                             task_idx=task_idx,
+                             since_seconds=max(since_seconds, 1))
+
+    new_log_lines = []
+    is_last_line_seen = False
+    for log_line in log_lines.split('\n'):
+        if not log_line:
+            continue
+        timestamp = get_log_timestamp(log_line)
+        if timestamp and timestamp < last_timestamp:
+            continue
+        if timestamp == last_timestamp and not is_last_line_seen:
+            # Lines with the same timestamp are only new after the file's last line
+            is_last_line_seen = log_line == last_log_line
+            continue
+        new_log_lines.append(log_line)
+    return '\n'.join(new_log_lines), True
+
+
+def update_logs(k8s_manager: 'K8SManager',
+                pod_id: str,
+                container_job_name: str,
+                log_path: str,
+                task_type: str = None,
+                task_idx: int = None) -> None:
+    """Append the new log lines to the local log file, or write all the logs if it has none.
+
+    The file is exclusively locked from reading its last line until the new lines are written,
+    otherwise concurrent requests could append the same lines twice.
+    The file must not be written by the sidecars' log writer, which does not read it.
+    """
+    with open(log_path, 'a') as log_file:
+        fcntl.flock(log_file, fcntl.LOCK_EX)
+        try:
+            log_lines, append = process_new_logs(k8s_manager=k8s_manager,
+                                                 pod_id=pod_id,
+                                                 container_job_name=container_job_name,
+                                                 log_path=log_path,
+                                                 task_type=task_type,
+                                                 task_idx=task_idx)
+            if not append:
+                log_file.truncate(0)
+            if log_lines:
+                log_file.write(log_lines + '\n')
+            log_file.flush()
+        finally:
+            fcntl.flock(log_file, fcntl.LOCK_UN)
@@ -1,6 +1,7 @@
 from typing import Iterable
 
 import conf
+import stores
 
 from constants.experiment_jobs import get_experiment_job_container_name
 from constants.k8s_jobs import EXPERIMENT_JOB_NAME_FORMAT
@@ -24,7 +25,7 @@ def stream_logs(experiment: 'Experiment') -> Iterable[str]:
                             container_job_name=container_job_name)
 
 
-def process_logs(experiment: 'Experiment', temp: bool = True) -> None:
+def process_logs(experiment: 'Experiment', temp: bool = True, incremental: bool = False) -> None:
     pod_id = EXPERIMENT_JOB_NAME_FORMAT.format(
         task_type=experiment.default_job_role,
         task_idx=0,
@@ -32,6 +33,17 @@ def process_logs(experiment: 'Experiment', temp: bool = True) -> None:
     k8s_manager = K8SManager(namespace=conf.get(K8S_NAMESPACE), in_cluster=True)
     container_job_name = get_experiment_job_container_name(backend=experiment.backend,
                                                            framework=experiment.framework)
+    # The sidecars' log writer appends to the mounted logs, or to the temp logs with a bucket
+    if incremental and temp and not stores.is_bucket_logs_persistence():
+        stores.create_experiment_logs_path(experiment_name=experiment.unique_name, temp=temp)
+        base.update_logs(k8s_manager=k8s_manager,
+                         pod_id=pod_id,
+                         container_job_name=container_job_name,
+                         log_path=stores.get_experiment_logs_path(
+                             experiment_name=experiment.unique_name,
+                             temp=temp))
+        return
+
     log_lines = base.process_logs(k8s_manager=k8s_manager,
                                   pod_id=pod_id,
                                   container_job_name=container_job_name)
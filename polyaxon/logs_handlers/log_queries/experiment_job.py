@@ -1,4 +1,5 @@
 import conf
+import stores
 
 from constants.experiment_jobs import get_experiment_job_container_name
 from logs_handlers.log_queries import base
@@ -9,7 +10,8 @@ from polyaxon_k8s.manager import K8SManager
 
 def process_logs(experiment_job: 'ExperimentJob',
                  temp: bool = True,
-                 k8s_manager: 'K8SManager' = None) -> None:
+                 k8s_manager: 'K8SManager' = None,
+                 incremental: bool = False) -> None:
     task_type = experiment_job.role
     task_id = experiment_job.sequence
     if not k8s_manager:
@@ -17,6 +19,19 @@ def process_logs(experiment_job: 'ExperimentJob',
     container_job_name = get_experiment_job_container_name(
         backend=experiment_job.experiment.backend,
         framework=experiment_job.experiment.framework)
+    if incremental:
+        stores.create_experiment_job_logs_path(experiment_job_name=experiment_job.unique_name,
+                                               temp=temp)
+        base.update_logs(k8s_manager=k8s_manager,
+                         pod_id=experiment_job.pod_id,
+                         container_job_name=container_job_name,
+                         log_path=stores.get_experiment_job_logs_path(
+                             experiment_job_name=experiment_job.unique_name,
+                             temp=temp),
+                         task_type=task_type,
+                         task_idx=task_id)
+        return
+
     log_lines = base.process_logs(k8s_manager=k8s_manager,
                                   pod_id=experiment_job.pod_id,
                                   container_job_name=container_job_name,
@@ -0,0 +1,211 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+from typing import Dict, Iterable, List, Optional
+
+from hestia.datetime_typing import AwareDT
+
+from django.utils.dateparse import parse_datetime
+
+import stores
+
+from logs_handlers.log_queries.base import get_log_timestamp
+
+SEGMENT_LINES = 10000
+SEGMENTS_SUFFIX = '.segments'
+INDEX_NAME = 'index.json'
+
+
+def get_segments_path(log_path: str) -> str:
+    """Return the path of the segments of a log.
+
+    The collected logs are stored as a directory of segments in place of the log file,
+    the other log files get their segments next to them.
+    """
+    if os.path.isdir(log_path):
+        return log_path
+    return log_path + SEGMENTS_SUFFIX
+
+
+def get_log_name(log_line: str) -> Optional[str]:
+    """Return the replica's name prefixing a log line, e.g. `worker.1`."""
+    if ' -- ' not in log_line:
+        return None
+    name = log_line.split(' -- ', 1)[0]
+    return name if name and ' ' not in name else None
+
+
+def filter_log_lines(log_lines: Iterable[str],
+                     since: AwareDT = None,
+                     until: AwareDT = None,
+                     name: str = None) -> Iterable[str]:
+    """Filter the lines by replica and time window, lines without timestamp are kept."""
+    for log_line in log_lines:
+        if name and get_log_name(log_line) != name:
+            continue
+        if since or until:
+            timestamp = get_log_timestamp(log_line)
+            if timestamp and since and timestamp < since:
+                continue
+            if timestamp and until and timestamp > until:
+                continue
+        yield log_line
+
+
+def write_segments(log_path: str,
+                   segment_lines: int = SEGMENT_LINES,
+                   segments_path: str = None) -> Dict:
+    """Write the lines of a log file as gzip segments with a sparse index.
+
+    The index keeps for every segment its first line number, its number of lines,
+    its time range, and the replicas logging in it.
+    The segments are written next to the log file, unless a `segments_path` is given,
+    any file or directory at this path is replaced.
+    """
+    segments_path = segments_path or log_path + SEGMENTS_SUFFIX
+    segments_dir = os.path.dirname(segments_path)
+    os.makedirs(segments_dir, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(dir=segments_dir, prefix='.segments-')
+    index = {'size': os.path.getsize(log_path), 'n_lines': 0, 'segments': []}
+
+    def write_segment(log_lines):
+        segment_name = '{:06d}.gz'.format(len(index['segments']))
+        with gzip.open(os.path.join(tmp_path, segment_name), 'wt') as segment_file:
+            segment_file.writelines(log_lines)
+        timestamps = [get_log_timestamp(log_line) for log_line in log_lines]
+        timestamps = [timestamp for timestamp in timestamps if timestamp]
+        names = {get_log_name(log_line) for log_line in log_lines}
+        index['segments'].append({
+            'name': segment_name,
+            'start': index['n_lines'],
+            'n_lines': len(log_lines),
+            'start_time': min(timestamps).isoformat() if timestamps else None,
+            'end_time': max(timestamps).isoformat() if timestamps else None,
+            'names': sorted(name for name in names if name),
+        })
+        index['n_lines'] += len(log_lines)
+
+    try:
+        log_lines = []
+        with open(log_path) as log_file:
+            for log_line in log_file:
+                log_lines.append(log_line)
+                if len(log_lines) >= segment_lines:
+                    write_segment(log_lines)
+                    log_lines = []
+        if log_lines:
+            write_segment(log_lines)
+        with open(os.path.join(tmp_path, INDEX_NAME), 'w') as index_file:
+            json.dump(index, index_file)
+        if os.path.isdir(segments_path):
+            shutil.rmtree(segments_path, ignore_errors=True)
+        elif os.path.exists(segments_path):
+            os.remove(segments_path)
+        try:
+            os.rename(tmp_path, segments_path)
+        except OSError:
+            # The segments were written concurrently
+            pass
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return index
+
+
+def get_index(log_path: str) -> Dict:
+    """Return the index of a log, the segments of a log file are (re)written
+    if they are missing or stale.
+    """
+    if os.path.isdir(log_path):
+        with open(os.path.join(log_path, INDEX_NAME)) as index_file:
+            return json.load(index_file)
+
+    try:
+        with open(os.path.join(get_segments_path(log_path), INDEX_NAME)) as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        index = None
+    if not index or index.get('size') != os.path.getsize(log_path):
+        index = write_segments(log_path)
+    return index
+
+
+def persist_segments(log_path: str, persisted_log_path: str) -> None:
+    """Store the collected logs of a run as segments, the plain log file is dropped.
+
+    The segments are written at the persisted log path on a mounted path,
+    or uploaded to this path on buckets, in place of the log file.
+    The plain logs are rebuilt from the segments when they are read.
+    """
+    if not os.path.exists(log_path):
+        return
+    if not stores.is_bucket_logs_persistence():
+        write_segments(log_path, segments_path=persisted_log_path)
+        os.remove(log_path)
+        return
+
+    segments_path = get_segments_path(log_path)
+    write_segments(log_path, segments_path=segments_path)
+    try:
+        store = stores.get_logs_store()
+        # The log file uploaded by the sidecars' log writer
+        store.delete(persisted_log_path)
+        store.upload_dir(segments_path, persisted_log_path, use_basename=False)
+    finally:
+        shutil.rmtree(segments_path, ignore_errors=True)
+    os.remove(log_path)
+
+
+def get_segments(index: Dict,
+                 since: AwareDT = None,
+                 until: AwareDT = None,
+                 name: str = None) -> List[Dict]:
+    segments = []
+    for segment in index['segments']:
+        if name and name not in segment['names']:
+            continue
+        end_time = parse_datetime(segment['end_time']) if segment['end_time'] else None
+        start_time = parse_datetime(segment['start_time']) if segment['start_time'] else None
+        if since and end_time and end_time < since:
+            continue
+        if until and start_time and start_time > until:
+            continue
+        segments.append(segment)
+    return segments
+
+
+def read_segment(log_path: str, segment: Dict) -> Iterable[str]:
+    with gzip.open(os.path.join(get_segments_path(log_path), segment['name']), 'rt') as f:
+        for log_line in f:
+            yield log_line
+
+
+def read_logs(log_path: str,
+              tail: int = None,
+              since: AwareDT = None,
+              until: AwareDT = None,
+              name: str = None) -> Iterable[str]:
+    """Read the lines of a log file through its segments.
+
+    Only the segments overlapping the time window, logged by the replica,
+    or containing the last `tail` lines are decompressed.
+    """
+    segments = get_segments(get_index(log_path), since=since, until=until, name=name)
+
+    def read(segment):
+        return filter_log_lines(read_segment(log_path, segment),
+                                since=since,
+                                until=until,
+                                name=name)
+
+    if not tail:
+        return (log_line for segment in segments for log_line in read(segment))
+
+    log_lines = []
+    for segment in reversed(segments):
+        log_lines = list(read(segment)) + log_lines
+        if len(log_lines) >= tail:
+            break
+    return iter(log_lines[-tail:])
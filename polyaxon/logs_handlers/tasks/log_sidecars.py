@@ -15,7 +15,8 @@ def logs_sidecars_experiments(experiment_name: str,
     """Signal handling for sidecars logs."""
     handle_experiment_job_log(experiment_name=experiment_name,
                               experiment_uuid=experiment_uuid,
-                              log_lines=log_lines)
+                              log_lines=log_lines,
+                              buffered=True)
     publisher.publish_experiment_job_log(
         log_lines=log_lines,
         experiment_uuid=experiment_uuid,
@@ -32,7 +33,8 @@ def logs_sidecars_jobs(job_uuid: str,
     """Signal handling for sidecars logs."""
     handle_job_logs(job_uuid=job_uuid,
                     job_name=job_name,
-                    log_lines=log_lines)
+                    log_lines=log_lines,
+                    buffered=True)
     publisher.publish_job_log(
         log_lines=log_lines,
         job_uuid=job_uuid,
@@ -48,7 +50,8 @@ def logs_sidecars_builds(job_uuid: str,
     """Signal handling for sidecars logs."""
     handle_build_job_logs(job_uuid=job_uuid,
                           job_name=job_name,
-                          log_lines=log_lines)
+                          log_lines=log_lines,
+                          buffered=True)
     publisher.publish_build_job_log(
         log_lines=log_lines,
         job_uuid=job_uuid,
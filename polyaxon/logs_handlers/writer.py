@@ -0,0 +1,199 @@
+import atexit
+import fcntl
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Union
+
+from celery.signals import worker_process_shutdown
+
+from django.conf import settings
+
+import stores
+
+from logs_handlers.tasks.logger import logger
+
+
+class LogWriter(object):
+    """Appends the sidecars logs of a process through open files.
+
+    The lines appended to a file are coalesced and written at most every `flush_interval`
+    seconds under one lock, at most `max_open_files` files are kept open (LRU),
+    and the logs stored on buckets are uploaded at most every `upload_interval` seconds
+    instead of after every append.
+    """
+
+    # The existence of the runs is cached for this amount of seconds
+    RUNS_TTL = 60
+
+    def __init__(self, max_open_files: int, flush_interval: float, upload_interval: float) -> None:
+        self.max_open_files = max(max_open_files, 1)
+        self.flush_interval = flush_interval
+        self.upload_interval = upload_interval
+        self._lock = threading.RLock()
+        self._files = OrderedDict()
+        self._pending = {}
+        self._uploads = {}
+        self._runs = OrderedDict()
+        self._last_upload = time.monotonic()
+        self._timer = None
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        # The files, the pending lines and the timer are not inherited by a forked child
+        if self._pid != os.getpid():
+            self._lock = threading.RLock()
+            self._files = OrderedDict()
+            self._pending = {}
+            self._uploads = {}
+            self._timer = None
+            self._pid = os.getpid()
+
+    def run_exists(self, run_uuid: str, exists: Callable[[], bool]) -> bool:
+        """Check if a run exists, only the existing runs are cached."""
+        now = time.monotonic()
+        # The runs are ordered by expiry, the expired ones are dropped first
+        while self._runs and next(iter(self._runs.values())) <= now:
+            self._runs.popitem(last=False)
+        if run_uuid in self._runs:
+            return True
+        if not exists():
+            return False
+        self._runs[run_uuid] = now + self.RUNS_TTL
+        return True
+
+    def _get_file(self, log_path: str, create_path: Callable[[], None]):
+        log_file = self._files.pop(log_path, None)
+        if log_file is None or log_file.closed:
+            try:
+                log_file = open(log_path, 'a')
+            except OSError:
+                create_path()
+                log_file = open(log_path, 'a')
+        self._files[log_path] = log_file
+        while len(self._files) > self.max_open_files:
+            _, old_file = self._files.popitem(last=False)
+            old_file.close()
+        return log_file
+
+    def append(self,
+               log_path: str,
+               log_lines: Optional[Union[str, Iterable[str]]],
+               create_path: Callable[[], None],
+               upload: Callable[[], None] = None) -> None:
+        if not log_lines:
+            return
+        if not isinstance(log_lines, str):
+            log_lines = '\n'.join(log_lines)
+        self._check_pid()
+        with self._lock:
+            if log_path not in self._pending:
+                self._pending[log_path] = (create_path, [])
+            self._pending[log_path][1].append(log_lines + '\n')
+            if upload is not None:
+                self._uploads[log_path] = upload
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _write(self, log_path: str, create_path: Callable[[], None], log_lines: str) -> None:
+        log_file = self._get_file(log_path=log_path, create_path=create_path)
+        fcntl.flock(log_file, fcntl.LOCK_EX)
+        try:
+            log_file.write(log_lines)
+            log_file.flush()
+        finally:
+            fcntl.flock(log_file, fcntl.LOCK_UN)
+
+    def flush(self, force_upload: bool = False) -> None:
+        self._check_pid()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for log_path, (create_path, log_lines) in pending.items():
+                try:
+                    self._write(log_path=log_path,
+                                create_path=create_path,
+                                log_lines=''.join(log_lines))
+                except OSError as e:
+                    self._files.pop(log_path, None)
+                    logger.warning('Could not write the logs to `%s`: %s', log_path, e)
+
+            uploads = {}
+            should_upload = time.monotonic() - self._last_upload >= self.upload_interval
+            if self._uploads and (force_upload or should_upload):
+                uploads, self._uploads = self._uploads, {}
+                self._last_upload = time.monotonic()
+            elif self._uploads and self._timer is None:
+                # Make sure the pending uploads are done even if no lines are appended
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        for log_path, upload in uploads.items():
+            try:
+                upload()
+            except Exception as e:
+                logger.warning('Could not upload the logs of `%s`: %s', log_path, e)
+
+    def close(self) -> None:
+        self.flush(force_upload=True)
+        with self._lock:
+            while self._files:
+                _, log_file = self._files.popitem()
+                log_file.close()
+
+    def log_experiment(self,
+                       experiment_name: str,
+                       log_lines: Optional[Union[str, Iterable[str]]],
+                       temp: bool) -> None:
+        """Same as `safe_log_experiment` in append mode."""
+        is_bucket = stores.is_bucket_logs_persistence()
+        # Local logs are appended to the mounted path, bucket logs are uploaded from the temp path
+        log_path = stores.get_experiment_logs_path(experiment_name=experiment_name,
+                                                   temp=is_bucket)
+        upload = None
+        if is_bucket and not temp:
+            def upload():
+                stores.upload_experiment_logs(experiment_name=experiment_name)
+
+        def create_path():
+            stores.create_experiment_logs_path(experiment_name=experiment_name, temp=is_bucket)
+
+        self.append(log_path=log_path, log_lines=log_lines, create_path=create_path, upload=upload)
+
+    def log_job(self,
+                job_name: str,
+                log_lines: Optional[Union[str, Iterable[str]]],
+                temp: bool) -> None:
+        """Same as `safe_log_job` in append mode."""
+        is_bucket = stores.is_bucket_logs_persistence()
+        log_temp = temp or is_bucket
+        log_path = stores.get_job_logs_path(job_name=job_name, temp=log_temp)
+        upload = None
+        if is_bucket and not temp:
+            def upload():
+                stores.upload_job_logs(job_name=job_name)
+
+        def create_path():
+            stores.create_job_logs_path(job_name=job_name, temp=log_temp)
+
+        self.append(log_path=log_path, log_lines=log_lines, create_path=create_path, upload=upload)
+
+
+log_writer = LogWriter(max_open_files=settings.LOGS_WRITER_MAX_OPEN_FILES,
+                       flush_interval=settings.LOGS_WRITER_FLUSH_INTERVAL,
+                       upload_interval=settings.LOGS_WRITER_UPLOAD_INTERVAL)
+
+
+def close_log_writer(**kwargs) -> None:
+    log_writer.close()
+
+
+atexit.register(close_log_writer)
+worker_process_shutdown.connect(close_log_writer, weak=False, dispatch_uid='close_log_writer')
@@ -3,6 +3,7 @@ import logging
 import re
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Mapping, Optional
 
 import docker
@@ -21,6 +22,13 @@ from schemas import ContainerResourcesConfig
 
 logger = logging.getLogger('polyaxon.monitors.resources')
 
+# The stats of the containers are collected concurrently,
+# the default connections pool of the docker client has the same size
+STATS_WORKERS = 10
+
+# The values of the node's gpus last saved
+node_gpus_values = {}
+
 try:
     docker_client = docker.from_env(version="auto", timeout=10)
 except DockerException:
@@ -65,15 +73,15 @@ def get_container(containers: Dict, container_id: str) -> Any:
 
 def get_container_resources(node: 'ClusterNode',
                             container: Any,
-                            gpu_resources: Mapping) -> Optional['ContainerResourcesConfig']:
+                            gpu_resources: Mapping,
+                            job_uuid: str,
+                            experiment_uuid: str) -> Optional['ContainerResourcesConfig']:
     # Check if the container is running
     if container.status != ContainerStatuses.RUNNING:
         logger.debug("`%s` container is not running", container.name)
         RedisJobContainers.remove_container(container.id)
         return
 
-    job_uuid, experiment_uuid = RedisJobContainers.get_job(container.id)
-
     if not job_uuid:
         logger.debug("`%s` container is not recognised", container.name)
         return
@@ -140,19 +148,47 @@ def get_container_resources(node: 'ClusterNode',
 
 
 def update_cluster_node(node_gpus: Dict) -> None:
+    """Save the node's gpus, only the gpus with new values are saved."""
     if not node_gpus:
         return
-    node = ClusterNode.objects.filter(name=conf.get(K8S_NODE_NAME)).first()
+    node = None
     for node_gpu_index in node_gpus.keys():
         node_gpu_value = node_gpus[node_gpu_index]
-        try:
-            node_gpu = NodeGPU.objects.get(cluster_node=node, index=node_gpu_index)
-        except NodeGPU.DoesNotExist:
-            node_gpu = NodeGPU(cluster_node=node, index=node_gpu_index)
-        node_gpu.serial = node_gpu_value['serial']
-        node_gpu.name = node_gpu_value['name']
-        node_gpu.memory = node_gpu_value['memory_total']
-        node_gpu.save()
+        values = {
+            'serial': node_gpu_value['serial'],
+            'name': node_gpu_value['name'],
+            'memory': node_gpu_value['memory_total'],
+        }
+        if node_gpus_values.get(node_gpu_index) == values:
+            continue
+        if node is None:
+            node = ClusterNode.objects.filter(name=conf.get(K8S_NODE_NAME)).first()
+        NodeGPU.objects.update_or_create(cluster_node=node, index=node_gpu_index, defaults=values)
+        node_gpus_values[node_gpu_index] = values
+
+
+def get_payload(containers: Dict,
+                container_id: str,
+                node: 'ClusterNode',
+                gpu_resources: Mapping,
+                job_uuid: str,
+                experiment_uuid: str) -> Optional[Dict]:
+    # The errors are handled by container, so that the other containers are still monitored
+    try:
+        container = get_container(containers, container_id)
+        if not container:
+            return None
+        payload = get_container_resources(node=node,
+                                          container=container,
+                                          gpu_resources=gpu_resources,
+                                          job_uuid=job_uuid,
+                                          experiment_uuid=experiment_uuid)
+    except KeyError:
+        payload = None
+    except Exception as e:
+        logger.warning('Could not get the resources of the container `%s`: %s', container_id, e)
+        payload = None
+    return payload.to_dict() if payload else None
 
 
 def run(containers: Dict, node: 'ClusterNode', persist: bool) -> None:
@@ -161,28 +197,33 @@ def run(containers: Dict, node: 'ClusterNode', persist: bool) -> None:
     if gpu_resources:
         gpu_resources = {gpu_resource['index']: gpu_resource for gpu_resource in gpu_resources}
     update_cluster_node(gpu_resources)
-    for container_id in container_ids:
-        container = get_container(containers, container_id)
-        if not container:
-            continue
-        try:
-            payload = get_container_resources(node, containers[container_id], gpu_resources)
-        except KeyError:
-            payload = None
-        if payload:
-            payload = payload.to_dict()
-            # todo: Re-enable publishing
-            # logger.debug("Publishing resources event")
-            # celery_app.send_task(
-            #     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_RESOURCES,
-            #     kwargs={'payload': payload, 'persist': persist})
-
-            job_uuid = payload['job_uuid']
-            # Check if we should stream the payload
-            # Check if we have this container already in place
-            experiment_uuid = RedisJobContainers.get_experiment_for_job(job_uuid)
-            set_last_resources_cond = (
-                RedisToStream.is_monitored_job_resources(job_uuid) or
-                RedisToStream.is_monitored_experiment_resources(experiment_uuid))
-            if set_last_resources_cond:
-                RedisToStream.set_latest_job_resources(job_uuid, payload)
+    if not container_ids:
+        return
+
+    jobs = RedisJobContainers.get_jobs(container_ids)
+    monitored_jobs, monitored_experiments = RedisToStream.get_monitored_resources()
+    # The stats calls are blocking, each one waits for a new sample of the container
+    with ThreadPoolExecutor(max_workers=min(STATS_WORKERS, len(container_ids))) as executor:
+        payloads = executor.map(
+            lambda container_id: get_payload(containers=containers,
+                                             container_id=container_id,
+                                             node=node,
+                                             gpu_resources=gpu_resources,
+                                             job_uuid=jobs[container_id][0],
+                                             experiment_uuid=jobs[container_id][1]),
+            container_ids)
+        payloads = [payload for payload in payloads if payload]
+
+    # todo: Re-enable publishing
+    # logger.debug("Publishing resources event")
+    # celery_app.send_task(
+    #     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_RESOURCES,
+    #     kwargs={'payload': payload, 'persist': persist})
+
+    # Check if we should stream the payloads
+    latest_resources = {
+        payload['job_uuid']: payload for payload in payloads
+        if (payload['job_uuid'] in monitored_jobs or
+            payload.get('experiment_uuid') in monitored_experiments)
+    }
+    RedisToStream.set_latest_jobs_resources(latest_resources)
@@ -1,4 +1,9 @@
+import logging
+
+from typing import Dict, List
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 
 from actions.registry.email import EmailAction
 from constants import user_system
@@ -7,14 +12,19 @@ from events.event_service import EventService
 from notifier.managers import default_action_manager, default_event_manager
 from notifier.recipients import get_instance_and_project_recipients, get_project_recipients
 
+_logger = logging.getLogger('polyaxon.notifier')
+
 
 class NotifierService(EventService):
+    __all__ = EventService.__all__ + ('record_many',)
+
     event_manager = default_event_manager
     action_manager = default_action_manager
 
     def __init__(self):
         self.notification_event = None
         self.notification = None
+        self._batch = None
 
     @staticmethod
     def get_recipients(event: 'Event'):
@@ -25,7 +35,7 @@ class NotifierService(EventService):
     def create_notification(self, event, recipients):
         actor_id = event.data.get(event.actor_id)
         actor_id = actor_id if actor_id != user_system.USER_SYSTEM_ID else None
-        notification_event = self.notification_event.objects.create(
+        notification_event = self.notification_event(
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
             context=event.data,
@@ -33,12 +43,47 @@ class NotifierService(EventService):
             object_id=event.instance_id,
             content_type_id=event.instance_contenttype
         )
+        if self._batch is not None:
+            self._batch.append((notification_event, recipients))
+            return
 
+        notification_event.save(force_insert=True)
         self.notification.objects.bulk_create([
             self.notification(event=notification_event, user_id=recipient.id)
             for recipient in recipients
         ])
 
+    def create_notifications(self, notifications):
+        """Create the notification events and their notifications in bulk."""
+        try:
+            with transaction.atomic():
+                notification_events = self.notification_event.objects.bulk_create(
+                    [notification_event for notification_event, _ in notifications])
+                self.notification.objects.bulk_create([
+                    self.notification(event=notification_event, user_id=recipient.id)
+                    for notification_event, (_, recipients) in zip(notification_events,
+                                                                    notifications)
+                    for recipient in recipients
+                ])
+        except IntegrityError:
+            # Do not lose the batch because of one notification, e.g. its recipient was deleted
+            self._create_one_by_one(notifications)
+
+    def _create_one_by_one(self, notifications):
+        for notification_event, recipients in notifications:
+            # The ids of the rolled back bulk insert
+            notification_event.pk = None
+            try:
+                with transaction.atomic():
+                    notification_event.save(force_insert=True)
+                    self.notification.objects.bulk_create([
+                        self.notification(event=notification_event, user_id=recipient.id)
+                        for recipient in recipients
+                    ])
+            except IntegrityError:
+                _logger.warning('Could not record the notification `%s` of `%s`.',
+                                notification_event.event_type, notification_event.object_id)
+
     @staticmethod
     def validate_event_instance(event):
         from django.contrib.contenttypes.models import ContentType
@@ -76,6 +121,20 @@ class NotifierService(EventService):
             except Exception as e:
                 action.logger.warning('Action execution failed %s', e, exc_info=True)
 
+    def record_many(self, events_data: List[Dict]) -> None:
+        """Record a batch of serialized events, the notifications are created in bulk."""
+        if not self.is_setup:
+            return
+        self._batch = []
+        try:
+            for event_data in events_data:
+                self.record(event_type=event_data['type'], event_data=event_data)
+            batch = self._batch
+        finally:
+            self._batch = None
+        if batch:
+            self.create_notifications(batch)
+
     def setup(self) -> None:
         super().setup()
         # Load default event types and actions
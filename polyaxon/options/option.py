@@ -30,6 +30,7 @@ class Option(object):
     default = None
     options = None
     description = None
+    cache_ttl = None
 
     @classmethod
     def get_marker(cls) -> str:
@@ -62,6 +62,8 @@ CONTAINER_NAME = 'CONTAINER_NAME'
 CORE = 'CORE'
 CHECK_INTERVAL = 'CHECK_INTERVAL'
 CHUNKS = 'CHUNKS'
+BO_PROCESSES = 'BO_PROCESSES'
+HYPERBAND_ASYNC = 'HYPERBAND_ASYNC'
 SET_SECURITY_CONTEXT = 'SET_SECURITY_CONTEXT'
 SLEEP_INTERVAL = 'SLEEP_INTERVAL'
 GPU_RESOURCE_KEY = 'GPU_RESOURCE_KEY'
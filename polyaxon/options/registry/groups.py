@@ -10,6 +10,14 @@ GROUPS_CHUNKS = '{}{}{}'.format(option_namespaces.GROUPS,
                                 NAMESPACE_DB_OPTION_MARKER,
                                 option_subjects.CHUNKS)
 
+GROUPS_BO_PROCESSES = '{}{}{}'.format(option_namespaces.GROUPS,
+                                      NAMESPACE_DB_OPTION_MARKER,
+                                      option_subjects.BO_PROCESSES)
+
+GROUPS_HYPERBAND_ASYNC = '{}{}{}'.format(option_namespaces.GROUPS,
+                                         NAMESPACE_DB_OPTION_MARKER,
+                                         option_subjects.HYPERBAND_ASYNC)
+
 
 class GroupsCheckInterval(Option):
     key = GROUPS_CHECK_INTERVAL
@@ -36,3 +44,31 @@ class GroupsChunks(Option):
     options = None
     description = ('A variable to optimize the chunk of objects created '
                    'at a time by the experiment groups')
+
+
+class GroupsBOProcesses(Option):
+    key = GROUPS_BO_PROCESSES
+    is_global = False
+    is_secret = False
+    is_optional = True
+    is_list = False
+    typing = CONF_TYPES.INT
+    store = OptionStores.DB_OPTION
+    default = 1
+    options = None
+    description = ('Number of processes used to run the restarts of the acquisition '
+                   'function maximization in bayesian optimization')
+
+
+class GroupsHyperbandAsync(Option):
+    key = GROUPS_HYPERBAND_ASYNC
+    is_global = False
+    is_secret = False
+    is_optional = True
+    is_list = False
+    typing = CONF_TYPES.BOOL
+    store = OptionStores.DB_OPTION
+    default = False
+    options = None
+    description = ('Run hyperband groups with asynchronous successive halving (ASHA), '
+                   'this value should not be changed while hyperband groups are running')
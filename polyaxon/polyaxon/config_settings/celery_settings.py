@@ -306,6 +306,10 @@ class HPCeleryTasks(object):
     HP_BO_START = 'hp_bo_start'
     HP_BO_ITERATE = 'hp_bo_iterate'
 
+    HP_ASHA_CREATE = 'hp_asha_create'
+    HP_ASHA_CREATE_EXPERIMENTS = 'hp_asha_create_experiments'
+    HP_ASHA_START = 'hp_asha_start'
+
 
 class DockerizerCeleryTasks(object):
     BUILD_PROJECT_NOTEBOOK = 'build_project_notebook'
@@ -662,6 +666,12 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.HP},
     HPCeleryTasks.HP_BO_ITERATE:
         {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_ASHA_CREATE:
+        {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_ASHA_CREATE_EXPERIMENTS:
+        {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_ASHA_START:
+        {'queue': CeleryQueues.HP},
 
     # Events health
     EventsCeleryTasks.EVENTS_HEALTH:
@@ -13,6 +13,11 @@ FEATURES_BACKEND = config.get_string('POLYAXON_FEATURES_BACKEND', is_optional=Tr
 ARCHIVES_ROOT_REPOS = '/tmp/archived_repos'
 ARCHIVES_ROOT_ARTIFACTS = '/tmp/archived_outputs'
 ARCHIVES_ROOT_LOGS = '/tmp/archived_logs'
+# The repos archives are cached by commit, the least recently used ones are evicted
+# when their total size (in bytes) goes over this limit
+ARCHIVES_REPOS_MAX_SIZE = config.get_int('POLYAXON_ARCHIVES_REPOS_MAX_SIZE',
+                                         is_optional=True,
+                                         default=5 * 1024 ** 3)
 DOWNLOADS_ROOT_ARTIFACTS = '/tmp/download_outputs'
 DOWNLOADS_ROOT_LOGS = '/tmp/download_logs'
 FILE_UPLOAD_PERMISSIONS = 0o644
@@ -21,6 +26,14 @@ ADMIN_VIEW_ENABLED = config.get_boolean('POLYAXON_ADMIN_VIEW_ENABLED',
                                         default=False)
 # Auditor backend
 AUDITOR_BACKEND = config.get_string('POLYAXON_AUDITOR_BACKEND', is_optional=True)
+# Auditor events are sent to the handlers in batches of at most this size,
+# and the pending events are flushed at least every interval (in seconds)
+AUDITOR_EVENTS_BATCH_SIZE = config.get_int('POLYAXON_AUDITOR_EVENTS_BATCH_SIZE',
+                                           is_optional=True,
+                                           default=100)
+AUDITOR_EVENTS_BATCH_INTERVAL = config.get_int('POLYAXON_AUDITOR_EVENTS_BATCH_INTERVAL',
+                                               is_optional=True,
+                                               default=2)
 
 
 def get_allowed_hosts():
@@ -1,3 +1,16 @@
 from polyaxon.config_manager import config
 
 PERSISTENCE_LOGS = config.get_dict('POLYAXON_PERSISTENCE_LOGS')
+
+# The sidecars logs are appended through per process open files, at most this many are kept open
+LOGS_WRITER_MAX_OPEN_FILES = config.get_int('POLYAXON_LOGS_WRITER_MAX_OPEN_FILES',
+                                            is_optional=True,
+                                            default=64)
+# The appended lines are written at least every interval (in seconds),
+# and the logs stored on buckets are uploaded at least every upload interval (in seconds)
+LOGS_WRITER_FLUSH_INTERVAL = config.get_int('POLYAXON_LOGS_WRITER_FLUSH_INTERVAL',
+                                            is_optional=True,
+                                            default=1)
+LOGS_WRITER_UPLOAD_INTERVAL = config.get_int('POLYAXON_LOGS_WRITER_UPLOAD_INTERVAL',
+                                             is_optional=True,
+                                             default=30)
@@ -20,3 +20,5 @@ class RedisPools(object):
         config.get_redis_url('POLYAXON_REDIS_GROUP_CHECKS_URL'))
     STATUSES = redis.ConnectionPool.from_url(
         config.get_redis_url('POLYAXON_REDIS_STATUSES_URL'))
+    CONF_CACHE = redis.ConnectionPool.from_url(
+        config.get_redis_url('POLYAXON_REDIS_CONF_CACHE_URL'))
@@ -1,3 +1,5 @@
+import time
+
 from amqp import AMQPError
 from hestia.list_utils import to_list
 from hestia.service_interface import Service
@@ -18,8 +20,33 @@ class PublisherService(Service):
         'publish_job_log',
     )
 
+    # The ids monitored for logs are cached for this amount of seconds
+    MONITORED_LOGS_TTL = 2
+
     def __init__(self):
         self._logger = None
+        self._monitored_logs = (set(), set())
+        self._monitored_logs_expiry = 0
+
+    def _get_monitored_logs(self):
+        """Return the job and experiment ids monitored for logs.
+
+        The monitored ids are refreshed with one pipelined call every `MONITORED_LOGS_TTL`,
+        instead of checking redis for every log batch.
+        """
+        if self._monitored_logs_expiry <= time.monotonic():
+            try:
+                self._monitored_logs = tuple(RedisToStream.get_monitored_logs())
+            except RedisError:
+                self._monitored_logs = (set(), set())
+            self._monitored_logs_expiry = time.monotonic() + self.MONITORED_LOGS_TTL
+        return self._monitored_logs
+
+    def _is_monitored_job_logs(self, job_uuid):
+        return job_uuid in self._get_monitored_logs()[0]
+
+    def _is_monitored_experiment_logs(self, experiment_uuid):
+        return experiment_uuid in self._get_monitored_logs()[1]
 
     def publish_experiment_job_log(self,
                                    log_lines,
@@ -39,12 +66,8 @@ class PublisherService(Service):
                     'temp': True
                 },
                 countdown=None)
-        try:
-            should_stream = (RedisToStream.is_monitored_job_logs(job_uuid) or
-                             RedisToStream.is_monitored_experiment_logs(experiment_uuid))
-        except RedisError:
-            should_stream = False
-        if should_stream:
+        if (self._is_monitored_job_logs(job_uuid) or
+                self._is_monitored_experiment_logs(experiment_uuid)):
             self._logger.info("Streaming new log event for experiment: %s job: %s",
                               experiment_uuid,
                               job_uuid)
@@ -67,11 +90,7 @@ class PublisherService(Service):
                     pass
 
     def _stream_job_log(self, job_uuid, log_lines, routing_key):
-        try:
-            should_stream = RedisToStream.is_monitored_job_logs(job_uuid)
-        except RedisError:
-            should_stream = False
-        if should_stream:
+        if self._is_monitored_job_logs(job_uuid):
             self._logger.info("Streaming new log event for job: %s", job_uuid)
 
             with workers.app.producer_or_acquire(None) as producer:
@@ -2,15 +2,18 @@ import logging
 import traceback
 import uuid
 
+from typing import List, Optional, Tuple
+
 from kubernetes.client.rest import ApiException
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 import conf
 
-from db.models.experiment_jobs import ExperimentJob
+from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
 from db.models.job_resources import JobResources
 from lifecycles.experiments import ExperimentLifeCycle
+from lifecycles.jobs import JobLifeCycle
 from options.registry.k8s import K8S_CONFIG, K8S_NAMESPACE
 from registry.exceptions import ContainerRegistryError
 from registry.image_info import get_image_info
@@ -39,14 +42,36 @@ from stores.exceptions import VolumeNotFoundError
 _logger = logging.getLogger('polyaxon.scheduler.experiment')
 
 
-def create_job(job_uuid,
-               experiment,
-               role=None,
-               sequence=None,
-               resources=None,
-               node_selector=None,
-               affinity=None,
-               tolerations=None):
+def get_job_resources(resources) -> Optional[JobResources]:
+    job_resources = {}
+    if resources.memory:
+        _resources = resources.memory.to_dict()
+        if any(_resources.values()):
+            job_resources['memory'] = _resources
+    if resources.cpu:
+        _resources = resources.cpu.to_dict()
+        if any(_resources.values()):
+            job_resources['cpu'] = _resources
+    if resources.gpu:
+        _resources = resources.gpu.to_dict()
+        if any(_resources.values()):
+            job_resources['gpu'] = _resources
+    if resources.tpu:
+        _resources = resources.tpu.to_dict()
+        if any(_resources.values()):
+            job_resources['tpu'] = _resources
+    return JobResources(**job_resources) if job_resources else None
+
+
+def get_job(job_uuid,
+            experiment,
+            role=None,
+            sequence=None,
+            resources=None,
+            node_selector=None,
+            affinity=None,
+            tolerations=None) -> Tuple[ExperimentJob, Optional[JobResources]]:
+    """Return an unsaved job with its unsaved resources."""
     job = ExperimentJob(uuid=uuid.UUID(job_uuid), experiment=experiment, definition={})
 
     if role:
@@ -64,31 +89,63 @@ def create_job(job_uuid,
     if tolerations:
         job.tolerations = tolerations
 
-    def set_resources():
-        job_resources = {}
-        if resources.memory:
-            _resources = resources.memory.to_dict()
-            if any(_resources.values()):
-                job_resources['memory'] = _resources
-        if resources.cpu:
-            _resources = resources.cpu.to_dict()
-            if any(_resources.values()):
-                job_resources['cpu'] = _resources
-        if resources.gpu:
-            _resources = resources.gpu.to_dict()
-            if any(_resources.values()):
-                job_resources['gpu'] = _resources
-        if resources.tpu:
-            _resources = resources.tpu.to_dict()
-            if any(_resources.values()):
-                job_resources['tpu'] = _resources
-        if job_resources:
-            job.resources = JobResources.objects.create(**job_resources)
-
-    if resources:
-        set_resources()
-
-    job.save()
+    return job, get_job_resources(resources) if resources else None
+
+
+def create_jobs(jobs: List[Tuple[ExperimentJob, Optional[JobResources]]]) -> None:
+    """Insert the jobs, their resources, and their created statuses with one query each.
+
+    The per row signals are not triggered,
+    the created statuses are set here, they do not require any further check.
+    """
+    with transaction.atomic():
+        JobResources.objects.bulk_create([resources for _, resources in jobs if resources])
+        experiment_jobs = []
+        for job, resources in jobs:
+            if resources:
+                job.resources = resources
+            experiment_jobs.append(job)
+        ExperimentJob.objects.bulk_create(experiment_jobs)
+        statuses = ExperimentJobStatus.objects.bulk_create([
+            ExperimentJobStatus(job=job, status=JobLifeCycle.CREATED) for job in experiment_jobs
+        ])
+        for job, status in zip(experiment_jobs, statuses):
+            job.status = status
+        ExperimentJob.objects.bulk_update(experiment_jobs, ['status'])
+
+
+def create_job(job_uuid,
+               experiment,
+               role=None,
+               sequence=None,
+               resources=None,
+               node_selector=None,
+               affinity=None,
+               tolerations=None):
+    create_jobs([get_job(job_uuid=job_uuid,
+                         experiment=experiment,
+                         role=role,
+                         sequence=sequence,
+                         resources=resources,
+                         node_selector=node_selector,
+                         affinity=affinity,
+                         tolerations=tolerations)])
+
+
+def get_job_uuid(job_response) -> uuid.UUID:
+    return uuid.UUID(job_response['pod']['metadata']['labels']['job_uuid'])
+
+
+def set_jobs_definitions(jobs_responses) -> None:
+    """Save the definitions of the jobs created by a spawner with one bulk update."""
+    definitions = {
+        get_job_uuid(job_response): get_job_definition(job_response)
+        for job_response in jobs_responses
+    }
+    jobs = list(ExperimentJob.objects.filter(uuid__in=definitions.keys()))
+    for job in jobs:
+        job.definition = definitions[job.uuid]
+    ExperimentJob.objects.bulk_update(jobs, ['definition'])
 
 
 def set_job_definition(job_uuid, definition):
@@ -140,17 +197,18 @@ def get_spawner_class(specification):
 
 
 def create_tensorflow_experiment_jobs(experiment, spawner):
+    jobs = []
     master_job_uuid = spawner.job_uuids[TaskType.MASTER][0]
     role = TaskType.MASTER
     if experiment.backend == ExperimentBackend.KUBEFLOW:
         role = TaskType.CHIEF
-    create_job(job_uuid=master_job_uuid,
-               experiment=experiment,
-               role=role,
-               resources=spawner.spec.master_resources,
-               node_selector=spawner.spec.master_node_selector,
-               affinity=spawner.spec.master_affinity,
-               tolerations=spawner.spec.master_tolerations)
+    jobs.append(get_job(job_uuid=master_job_uuid,
+                        experiment=experiment,
+                        role=role,
+                        resources=spawner.spec.master_resources,
+                        node_selector=spawner.spec.master_node_selector,
+                        affinity=spawner.spec.master_affinity,
+                        tolerations=spawner.spec.master_tolerations))
 
     cluster, is_distributed = spawner.spec.cluster_def
     environment = spawner.spec.config.tensorflow
@@ -177,14 +235,14 @@ def create_tensorflow_experiment_jobs(experiment, spawner):
     )
 
     for i, worker_job_uuid in enumerate(spawner.job_uuids[TaskType.WORKER]):
-        create_job(job_uuid=worker_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.WORKER,
-                   sequence=i,
-                   resources=worker_resources.get(i),
-                   node_selector=worker_node_selectors.get(i),
-                   affinity=worker_affinities.get(i),
-                   tolerations=worker_tolerations.get(i))
+        jobs.append(get_job(job_uuid=worker_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.WORKER,
+                            sequence=i,
+                            resources=worker_resources.get(i),
+                            node_selector=worker_node_selectors.get(i),
+                            affinity=worker_affinities.get(i),
+                            tolerations=worker_tolerations.get(i)))
 
     ps_resources = TensorflowSpecification.get_ps_resources(
         environment=environment,
@@ -208,42 +266,33 @@ def create_tensorflow_experiment_jobs(experiment, spawner):
     )
 
     for i, ps_job_uuid in enumerate(spawner.job_uuids[TaskType.PS]):
-        create_job(job_uuid=ps_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.PS,
-                   sequence=i,
-                   resources=ps_resources.get(i),
-                   node_selector=ps_node_selectors.get(i),
-                   affinity=ps_affinities.get(i),
-                   tolerations=ps_tolerations.get(i))
-
+        jobs.append(get_job(job_uuid=ps_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.PS,
+                            sequence=i,
+                            resources=ps_resources.get(i),
+                            node_selector=ps_node_selectors.get(i),
+                            affinity=ps_affinities.get(i),
+                            tolerations=ps_tolerations.get(i)))
 
-def handle_tensorflow_experiment(response):
-    master = response[TaskType.MASTER]
-    job_uuid = master['pod']['metadata']['labels']['job_uuid']
-    job_uuid = uuid.UUID(job_uuid)
-
-    set_job_definition(job_uuid=job_uuid, definition=get_job_definition(master))
+    create_jobs(jobs)
 
-    for worker in response[TaskType.WORKER]:
-        job_uuid = worker['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(worker))
 
-    for ps in response[TaskType.PS]:
-        job_uuid = ps['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(ps))
+def handle_tensorflow_experiment(response):
+    set_jobs_definitions([response[TaskType.MASTER]] +
+                         response[TaskType.WORKER] +
+                         response[TaskType.PS])
 
 
 def create_horovod_experiment_jobs(experiment, spawner):
+    jobs = []
     master_job_uuid = spawner.job_uuids[TaskType.MASTER][0]
-    create_job(job_uuid=master_job_uuid,
-               experiment=experiment,
-               resources=spawner.spec.master_resources,
-               node_selector=spawner.spec.master_node_selector,
-               affinity=spawner.spec.master_affinity,
-               tolerations=spawner.spec.master_tolerations)
+    jobs.append(get_job(job_uuid=master_job_uuid,
+                        experiment=experiment,
+                        resources=spawner.spec.master_resources,
+                        node_selector=spawner.spec.master_node_selector,
+                        affinity=spawner.spec.master_affinity,
+                        tolerations=spawner.spec.master_tolerations))
 
     cluster, is_distributed = spawner.spec.cluster_def
     environment = spawner.spec.config.horovod
@@ -269,30 +318,24 @@ def create_horovod_experiment_jobs(experiment, spawner):
     )
 
     for i, worker_job_uuid in enumerate(spawner.job_uuids[TaskType.WORKER]):
-        create_job(job_uuid=worker_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.WORKER,
-                   sequence=i,
-                   resources=worker_resources.get(i),
-                   node_selector=worker_node_selectors.get(i),
-                   affinity=worker_affinities.get(i),
-                   tolerations=worker_tolerations.get(i))
+        jobs.append(get_job(job_uuid=worker_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.WORKER,
+                            sequence=i,
+                            resources=worker_resources.get(i),
+                            node_selector=worker_node_selectors.get(i),
+                            affinity=worker_affinities.get(i),
+                            tolerations=worker_tolerations.get(i)))
 
+    create_jobs(jobs)
 
-def handle_horovod_experiment(response):
-    master = response[TaskType.MASTER]
-    job_uuid = master['pod']['metadata']['labels']['job_uuid']
-    job_uuid = uuid.UUID(job_uuid)
-
-    set_job_definition(job_uuid=job_uuid, definition=get_job_definition(master))
 
-    for worker in response[TaskType.WORKER]:
-        job_uuid = worker['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(worker))
+def handle_horovod_experiment(response):
+    set_jobs_definitions([response[TaskType.MASTER]] + response[TaskType.WORKER])
 
 
 def create_mpi_experiment_jobs(experiment, spawner):
+    jobs = []
     cluster, is_distributed = spawner.spec.cluster_def
     environment = spawner.spec.config.mpi
     worker_resources = MPISpecification.get_worker_resources(
@@ -318,32 +361,35 @@ def create_mpi_experiment_jobs(experiment, spawner):
 
     for i, worker_job_uuid in enumerate(spawner.job_uuids[TaskType.WORKER]):
         if i == 0:
-            create_job(job_uuid=worker_job_uuid,
-                       experiment=experiment,
-                       role=TaskType.WORKER,
-                       resources=spawner.spec.master_resources,
-                       node_selector=spawner.spec.master_node_selector,
-                       affinity=spawner.spec.master_affinity,
-                       tolerations=spawner.spec.master_tolerations)
+            jobs.append(get_job(job_uuid=worker_job_uuid,
+                                experiment=experiment,
+                                role=TaskType.WORKER,
+                                resources=spawner.spec.master_resources,
+                                node_selector=spawner.spec.master_node_selector,
+                                affinity=spawner.spec.master_affinity,
+                                tolerations=spawner.spec.master_tolerations))
         else:
-            create_job(job_uuid=worker_job_uuid,
-                       experiment=experiment,
-                       role=TaskType.WORKER,
-                       sequence=i,
-                       resources=worker_resources.get(i),
-                       node_selector=worker_node_selectors.get(i),
-                       affinity=worker_affinities.get(i),
-                       tolerations=worker_tolerations.get(i))
+            jobs.append(get_job(job_uuid=worker_job_uuid,
+                                experiment=experiment,
+                                role=TaskType.WORKER,
+                                sequence=i,
+                                resources=worker_resources.get(i),
+                                node_selector=worker_node_selectors.get(i),
+                                affinity=worker_affinities.get(i),
+                                tolerations=worker_tolerations.get(i)))
+
+    create_jobs(jobs)
 
 
 def create_pytorch_experiment_jobs(experiment, spawner):
+    jobs = []
     master_job_uuid = spawner.job_uuids[TaskType.MASTER][0]
-    create_job(job_uuid=master_job_uuid,
-               experiment=experiment,
-               resources=spawner.spec.master_resources,
-               node_selector=spawner.spec.master_node_selector,
-               affinity=spawner.spec.master_affinity,
-               tolerations=spawner.spec.master_tolerations)
+    jobs.append(get_job(job_uuid=master_job_uuid,
+                        experiment=experiment,
+                        resources=spawner.spec.master_resources,
+                        node_selector=spawner.spec.master_node_selector,
+                        affinity=spawner.spec.master_affinity,
+                        tolerations=spawner.spec.master_tolerations))
 
     cluster, is_distributed = spawner.spec.cluster_def
     environment = spawner.spec.config.pytorch
@@ -370,37 +416,31 @@ def create_pytorch_experiment_jobs(experiment, spawner):
     )
 
     for i, worker_job_uuid in enumerate(spawner.job_uuids[TaskType.WORKER]):
-        create_job(job_uuid=worker_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.WORKER,
-                   sequence=i,
-                   resources=worker_resources.get(i),
-                   node_selector=worker_node_selectors.get(i),
-                   affinity=worker_affinities.get(i),
-                   tolerations=worker_tolerations.get(i))
+        jobs.append(get_job(job_uuid=worker_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.WORKER,
+                            sequence=i,
+                            resources=worker_resources.get(i),
+                            node_selector=worker_node_selectors.get(i),
+                            affinity=worker_affinities.get(i),
+                            tolerations=worker_tolerations.get(i)))
 
+    create_jobs(jobs)
 
-def handle_pytorch_experiment(response):
-    master = response[TaskType.MASTER]
-    job_uuid = master['pod']['metadata']['labels']['job_uuid']
-    job_uuid = uuid.UUID(job_uuid)
-
-    set_job_definition(job_uuid=job_uuid, definition=get_job_definition(master))
 
-    for worker in response[TaskType.WORKER]:
-        job_uuid = worker['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(worker))
+def handle_pytorch_experiment(response):
+    set_jobs_definitions([response[TaskType.MASTER]] + response[TaskType.WORKER])
 
 
 def create_mxnet_experiment_jobs(experiment, spawner):
+    jobs = []
     master_job_uuid = spawner.job_uuids[TaskType.MASTER][0]
-    create_job(job_uuid=master_job_uuid,
-               experiment=experiment,
-               resources=spawner.spec.master_resources,
-               node_selector=spawner.spec.master_node_selector,
-               affinity=spawner.spec.master_affinity,
-               tolerations=spawner.spec.master_tolerations)
+    jobs.append(get_job(job_uuid=master_job_uuid,
+                        experiment=experiment,
+                        resources=spawner.spec.master_resources,
+                        node_selector=spawner.spec.master_node_selector,
+                        affinity=spawner.spec.master_affinity,
+                        tolerations=spawner.spec.master_tolerations))
 
     cluster, is_distributed = spawner.spec.cluster_def
     environment = spawner.spec.config.mxnet
@@ -427,14 +467,14 @@ def create_mxnet_experiment_jobs(experiment, spawner):
     )
 
     for i, worker_job_uuid in enumerate(spawner.job_uuids[TaskType.WORKER]):
-        create_job(job_uuid=worker_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.WORKER,
-                   sequence=i,
-                   resources=worker_resources.get(i),
-                   node_selector=worker_node_selectors.get(i),
-                   affinity=worker_affinities.get(i),
-                   tolerations=worker_tolerations.get(i))
+        jobs.append(get_job(job_uuid=worker_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.WORKER,
+                            sequence=i,
+                            resources=worker_resources.get(i),
+                            node_selector=worker_node_selectors.get(i),
+                            affinity=worker_affinities.get(i),
+                            tolerations=worker_tolerations.get(i)))
 
     server_resources = MXNetSpecification.get_ps_resources(
         environment=environment,
@@ -457,32 +497,22 @@ def create_mxnet_experiment_jobs(experiment, spawner):
         is_distributed=is_distributed
     )
     for i, server_job_uuid in enumerate(spawner.job_uuids[TaskType.SERVER]):
-        create_job(job_uuid=server_job_uuid,
-                   experiment=experiment,
-                   role=TaskType.SERVER,
-                   sequence=i,
-                   resources=server_resources.get(i),
-                   node_selector=server_node_selectors,
-                   affinity=server_affinities,
-                   tolerations=server_tolerations)
-
+        jobs.append(get_job(job_uuid=server_job_uuid,
+                            experiment=experiment,
+                            role=TaskType.SERVER,
+                            sequence=i,
+                            resources=server_resources.get(i),
+                            node_selector=server_node_selectors,
+                            affinity=server_affinities,
+                            tolerations=server_tolerations))
 
-def handle_mxnet_experiment(response):
-    master = response[TaskType.MASTER]
-    job_uuid = master['pod']['metadata']['labels']['job_uuid']
-    job_uuid = uuid.UUID(job_uuid)
-
-    set_job_definition(job_uuid=job_uuid, definition=get_job_definition(master))
+    create_jobs(jobs)
 
-    for worker in response[TaskType.WORKER]:
-        job_uuid = worker['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(worker))
 
-    for server in response[TaskType.SERVER]:
-        job_uuid = server['pod']['metadata']['labels']['job_uuid']
-        job_uuid = uuid.UUID(job_uuid)
-        set_job_definition(job_uuid=job_uuid, definition=get_job_definition(server))
+def handle_mxnet_experiment(response):
+    set_jobs_definitions([response[TaskType.MASTER]] +
+                         response[TaskType.WORKER] +
+                         response[TaskType.SERVER])
 
 
 def create_base_experiment_job(experiment, spawner):
@@ -496,11 +526,7 @@ def create_base_experiment_job(experiment, spawner):
 
 
 def handle_base_experiment(response):
-    master = response[TaskType.MASTER]
-    job_uuid = master['pod']['metadata']['labels']['job_uuid']
-    job_uuid = uuid.UUID(job_uuid)
-
-    set_job_definition(job_uuid=job_uuid, definition=get_job_definition(master))
+    set_jobs_definitions([response[TaskType.MASTER]])
 
 
 def handle_experiment(experiment, response):
@@ -1,5 +1,7 @@
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
+
 from hestia.auth import AuthenticationTypes
 from hestia.internal_services import InternalServices
 from kubernetes.config import ConfigException
@@ -23,6 +25,9 @@ from scheduler.spawners.templates.volumes import (
 )
 from schemas import TaskType
 
+# The pods and services of the replicas are created concurrently by at most this number of threads
+SPAWN_WORKERS = 10
+
 
 class ExperimentSpawner(K8SManager):
     MASTER_SERVICE = False
@@ -90,6 +95,9 @@ class ExperimentSpawner(K8SManager):
             health_check_url=get_experiment_health_url(self.experiment_name))
         self.token_scope = token_scope
         self.ports = self.get_ports(ports=ports)
+        # The volumes and the init env vars are the same for all the replicas
+        self._pod_volumes = None
+        self._init_env_vars = None
 
         super().__init__(k8s_config=k8s_config,
                          namespace=namespace,
@@ -142,18 +150,55 @@ class ExperimentSpawner(K8SManager):
                                          include_internal_token=True)
         return env_vars
 
-    def _create_job(self,
-                    task_type,
-                    task_idx,
-                    add_service,
-                    command=None,
-                    args=None,
-                    env_vars=None,
-                    resources=None,
-                    node_selector=None,
-                    affinity=None,
-                    tolerations=None,
-                    restart_policy='Never'):
+    def _get_init_env_vars(self):
+        if self._init_env_vars is None:
+            self._init_env_vars = self.get_init_env_vars()
+        return self._init_env_vars
+
+    def get_pod_volumes(self):
+        """Return the volumes, the volume mounts, and the context mounts of the pods.
+
+        The volumes are validated once for all the replicas, each replica gets its own lists.
+        """
+        if self._pod_volumes is None:
+            # Set and validate volumes
+            volumes, volume_mounts = get_pod_volumes(
+                persistence_outputs=self.persistence_config.outputs,
+                persistence_data=self.persistence_config.data)
+            refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
+                outputs_refs=self.outputs_refs_jobs,
+                persistence_outputs=self.persistence_config.outputs)
+            volumes += refs_volumes
+            volume_mounts += refs_volume_mounts
+            refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
+                outputs_refs=self.outputs_refs_experiments,
+                persistence_outputs=self.persistence_config.outputs)
+            volumes += refs_volumes
+            volume_mounts += refs_volume_mounts
+            shm_volumes, shm_volume_mounts = get_shm_volumes()
+            volumes += shm_volumes
+            volume_mounts += shm_volume_mounts
+
+            context_volumes, context_mounts = get_auth_context_volumes()
+            volumes += context_volumes
+            volume_mounts += context_mounts
+            self._pod_volumes = volumes, volume_mounts, context_mounts
+
+        volumes, volume_mounts, context_mounts = self._pod_volumes
+        return list(volumes), list(volume_mounts), context_mounts
+
+    def _get_job(self,
+                 task_type,
+                 task_idx,
+                 add_service,
+                 command=None,
+                 args=None,
+                 env_vars=None,
+                 resources=None,
+                 node_selector=None,
+                 affinity=None,
+                 tolerations=None,
+                 restart_policy='Never'):
         ephemeral_token = None
         if self.token_scope:
             ephemeral_token = RedisEphemeralTokens.generate_header_token(scope=self.token_scope)
@@ -164,28 +209,7 @@ class ExperimentSpawner(K8SManager):
                                                   task_idx=task_idx,
                                                   job_uuid=job_uuid)
 
-        # Set and validate volumes
-        volumes, volume_mounts = get_pod_volumes(
-            persistence_outputs=self.persistence_config.outputs,
-            persistence_data=self.persistence_config.data)
-        refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
-            outputs_refs=self.outputs_refs_jobs,
-            persistence_outputs=self.persistence_config.outputs)
-        volumes += refs_volumes
-        volume_mounts += refs_volume_mounts
-        refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
-            outputs_refs=self.outputs_refs_experiments,
-            persistence_outputs=self.persistence_config.outputs)
-        volumes += refs_volumes
-        volume_mounts += refs_volume_mounts
-        shm_volumes, shm_volume_mounts = get_shm_volumes()
-        volumes += shm_volumes
-        volume_mounts += shm_volume_mounts
-
-        context_volumes, context_mounts = get_auth_context_volumes()
-        volumes += context_volumes
-        volume_mounts += context_mounts
-
+        volumes, volume_mounts, context_mounts = self.get_pod_volumes()
         pod = self.resource_manager.get_task_pod(
             task_type=task_type,
             task_idx=task_idx,
@@ -196,7 +220,7 @@ class ExperimentSpawner(K8SManager):
             command=command,
             args=args,
             ports=self.ports,
-            init_env_vars=self.get_init_env_vars(),
+            init_env_vars=self._get_init_env_vars(),
             persistence_outputs=self.persistence_config.outputs,
             persistence_data=self.persistence_config.data,
             outputs_refs_jobs=self.outputs_refs_jobs,
@@ -210,20 +234,36 @@ class ExperimentSpawner(K8SManager):
             tolerations=tolerations,
             init_context_mounts=context_mounts,
             restart_policy=restart_policy)
-        pod_resp, _ = self.create_or_update_pod(name=resource_name, data=pod)
-        results = {'pod': pod_resp.to_dict()}
+        service = None
         if add_service:
             service = services.get_service(namespace=self.namespace,
                                            name=resource_name,
                                            labels=labels,
                                            ports=self.ports,
                                            target_ports=self.ports)
+        return resource_name, pod, service
+
+    def _submit_job(self, resource_name, pod, service):
+        pod_resp, _ = self.create_or_update_pod(name=resource_name, data=pod)
+        results = {'pod': pod_resp.to_dict()}
+        if service:
             service_resp, _ = self.create_or_update_service(name=resource_name, data=service)
             results['service'] = service_resp.to_dict()
         return results
 
+    def _create_job(self, task_type, task_idx, add_service, **kwargs):
+        return self._submit_job(*self._get_job(task_type=task_type,
+                                               task_idx=task_idx,
+                                               add_service=add_service,
+                                               **kwargs))
+
     def create_multi_jobs(self, task_type, add_service):
-        resp = []
+        """Create the pods and services of the replicas.
+
+        The definitions are generated sequentially, the Kubernetes objects are then submitted
+        concurrently, the responses keep the replicas order.
+        """
+        jobs = []
         n_pods = self.get_n_pods(task_type=task_type)
         for i in range(n_pods):
             command, args = self.get_pod_command_args(task_type=task_type, task_idx=i)
@@ -232,17 +272,21 @@ class ExperimentSpawner(K8SManager):
             node_selector = self.get_node_selector(task_type=task_type, task_idx=i)
             affinity = self.get_affinity(task_type=task_type, task_idx=i)
             tolerations = self.get_tolerations(task_type=task_type, task_idx=i)
-            resp.append(self._create_job(task_type=task_type,
-                                         task_idx=i,
-                                         command=command,
-                                         args=args,
-                                         env_vars=env_vars,
-                                         resources=resources,
-                                         node_selector=node_selector,
-                                         affinity=affinity,
-                                         tolerations=tolerations,
-                                         add_service=add_service))
-        return resp
+            jobs.append(self._get_job(task_type=task_type,
+                                      task_idx=i,
+                                      command=command,
+                                      args=args,
+                                      env_vars=env_vars,
+                                      resources=resources,
+                                      node_selector=node_selector,
+                                      affinity=affinity,
+                                      tolerations=tolerations,
+                                      add_service=add_service))
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(SPAWN_WORKERS, len(jobs))) as executor:
+            return list(executor.map(lambda job: self._submit_job(*job), jobs))
 
     def _delete_job(self, task_type, task_idx, has_service):
         resource_name = self.resource_manager.get_resource_name(task_type=task_type,
@@ -6,12 +6,6 @@ from polyaxon_k8s.exceptions import PolyaxonK8SError
 from scheduler.spawners.experiment_spawner import ExperimentSpawner
 from scheduler.spawners.templates.kf_jobs import manager
 from scheduler.spawners.templates.kubeflow import KUBEFLOW_JOB_GROUP
-from scheduler.spawners.templates.volumes import (
-    get_auth_context_volumes,
-    get_pod_refs_outputs_volumes,
-    get_pod_volumes,
-    get_shm_volumes
-)
 from schemas import TaskType
 
 
@@ -44,27 +38,7 @@ class KFExperimentSpawner(ExperimentSpawner):
         resource_name = self.resource_manager.get_kf_resource_name(task_type=task_type)
         labels = self.resource_manager.get_labels(task_type=task_type)
 
-        # Set and validate volumes
-        volumes, volume_mounts = get_pod_volumes(
-            persistence_outputs=self.persistence_config.outputs,
-            persistence_data=self.persistence_config.data)
-        refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
-            outputs_refs=self.outputs_refs_jobs,
-            persistence_outputs=self.persistence_config.outputs)
-        volumes += refs_volumes
-        volume_mounts += refs_volume_mounts
-        refs_volumes, refs_volume_mounts = get_pod_refs_outputs_volumes(
-            outputs_refs=self.outputs_refs_experiments,
-            persistence_outputs=self.persistence_config.outputs)
-        volumes += refs_volumes
-        volume_mounts += refs_volume_mounts
-        shm_volumes, shm_volume_mounts = get_shm_volumes()
-        volumes += shm_volumes
-        volume_mounts += shm_volume_mounts
-
-        context_volumes, context_mounts = get_auth_context_volumes()
-        volumes += context_volumes
-        volume_mounts += context_mounts
+        volumes, volume_mounts, context_mounts = self.get_pod_volumes()
 
         pod_template_spec = self.resource_manager.get_pod_template_spec(
             resource_name=resource_name,
@@ -75,7 +49,7 @@ class KFExperimentSpawner(ExperimentSpawner):
             command=command,
             args=args,
             ports=self.ports,
-            init_env_vars=self.get_init_env_vars(),
+            init_env_vars=self._get_init_env_vars(),
             persistence_outputs=self.persistence_config.outputs,
             persistence_data=self.persistence_config.data,
             outputs_refs_jobs=self.outputs_refs_jobs,
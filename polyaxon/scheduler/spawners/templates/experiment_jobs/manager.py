@@ -108,6 +108,8 @@ class ResourceManager(BaseResourceManager):
 
     def set_cluster_def(self, cluster_def):
         self.cluster_def = cluster_def
+        # The containers env vars include the cluster definition
+        self._templates = {}
 
     def get_resource_name(self, task_type, task_idx):  # pylint:disable=arguments-differ
         return EXPERIMENT_JOB_NAME_FORMAT.format(task_type=task_type,
@@ -231,46 +233,46 @@ class ResourceManager(BaseResourceManager):
     def _get_pod_resources(self, resources):
         return get_pod_resources(
             resources=resources,
-            default_resources=conf.get(K8S_RESOURCES_EXPERIMENTS))
+            default_resources=self._get_option(K8S_RESOURCES_EXPERIMENTS))
 
     def _get_node_selector(self, node_selector):
         return get_node_selector(
             node_selector=node_selector,
-            default_node_selector=conf.get(NODE_SELECTORS_EXPERIMENTS))
+            default_node_selector=self._get_option(NODE_SELECTORS_EXPERIMENTS))
 
     def _get_affinity(self, affinity):
         return get_affinity(
             affinity=affinity,
-            default_affinity=conf.get(AFFINITIES_EXPERIMENTS))
+            default_affinity=self._get_option(AFFINITIES_EXPERIMENTS))
 
     def _get_tolerations(self, tolerations):
         return get_tolerations(
             tolerations=tolerations,
-            default_tolerations=conf.get(TOLERATIONS_EXPERIMENTS))
+            default_tolerations=self._get_option(TOLERATIONS_EXPERIMENTS))
 
     def _get_secret_refs(self, secret_refs):
         return get_secret_refs(
             secret_refs=secret_refs,
-            default_secret_refs=conf.get(K8S_SECRETS_EXPERIMENTS))
+            default_secret_refs=self._get_option(K8S_SECRETS_EXPERIMENTS))
 
     def _get_config_map_refs(self, config_map_refs):
         return get_config_map_refs(
             config_map_refs=config_map_refs,
-            default_config_map_refs=conf.get(K8S_CONFIG_MAPS_EXPERIMENTS))
+            default_config_map_refs=self._get_option(K8S_CONFIG_MAPS_EXPERIMENTS))
 
     def _get_service_account_name(self):
         service_account_name = None
-        sa = conf.get(SERVICE_ACCOUNTS_EXPERIMENTS)
+        sa = self._get_option(SERVICE_ACCOUNTS_EXPERIMENTS)
         if not sa:
-            sa = conf.get(K8S_SERVICE_ACCOUNT_EXPERIMENTS)
-        if conf.get(K8S_RBAC_ENABLED) and sa:
+            sa = self._get_option(K8S_SERVICE_ACCOUNT_EXPERIMENTS)
+        if self._get_option(K8S_RBAC_ENABLED) and sa:
             service_account_name = sa
         return service_account_name
 
     def _get_kv_env_vars(self, env_vars):
         return get_env_vars(
             env_vars=env_vars,
-            default_env_vars=conf.get(ENV_VARS_EXPERIMENTS))
+            default_env_vars=self._get_option(ENV_VARS_EXPERIMENTS))
 
     def get_task_pod(self,
                      task_type,
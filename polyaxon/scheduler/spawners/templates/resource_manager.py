@@ -1,3 +1,5 @@
+import copy
+
 from collections import Mapping
 
 from hestia.list_utils import to_list
@@ -68,6 +70,32 @@ class BaseResourceManager(object):
         self.health_check_url = health_check_url
         self.log_level = log_level
         self.use_security_context = use_security_context
+        self._options = {}
+        self._templates = {}
+
+    def _get_option(self, key):
+        """Read an option once for all the pods created by this manager."""
+        if key not in self._options:
+            self._options[key] = conf.get(key)
+        return self._options[key]
+
+    def _get_template(self, name, get_value, *args):
+        """Render a part of the pods once for all the replicas created by this manager.
+
+        The part is rendered again when it's requested with different arguments,
+        the arguments are compared by identity first, so that the replicas sharing
+        the same objects do not pay for a deep comparison.
+        """
+        cached = self._templates.get(name)
+        if cached is not None:
+            cached_args, value = cached
+            if len(cached_args) == len(args) and all(
+                    cached_arg is arg or cached_arg == arg
+                    for cached_arg, arg in zip(cached_args, args)):
+                return value
+        value = get_value()
+        self._templates[name] = (args, value)
+        return value
 
     def get_resource_name(self):
         raise NotImplementedError()
@@ -76,7 +104,7 @@ class BaseResourceManager(object):
         return {
             'app.kubernetes.io/name': self.app_label,
             'app.kubernetes.io/instance': job_uuid,
-            'app.kubernetes.io/version': conf.get(CHART_VERSION),
+            'app.kubernetes.io/version': self._get_option(CHART_VERSION),
             'app.kubernetes.io/part-of': self.type_label,
             'app.kubernetes.io/component': self.role_label,
             'app.kubernetes.io/managed-by': 'polyaxon'
@@ -121,15 +149,23 @@ class BaseResourceManager(object):
 
         # Env vars preparations
         env_vars = to_list(env_vars, check_none=True)
-        env_vars += self._get_container_pod_env_vars(
-            persistence_outputs=persistence_outputs,
-            persistence_data=persistence_data,
-            outputs_refs_jobs=outputs_refs_jobs,
-            outputs_refs_experiments=outputs_refs_experiments,
-            ephemeral_token=ephemeral_token
-        )
+        env_vars += self._get_template(
+            'container_env_vars',
+            lambda: self._get_container_pod_env_vars(
+                persistence_outputs=persistence_outputs,
+                persistence_data=persistence_data,
+                outputs_refs_jobs=outputs_refs_jobs,
+                outputs_refs_experiments=outputs_refs_experiments,
+                ephemeral_token=ephemeral_token
+            ),
+            persistence_outputs,
+            persistence_data,
+            outputs_refs_jobs,
+            outputs_refs_experiments,
+            ephemeral_token)
         env_vars += get_resources_env_vars(resources=resources)
-        env_vars += get_kv_env_vars(self._get_kv_env_vars(None))
+        env_vars += self._get_template('kv_env_vars',
+                                       lambda: get_kv_env_vars(self._get_kv_env_vars(None)))
 
         # Env from config_map and secret refs
         env_from = get_pod_env_from(secret_refs=secret_refs, config_map_refs=config_map_refs)
@@ -209,7 +245,10 @@ class BaseResourceManager(object):
         secret_refs = self._get_secret_refs(secret_refs=secret_refs)
         config_map_refs = self._get_config_map_refs(config_map_refs=config_map_refs)
 
-        gpu_volume_mounts, gpu_volumes = get_gpu_volumes_def(resources)
+        gpu_volume_mounts, gpu_volumes = self._get_template(
+            'gpu_volumes',
+            lambda: get_gpu_volumes_def(resources),
+            bool(resources and resources.gpu))
         volume_mounts += gpu_volume_mounts
         volumes += gpu_volumes
 
@@ -233,23 +272,39 @@ class BaseResourceManager(object):
                 persistence_outputs=persistence_outputs,
                 persistence_data=persistence_data,
                 context_mounts=sidecar_context_mounts)
-            sidecar_container = self.get_sidecar_container(volume_mounts=sidecar_volume_mounts)
-            containers.append(sidecar_container)
-
-        init_container = self.get_init_container(init_command=init_command,
-                                                 init_args=init_args,
-                                                 env_vars=init_env_vars,
-                                                 context_mounts=init_context_mounts,
-                                                 persistence_outputs=persistence_outputs,
-                                                 persistence_data=persistence_data)
-        init_containers = to_list(init_container, check_none=True)
+            sidecar_container = self._get_template(
+                'sidecar_container',
+                lambda: self.get_sidecar_container(volume_mounts=sidecar_volume_mounts),
+                sidecar_volume_mounts)
+            containers.append(copy.copy(sidecar_container))
+
+        init_container = self._get_template(
+            'init_container',
+            lambda: self.get_init_container(init_command=init_command,
+                                            init_args=init_args,
+                                            env_vars=init_env_vars,
+                                            context_mounts=init_context_mounts,
+                                            persistence_outputs=persistence_outputs,
+                                            persistence_data=persistence_data),
+            init_command,
+            init_args,
+            init_env_vars,
+            init_context_mounts,
+            persistence_outputs,
+            persistence_data)
+        init_containers = [copy.copy(container)
+                           for container in to_list(init_container, check_none=True)]
 
         node_selector = self._get_node_selector(node_selector=node_selector)
         affinity = self._get_affinity(affinity=affinity)
         tolerations = self._get_tolerations(tolerations=tolerations)
-        service_account_name = self._get_service_account_name()
+        service_account_name = self._get_template('service_account_name',
+                                                  self._get_service_account_name)
+        security_context = None
+        if self.use_security_context:
+            security_context = self._get_template('security_context', get_security_context)
         return client.V1PodSpec(
-            security_context=get_security_context() if self.use_security_context else None,
+            security_context=security_context,
             restart_policy=restart_policy,
             service_account_name=service_account_name,
             init_containers=init_containers,
@@ -7,13 +7,14 @@ from db.models.jobs import Job
 from db.models.notebooks import NotebookJob
 from db.models.projects import Project
 from db.models.tensorboards import TensorboardJob
+from libs.deletion import delete_experiment_group, delete_project
 from polyaxon.settings import SchedulerCeleryTasks
 
 
 @workers.app.task(name=SchedulerCeleryTasks.DELETE_ARCHIVED_PROJECT, ignore_result=True)
 def delete_archived_project(project_id):
     try:
-        Project.archived.get(id=project_id).delete()
+        delete_project(Project.archived.get(id=project_id))
     except Project.DoesNotExist:
         pass
 
@@ -21,7 +22,7 @@ def delete_archived_project(project_id):
 @workers.app.task(name=SchedulerCeleryTasks.DELETE_ARCHIVED_EXPERIMENT_GROUP, ignore_result=True)
 def delete_archived_experiment_group(group_id):
     try:
-        ExperimentGroup.archived.get(id=group_id).delete()
+        delete_experiment_group(ExperimentGroup.archived.get(id=group_id))
     except ExperimentGroup.DoesNotExist:
         pass
 
@@ -3,6 +3,9 @@ import logging
 from polystores.exceptions import PolyaxonStoresException
 from rest_framework.exceptions import ValidationError
 
+from django.db import transaction
+
+import auditor
 import conf
 import publisher
 import stores
@@ -10,7 +13,9 @@ import workers
 
 from api.experiments.serializers import ExperimentMetricSerializer
 from db.getters.experiments import get_valid_experiment
+from db.models.experiments import Experiment, ExperimentMetric, ExperimentMetricSeries
 from db.redis.heartbeat import RedisHeartBeat
+from events.registry.experiment import EXPERIMENT_NEW_METRIC
 from lifecycles.experiments import ExperimentLifeCycle
 from logs_handlers import collectors
 from options.registry.scheduler import SCHEDULER_GLOBAL_COUNTDOWN_DELAYED
@@ -120,6 +125,33 @@ def experiments_check_heartbeat(experiment_id):
                           message='Experiment is in zombie state (no heartbeat was reported).')
 
 
+def bulk_create_metrics(experiment, metrics):
+    """Insert a batch of validated metrics without triggering the per row signals.
+
+    The batch is folded, by creation time, into a single update of the experiment's last metric,
+    and a single new metric event is recorded for the batch.
+    """
+    if not metrics:
+        return []
+
+    metrics = [ExperimentMetric(experiment=experiment, **metric) for metric in metrics]
+    last_metric = {}
+    for metric in sorted(metrics, key=lambda m: m.created_at):
+        last_metric.update(metric.values)
+
+    with transaction.atomic():
+        metrics = ExperimentMetric.objects.bulk_create(metrics)
+        # Lock the row, concurrent batches of the same experiment update the same last metric
+        current_last_metric = Experiment.objects.select_for_update().values_list(
+            'last_metric', flat=True).get(id=experiment.id)
+        experiment.last_metric = dict(current_last_metric or {}, **last_metric)
+        experiment.save(update_fields=['last_metric'])
+        ExperimentMetricSeries.add_metrics(experiment_id=experiment.id, metrics=metrics)
+
+    auditor.record(event_type=EXPERIMENT_NEW_METRIC, instance=experiment)
+    return metrics
+
+
 @workers.app.task(name=SchedulerCeleryTasks.EXPERIMENTS_SET_METRICS, ignore_result=True)
 def experiments_set_metrics(experiment_id, data):
     experiment = get_valid_experiment(experiment_id=experiment_id)
@@ -134,8 +166,12 @@ def experiments_set_metrics(experiment_id, data):
         serializer.is_valid(raise_exception=True)
     except ValidationError:
         _logger.error('Could not create metrics, a validation error was raised.')
+        return
 
-    serializer.save(experiment=experiment)
+    if isinstance(data, list):
+        bulk_create_metrics(experiment=experiment, metrics=serializer.validated_data)
+    else:
+        serializer.save(experiment=experiment)
 
 
 @workers.app.task(name=SchedulerCeleryTasks.EXPERIMENTS_START, ignore_result=True)
@@ -14,10 +14,12 @@ def stores_schedule_data_deletion(persistence, subpath):
 
 
 @workers.app.task(name=SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION, ignore_result=True)
-def stores_schedule_outputs_deletion(persistence, subpath):
-    stores.delete_outputs_path(persistence=persistence, subpath=subpath)
+def stores_schedule_outputs_deletion(persistence, subpath=None, subpaths=None):
+    for _subpath in [subpath] if subpath else subpaths or []:
+        stores.delete_outputs_path(persistence=persistence, subpath=_subpath)
 
 
 @workers.app.task(name=SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION, ignore_result=True)
-def stores_schedule_logs_deletion(persistence, subpath):
-    stores.delete_logs_path(persistence=persistence, subpath=subpath)
+def stores_schedule_logs_deletion(persistence, subpath=None, subpaths=None):
+    for _subpath in [subpath] if subpath else subpaths or []:
+        stores.delete_logs_path(persistence=persistence, subpath=_subpath)
@@ -1,6 +1,12 @@
+from typing import Iterable
+
 from db.models.bookmarks import Bookmark
 
 
 def remove_bookmarks(object_id: int, content_type: str) -> None:
     # Remove any bookmark
     Bookmark.objects.filter(content_type__model=content_type, object_id=object_id).delete()
+
+
+def remove_bookmarks_many(object_ids: Iterable[int], content_type: str) -> None:
+    Bookmark.objects.filter(content_type__model=content_type, object_id__in=object_ids).delete()
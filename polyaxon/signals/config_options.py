@@ -0,0 +1,21 @@
+from hestia.signal_decorators import ignore_raw
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from conf.conf_manager import conf_cache_manager
+from db.models.config_options import ConfigOption
+
+
+@receiver(post_save, sender=ConfigOption, dispatch_uid="config_option_saved")
+@ignore_raw
+def config_option_saved(sender, **kwargs):
+    instance = kwargs['instance']
+    conf_cache_manager.invalidate(key=instance.key)
+
+
+@receiver(post_delete, sender=ConfigOption, dispatch_uid="config_option_deleted")
+@ignore_raw
+def config_option_deleted(sender, **kwargs):
+    instance = kwargs['instance']
+    conf_cache_manager.invalidate(key=instance.key)
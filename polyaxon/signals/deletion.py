@@ -20,6 +20,7 @@ from events.registry.experiment_group import EXPERIMENT_GROUP_DELETED
 from events.registry.job import JOB_CLEANED_TRIGGERED, JOB_DELETED
 from events.registry.notebook import NOTEBOOK_CLEANED_TRIGGERED, NOTEBOOK_DELETED
 from events.registry.tensorboard import TENSORBOARD_CLEANED_TRIGGERED, TENSORBOARD_DELETED
+from libs.deletion import ignore_bulk_deletion
 from libs.paths.projects import delete_project_repos
 from polyaxon.settings import SchedulerCeleryTasks
 from signals.bookmarks import remove_bookmarks
@@ -27,6 +28,7 @@ from signals.bookmarks import remove_bookmarks
 
 @receiver(pre_delete, sender=BuildJob, dispatch_uid="build_job_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def build_job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
@@ -43,6 +45,7 @@ def build_job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=BuildJob, dispatch_uid="build_job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def build_job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=BUILD_JOB_DELETED, instance=instance)
@@ -51,6 +54,7 @@ def build_job_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=ExperimentGroup, dispatch_uid="experiment_group_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_group_pre_delete(sender, **kwargs):
     """Delete all group outputs."""
     instance = kwargs['instance']
@@ -75,6 +79,7 @@ def experiment_group_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=ExperimentGroup, dispatch_uid="experiment_group_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_group_post_delete(sender, **kwargs):
     """Delete all group outputs."""
     instance = kwargs['instance']
@@ -84,6 +89,7 @@ def experiment_group_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=Experiment, dispatch_uid="experiment_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_pre_delete(sender, **kwargs):
     instance = kwargs['instance']
 
@@ -111,6 +117,7 @@ def experiment_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Experiment, dispatch_uid="experiment_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=EXPERIMENT_DELETED, instance=instance)
@@ -119,6 +126,7 @@ def experiment_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=Job, dispatch_uid="job_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
@@ -141,6 +149,7 @@ def job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Job, dispatch_uid="job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=JOB_DELETED, instance=instance)
@@ -149,6 +158,7 @@ def job_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=NotebookJob, dispatch_uid="notebook_job_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def notebook_job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
     auditor.record(event_type=NOTEBOOK_CLEANED_TRIGGERED, instance=job)
@@ -156,6 +166,7 @@ def notebook_job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Job, dispatch_uid="notebook_job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def notebook_job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=NOTEBOOK_DELETED, instance=instance)
@@ -164,6 +175,7 @@ def notebook_job_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=TensorboardJob, dispatch_uid="tensorboard_job_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def tensorboard_job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
     auditor.record(event_type=TENSORBOARD_CLEANED_TRIGGERED, instance=job)
@@ -171,6 +183,7 @@ def tensorboard_job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Job, dispatch_uid="tensorboard_job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def tensorboard_job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=TENSORBOARD_DELETED, instance=instance)
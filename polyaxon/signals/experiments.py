@@ -8,7 +8,7 @@ from django.dispatch import receiver
 import auditor
 
 from db.models.experiment_jobs import ExperimentJob
-from db.models.experiments import Experiment, ExperimentMetric
+from db.models.experiments import Experiment, ExperimentMetric, ExperimentMetricSeries
 from events.registry.experiment import EXPERIMENT_NEW_METRIC
 from libs.repos.utils import assign_code_reference
 from lifecycles.experiments import ExperimentLifeCycle
@@ -24,11 +24,8 @@ from signals.tags import set_tags
 _logger = logging.getLogger('polyaxon.signals.experiments')
 
 
-@receiver(pre_save, sender=Experiment, dispatch_uid="experiment_pre_save")
-@ignore_updates_pre
-@ignore_raw
-def experiment_pre_save(sender, **kwargs):
-    instance = kwargs['instance']
+def set_experiment_defaults(instance):
+    """Set the values derived from the specification, used as well by bulk creations."""
     # Check if declarations need to be set
     if not instance.declarations and instance.specification:
         instance.declarations = instance.specification.declarations
@@ -36,9 +33,17 @@ def experiment_pre_save(sender, **kwargs):
     set_persistence(instance=instance)
     set_outputs(instance=instance)
     set_outputs_refs(instance=instance)
-    set_name(instance=instance, query=Experiment.all)
     set_backend(instance=instance, default_backend=ExperimentBackend.NATIVE)
     set_framework(instance=instance)
+
+
+@receiver(pre_save, sender=Experiment, dispatch_uid="experiment_pre_save")
+@ignore_updates_pre
+@ignore_raw
+def experiment_pre_save(sender, **kwargs):
+    instance = kwargs['instance']
+    set_experiment_defaults(instance=instance)
+    set_name(instance=instance, query=Experiment.all)
     if not instance.specification or not instance.specification.build:
         return
 
@@ -82,5 +87,6 @@ def experiment_metric_post_save(sender, **kwargs):
     experiment.last_metric = update_metric(last_metrics=experiment.last_metric,
                                            metrics=instance.values)
     experiment.save(update_fields=['last_metric'])
+    ExperimentMetricSeries.add_metrics(experiment_id=experiment.id, metrics=[instance])
     auditor.record(event_type=EXPERIMENT_NEW_METRIC,
                    instance=experiment)
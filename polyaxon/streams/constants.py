@@ -2,3 +2,8 @@ SOCKET_SLEEP = 2
 MAX_RETRIES = 7
 RESOURCES_CHECK = 7
 CHECK_DELAY = 5
+LOG_TAIL_BUFFER_SIZE = 200
+LOG_QUEUE_SIZE = 5000
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.5
+DB_POOL_SIZE = 10
@@ -0,0 +1,109 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.db import close_old_connections
+
+from streams.constants import DB_POOL_SIZE, SOCKET_SLEEP
+from streams.logger import logger
+
+_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE)
+
+
+def _run(fn, *args, **kwargs):
+    # Connections are kept per thread, the pool bounds the number of connections
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_db(fn, *args, **kwargs):
+    """Run a blocking function accessing the database in the streams thread pool."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_executor, partial(_run, fn, *args, **kwargs))
+
+
+def get_last_status(model, instance_id):
+    return model.objects.filter(id=instance_id).values_list('status__status', flat=True).first()
+
+
+class StatusPoller(object):
+    """Polls the last status of an instance once for all the sockets watching it.
+
+    Each subscriber gets a queue of the status changes, starting with the current status.
+    """
+
+    def __init__(self, model, instance_id):
+        self.model = model
+        self.instance_id = instance_id
+        self.status = None
+        self.subscribers = set()
+        self._task = None
+
+    @property
+    def is_done(self):
+        return self.model.STATUSES.is_done(self.status)
+
+    def subscribe(self):
+        queue = asyncio.Queue()
+        if self.status is not None:
+            queue.put_nowait(self.status)
+        self.subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._poll())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers:
+            self.stop()
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def _poll(self):
+        while not self.is_done:
+            try:
+                status = await run_db(get_last_status, self.model, self.instance_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning('Could not get the status of `%s` `%s`: %s',
+                               self.model.__name__, self.instance_id, e)
+                status = self.status
+            if status != self.status:
+                self.status = status
+                for queue in self.subscribers:
+                    queue.put_nowait(status)
+            if not self.is_done:
+                await asyncio.sleep(SOCKET_SLEEP)
+
+
+class StatusPollerManager(object):
+    """Keeps one `StatusPoller` per instance while it has subscribers."""
+
+    def __init__(self):
+        self.pollers = {}
+
+    def subscribe(self, instance):
+        key = (instance._meta.label, instance.id)  # pylint:disable=protected-access
+        poller = self.pollers.get(key)
+        if poller is None:
+            poller = StatusPoller(model=instance.__class__, instance_id=instance.id)
+            self.pollers[key] = poller
+        return poller, poller.subscribe()
+
+    def unsubscribe(self, poller, queue):
+        poller.unsubscribe(queue)
+        key = (poller.model._meta.label, poller.instance_id)  # pylint:disable=protected-access
+        if not poller.subscribers and self.pollers.get(key) is poller:
+            self.pollers.pop(key, None)
+
+    def stop(self):
+        for poller in self.pollers.values():
+            poller.stop()
+        self.pollers = {}
@@ -0,0 +1,134 @@
+import asyncio
+
+from collections import deque
+
+from kubernetes_asyncio import client, config
+
+from logs_handlers.log_queries.base import process_log_line
+from streams.constants import LOG_QUEUE_SIZE, LOG_TAIL_BUFFER_SIZE
+from streams.logger import logger
+
+
+class PodLogTail(object):
+    """A single upstream log stream of a pod's container, fanned out to all its subscribers.
+
+    Each subscriber gets its own bounded queue, late subscribers receive first
+    the last `buffer_size` lines, and the stream ends with a `None` line.
+    When a subscriber falls behind its oldest lines are dropped,
+    so that a slow socket never blocks the tail or the other subscribers.
+    """
+
+    def __init__(self,
+                 k8s_api,
+                 pod_id,
+                 namespace,
+                 container,
+                 task_type=None,
+                 task_idx=None,
+                 buffer_size=LOG_TAIL_BUFFER_SIZE):
+        self.k8s_api = k8s_api
+        self.pod_id = pod_id
+        self.namespace = namespace
+        self.container = container
+        self.task_type = task_type
+        self.task_idx = task_idx
+        self.buffer = deque(maxlen=buffer_size)
+        self.subscribers = set()
+        self.is_done = False
+        self._task = None
+
+    @staticmethod
+    def put(queue, log_line):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(log_line)
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        for log_line in self.buffer:
+            self.put(queue, log_line)
+        self.subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._tail())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers:
+            self.stop()
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def publish(self, log_line):
+        self.buffer.append(log_line)
+        for queue in self.subscribers:
+            self.put(queue, log_line)
+
+    async def _tail(self):
+        try:
+            resp = await self.k8s_api.read_namespaced_pod_log(self.pod_id,
+                                                              self.namespace,
+                                                              container=self.container,
+                                                              follow=True,
+                                                              _preload_content=False,
+                                                              timestamps=True)
+            while True:
+                try:
+                    log_line = await resp.content.readline()
+                except asyncio.TimeoutError:
+                    log_line = None
+                if not log_line:
+                    break
+                self.publish(process_log_line(log_line=log_line.decode('utf-8'),
+                                              task_type=self.task_type,
+                                              task_idx=self.task_idx))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning('Could not tail the logs of pod `%s`: %s', self.pod_id, e)
+        finally:
+            self.is_done = True
+            for queue in self.subscribers:
+                self.put(queue, None)
+
+
+class PodLogTailManager(object):
+    """Keeps one `PodLogTail` per (namespace, pod, container) while it has subscribers."""
+
+    def __init__(self):
+        self.tails = {}
+        self._k8s_api = None
+
+    @property
+    def k8s_api(self):
+        if self._k8s_api is None:
+            config.load_incluster_config()
+            self._k8s_api = client.CoreV1Api()
+        return self._k8s_api
+
+    def subscribe(self, pod_id, namespace, container, task_type=None, task_idx=None):
+        key = (namespace, pod_id, container)
+        log_tail = self.tails.get(key)
+        if log_tail is None or log_tail.is_done:
+            log_tail = PodLogTail(k8s_api=self.k8s_api,
+                                  pod_id=pod_id,
+                                  namespace=namespace,
+                                  container=container,
+                                  task_type=task_type,
+                                  task_idx=task_idx)
+            self.tails[key] = log_tail
+        return log_tail, log_tail.subscribe()
+
+    def unsubscribe(self, log_tail, queue):
+        log_tail.unsubscribe(queue)
+        key = (log_tail.namespace, log_tail.pod_id, log_tail.container)
+        if not log_tail.subscribers and self.tails.get(key) is log_tail:
+            logger.info('Stopping the log tail of pod `%s`', log_tail.pod_id)
+            self.tails.pop(key, None)
+
+    def stop(self):
+        for log_tail in self.tails.values():
+            log_tail.stop()
+        self.tails = {}
@@ -14,29 +14,32 @@ from events.registry.experiment_job import (
 from options.registry.k8s import K8S_NAMESPACE
 from streams.authentication import authorized
 from streams.constants import CHECK_DELAY, RESOURCES_CHECK, SOCKET_SLEEP
+from streams.data_access import run_db
 from streams.logger import logger
 from streams.resources.logs import log_job
 from streams.resources.utils import get_error_message
-from streams.socket_manager import SocketManager
+from streams.socket_manager import ResourcesSocketManager
 from streams.validation.experiment_job import validate_experiment_job
 
 
 @authorized()
 async def experiment_job_resources(request, ws, username, project_name, experiment_id, job_id):
-    job, _, message = validate_experiment_job(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id,
-                                              job_id=job_id)
+    job, _, message = await run_db(validate_experiment_job,
+                                   request=request,
+                                   username=username,
+                                   project_name=project_name,
+                                   experiment_id=experiment_id,
+                                   job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
     job_uuid = job.uuid.hex
     job_name = '{}.{}'.format(job.role, job.id)
-    auditor.record(event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
-                   instance=job,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
+                 instance=job,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     if not RedisToStream.is_monitored_job_resources(job_uuid=job_uuid):
         logger.info('Job resources with uuid `%s` is now being monitored', job_name)
@@ -45,7 +48,9 @@ async def experiment_job_resources(request, ws, username, project_name, experime
     if job_uuid in request.app.job_resources_ws_managers:
         ws_manager = request.app.job_resources_ws_managers[job_uuid]
     else:
-        ws_manager = SocketManager()
+        ws_manager = ResourcesSocketManager(
+            get_resources=lambda: RedisToStream.get_latest_job_resources(job=job_uuid,
+                                                                         job_name=job_name))
         request.app.job_resources_ws_managers[job_uuid] = ws_manager
 
     def handle_job_disconnected_ws(ws):
@@ -60,12 +65,12 @@ async def experiment_job_resources(request, ws, username, project_name, experime
     ws_manager.add_socket(ws)
     should_check = 0
     while True:
-        resources = RedisToStream.get_latest_job_resources(job=job_uuid, job_name=job_name)
+        resources = ws_manager.get_latest_resources()
         should_check += 1
 
         # After trying a couple of time, we must check the status of the job
         if should_check > RESOURCES_CHECK:
-            job.refresh_from_db()
+            await run_db(job.refresh_from_db)
             if job.is_done:
                 logger.info('removing all socket because the job `%s` is done', job_name)
                 ws_manager.ws = set([])
@@ -90,11 +95,12 @@ async def experiment_job_resources(request, ws, username, project_name, experime
 
 @authorized()
 async def experiment_job_logs_v2(request, ws, username, project_name, experiment_id, job_id):
-    job, experiment, message = validate_experiment_job(request=request,
-                                                       username=username,
-                                                       project_name=project_name,
-                                                       experiment_id=experiment_id,
-                                                       job_id=job_id)
+    job, experiment, message = await run_db(validate_experiment_job,
+                                            request=request,
+                                            username=username,
+                                            project_name=project_name,
+                                            experiment_id=experiment_id,
+                                            job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
@@ -104,10 +110,11 @@ async def experiment_job_logs_v2(request, ws, username, project_name, experiment
     container_job_name = get_experiment_job_container_name(backend=experiment.backend,
                                                            framework=experiment.framework)
 
-    auditor.record(event_type=EXPERIMENT_JOB_LOGS_VIEWED,
-                   instance=job,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_JOB_LOGS_VIEWED,
+                 instance=job,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     # Stream logs
     await log_job(request=request,
@@ -11,27 +11,30 @@ from events.registry.experiment import EXPERIMENT_LOGS_VIEWED, EXPERIMENT_RESOUR
 from options.registry.k8s import K8S_NAMESPACE
 from streams.authentication import authorized
 from streams.constants import CHECK_DELAY, RESOURCES_CHECK, SOCKET_SLEEP
+from streams.data_access import run_db
 from streams.logger import logger
 from streams.resources.logs import log_experiment
 from streams.resources.utils import get_error_message
-from streams.socket_manager import SocketManager
+from streams.socket_manager import ResourcesSocketManager
 from streams.validation.experiment import validate_experiment
 
 
 @authorized()
 async def experiment_resources(request, ws, username, project_name, experiment_id):
-    experiment, message = validate_experiment(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id)
+    experiment, message = await run_db(validate_experiment,
+                                       request=request,
+                                       username=username,
+                                       project_name=project_name,
+                                       experiment_id=experiment_id)
     if experiment is None:
         await ws.send(get_error_message(message))
         return
     experiment_uuid = experiment.uuid.hex
-    auditor.record(event_type=EXPERIMENT_RESOURCES_VIEWED,
-                   instance=experiment,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_RESOURCES_VIEWED,
+                 instance=experiment,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     if not RedisToStream.is_monitored_experiment_resources(experiment_uuid=experiment_uuid):
         logger.info('Experiment resource with uuid `%s` is now being monitored', experiment_uuid)
@@ -40,8 +43,16 @@ async def experiment_resources(request, ws, username, project_name, experiment_i
     if experiment_uuid in request.app.experiment_resources_ws_managers:
         ws_manager = request.app.experiment_resources_ws_managers[experiment_uuid]
     else:
-        ws_manager = SocketManager()
-        request.app.experiment_resources_ws_managers[experiment_uuid] = ws_manager
+        jobs = []
+        for job in await run_db(list, experiment.jobs.values('uuid', 'role', 'id')):
+            job['uuid'] = job['uuid'].hex
+            job['name'] = '{}.{}'.format(job.pop('role'), job.pop('id'))
+            jobs.append(job)
+        # Another socket could have created the manager while the jobs were fetched
+        ws_manager = request.app.experiment_resources_ws_managers.setdefault(
+            experiment_uuid,
+            ResourcesSocketManager(
+                get_resources=lambda: RedisToStream.get_latest_experiment_resources(jobs)))
 
     def handle_experiment_disconnected_ws(ws):
         ws_manager.remove_sockets(ws)
@@ -52,20 +63,15 @@ async def experiment_resources(request, ws, username, project_name, experiment_i
 
         logger.info('Quitting resources socket for uuid %s', experiment_uuid)
 
-    jobs = []
-    for job in experiment.jobs.values('uuid', 'role', 'id'):
-        job['uuid'] = job['uuid'].hex
-        job['name'] = '{}.{}'.format(job.pop('role'), job.pop('id'))
-        jobs.append(job)
     ws_manager.add_socket(ws)
     should_check = 0
     while True:
-        resources = RedisToStream.get_latest_experiment_resources(jobs)
+        resources = ws_manager.get_latest_resources()
         should_check += 1
 
         # After trying a couple of time, we must check the status of the experiment
         if should_check > RESOURCES_CHECK:
-            experiment.refresh_from_db()
+            await run_db(experiment.refresh_from_db)
             if experiment.is_done:
                 logger.info(
                     'removing all socket because the experiment `%s` is done', experiment_uuid)
@@ -92,18 +98,20 @@ async def experiment_resources(request, ws, username, project_name, experiment_i
 
 @authorized()
 async def experiment_logs_v2(request, ws, username, project_name, experiment_id):
-    experiment, message = validate_experiment(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id)
+    experiment, message = await run_db(validate_experiment,
+                                       request=request,
+                                       username=username,
+                                       project_name=project_name,
+                                       experiment_id=experiment_id)
     if experiment is None:
         await ws.send(get_error_message(message))
         return
 
-    auditor.record(event_type=EXPERIMENT_LOGS_VIEWED,
-                   instance=experiment,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_LOGS_VIEWED,
+                 instance=experiment,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     container_job_name = get_experiment_job_container_name(backend=experiment.backend,
                                                            framework=experiment.framework)
@@ -5,6 +5,7 @@ from events.registry.job import JOB_LOGS_VIEWED
 from options.registry.container_names import CONTAINER_NAME_JOBS
 from options.registry.k8s import K8S_NAMESPACE
 from streams.authentication import authorized
+from streams.data_access import run_db
 from streams.resources.logs import log_job
 from streams.resources.utils import get_error_message
 from streams.validation.job import validate_job
@@ -12,7 +13,8 @@ from streams.validation.job import validate_job
 
 @authorized()
 async def job_logs_v2(request, ws, username, project_name, job_id):
-    job, message = validate_job(request=request,
+    job, message = await run_db(validate_job,
+                                request=request,
                                 username=username,
                                 project_name=project_name,
                                 job_id=job_id)
@@ -22,10 +24,11 @@ async def job_logs_v2(request, ws, username, project_name, job_id):
 
     pod_id = job.pod_id
 
-    auditor.record(event_type=JOB_LOGS_VIEWED,
-                   instance=job,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=JOB_LOGS_VIEWED,
+                 instance=job,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     # Stream logs
     await log_job(request=request,
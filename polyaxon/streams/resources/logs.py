@@ -1,16 +1,40 @@
 import asyncio
 import json
 
-from kubernetes_asyncio import client, config
-
 from lifecycles.experiments import ExperimentLifeCycle
 from lifecycles.jobs import JobLifeCycle
-from logs_handlers.log_queries.base import process_log_line
-from streams.constants import SOCKET_SLEEP
-from streams.resources.utils import get_status_message, notify, notify_ws, should_disconnect
+from streams.constants import LOG_BATCH_SIZE, LOG_FLUSH_INTERVAL, SOCKET_SLEEP
+from streams.data_access import run_db
+from streams.resources.utils import get_status_message, notify_ws, should_disconnect
 from streams.socket_manager import SocketManager
 
 
+async def stream_statuses(request, ws, ws_manager, instance):
+    """Notify the socket of the status changes until the instance is running or done.
+
+    Returns the last status, or None if the socket was disconnected.
+    """
+    lifecycle = instance.STATUSES
+    status_pollers = request.app.status_pollers
+    poller, queue = status_pollers.subscribe(instance=instance)
+    try:
+        while True:
+            try:
+                status = await asyncio.wait_for(queue.get(), timeout=SOCKET_SLEEP)
+            except asyncio.TimeoutError:
+                # Just to check if connection closed
+                if should_disconnect(ws=ws, ws_manager=ws_manager):
+                    return None
+                continue
+            await notify_ws(ws=ws, message=get_status_message(status))
+            if status == lifecycle.RUNNING or lifecycle.is_done(status):
+                return status
+            if should_disconnect(ws=ws, ws_manager=ws_manager):
+                return None
+    finally:
+        status_pollers.unsubscribe(poller=poller, queue=queue)
+
+
 async def log_job(request, ws, job, pod_id, namespace, container):
     job_uuid = job.uuid.hex
     if job_uuid in request.app.job_logs_ws_managers:
@@ -22,23 +46,15 @@ async def log_job(request, ws, job, pod_id, namespace, container):
     ws_manager.add_socket(ws)
 
     # Stream phase changes
-    status = None
-    while status != JobLifeCycle.RUNNING and not JobLifeCycle.is_done(status):
-        job.refresh_from_db()
-        if status != job.last_status:
-            status = job.last_status
-            await notify_ws(ws=ws, message=get_status_message(status))
-            if should_disconnect(ws=ws, ws_manager=ws_manager):
-                return
-        await asyncio.sleep(SOCKET_SLEEP)
+    status = await stream_statuses(request=request, ws=ws, ws_manager=ws_manager, instance=job)
+    if status is None:
+        return
 
     if JobLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
         return
 
-    config.load_incluster_config()
-    k8s_api = client.CoreV1Api()
-    await log_job_pod(k8s_api=k8s_api,
+    await log_job_pod(request=request,
                       ws=ws,
                       ws_manager=ws_manager,
                       pod_id=pod_id,
@@ -57,27 +73,22 @@ async def log_experiment(request, ws, experiment, namespace, container):
     ws_manager.add_socket(ws)
 
     # Stream phase changes
-    status = None
-    while status != ExperimentLifeCycle.RUNNING and not ExperimentLifeCycle.is_done(status):
-        experiment.refresh_from_db()
-        if status != experiment.last_status:
-            status = experiment.last_status
-            await notify_ws(ws=ws, message=get_status_message(status))
-            if should_disconnect(ws=ws, ws_manager=ws_manager):
-                return
-        await asyncio.sleep(SOCKET_SLEEP)
+    status = await stream_statuses(request=request,
+                                   ws=ws,
+                                   ws_manager=ws_manager,
+                                   instance=experiment)
+    if status is None:
+        return
 
     if ExperimentLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
         return
 
-    config.load_incluster_config()
-    k8s_api = client.CoreV1Api()
     log_requests = []
-    for job in experiment.jobs.all():
+    for job in await run_db(list, experiment.jobs.all()):
         pod_id = job.pod_id
         log_requests.append(
-            log_job_pod(k8s_api=k8s_api,
+            log_job_pod(request=request,
                         ws=ws,
                         ws_manager=ws_manager,
                         pod_id=pod_id,
@@ -88,7 +99,35 @@ async def log_experiment(request, ws, experiment, namespace, container):
     await asyncio.wait(log_requests)
 
 
-async def log_job_pod(k8s_api,
+async def get_log_lines(queue):
+    """Wait for a log line, and then drain the queue for a batch of lines.
+
+    The batch is returned when it reaches `LOG_BATCH_SIZE` lines,
+    or `LOG_FLUSH_INTERVAL` seconds after its first line,
+    with a boolean to indicate if the log stream is done.
+    """
+    loop = asyncio.get_event_loop()
+    log_line = await asyncio.wait_for(queue.get(), timeout=SOCKET_SLEEP)
+    flush_time = loop.time() + LOG_FLUSH_INTERVAL
+    log_lines = []
+    while log_line is not None:
+        log_lines.append(log_line)
+        if len(log_lines) >= LOG_BATCH_SIZE:
+            return log_lines, False
+        if not queue.empty():
+            log_line = queue.get_nowait()
+            continue
+        timeout = flush_time - loop.time()
+        if timeout <= 0:
+            return log_lines, False
+        try:
+            log_line = await asyncio.wait_for(queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return log_lines, False
+    return log_lines, True
+
+
+async def log_job_pod(request,
                       ws,
                       ws_manager,
                       pod_id,
@@ -96,29 +135,26 @@ async def log_job_pod(k8s_api,
                       namespace,
                       task_type=None,
                       task_idx=None):
-    resp = await k8s_api.read_namespaced_pod_log(pod_id,
-                                                 namespace,
-                                                 container=container,
-                                                 follow=True,
-                                                 _preload_content=False,
-                                                 timestamps=True)
-    should_quite = False
-    while True:
-        try:
-            log_line = await resp.content.readline()
-        except asyncio.TimeoutError:
-            log_line = None
-        if not log_line:
-            break
-        log_line = process_log_line(log_line=log_line.decode('utf-8'),
-                                    task_type=task_type,
-                                    task_idx=task_idx)
-        await notify(ws_manager, json.dumps({'log_lines': log_line}))
-
-        if should_disconnect(ws=ws, ws_manager=ws_manager):
-            should_quite = True
-
-        if should_quite:
-            return
-
-        await asyncio.sleep(0.1)
+    """Stream the logs of a pod to the socket, the pod is tailed once for all its viewers."""
+    log_tails = request.app.pod_log_tails
+    log_tail, queue = log_tails.subscribe(pod_id=pod_id,
+                                          namespace=namespace,
+                                          container=container,
+                                          task_type=task_type,
+                                          task_idx=task_idx)
+    try:
+        while True:
+            try:
+                log_lines, is_done = await get_log_lines(queue)
+            except asyncio.TimeoutError:
+                # Just to check if connection closed
+                if should_disconnect(ws=ws, ws_manager=ws_manager):
+                    return
+                continue
+            if log_lines:
+                await notify_ws(ws=ws, message=json.dumps({'log_lines': log_lines}))
+
+            if is_done or should_disconnect(ws=ws, ws_manager=ws_manager):
+                return
+    finally:
+        log_tails.unsubscribe(log_tail=log_tail, queue=queue)
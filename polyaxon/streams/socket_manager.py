@@ -1,3 +1,10 @@
+import time
+
+from typing import Any, Callable
+
+from streams.constants import SOCKET_SLEEP
+
+
 class SocketManager(object):
     def __init__(self):
         self.ws = set()
@@ -9,3 +16,24 @@ class SocketManager(object):
         if not isinstance(disconnected_ws, set):
             disconnected_ws = {disconnected_ws, }
         self.ws -= disconnected_ws
+
+
+class ResourcesSocketManager(SocketManager):
+    """Shares the latest resources of an instance between all its sockets.
+
+    The resources are read at most once every `ttl` seconds,
+    and are kept serialized, so that every viewer sends the same snapshot.
+    """
+
+    def __init__(self, get_resources: Callable[[], Any], ttl: float = SOCKET_SLEEP):
+        super().__init__()
+        self.get_resources = get_resources
+        self.ttl = ttl
+        self._resources = None
+        self._expiry = 0
+
+    def get_latest_resources(self) -> Any:
+        if self._expiry <= time.monotonic():
+            self._resources = self.get_resources()
+            self._expiry = time.monotonic() + self.ttl
+        return self._resources
@@ -15,6 +15,8 @@ def validate_experiment_job(request, username, project_name, experiment_id, job_
         job = ExperimentJob.objects.get(experiment=experiment, id=job_id)
     except (ExperimentJob.DoesNotExist, ValidationError):
         return None, None, 'Experiment was not found'
+    # Avoid querying the experiment again when accessing the job's pod id
+    job.experiment = experiment
     if job.is_done:
         return None, 'Experiment job is not running, current status: {}'.format(
             job.last_status
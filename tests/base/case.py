@@ -27,7 +27,7 @@ class BaseTest(TestCase):
     def setUp(self):
         # Force tasks autodiscover
         from scheduler import tasks  # noqa
-        from hpsearch.tasks import bo, grid, health, hyperband, random  # noqa
+        from hpsearch.tasks import asha, bo, grid, health, hyperband, random  # noqa
         from pipelines import health, tasks  # noqa
         from operations import tasks  # noqa
         from crons import tasks  # noqa
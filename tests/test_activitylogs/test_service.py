@@ -1,13 +1,20 @@
 # pylint:disable=ungrouped-imports
 import uuid
 
+from unittest.mock import patch
+
 import pytest
 
+from django.db import IntegrityError
+
 import activitylogs
 
 from db.models.activitylogs import ActivityLog
-from events.registry.experiment import EXPERIMENT_DELETED_TRIGGERED
-from events.registry.user import USER_ACTIVATED
+from events.registry.experiment import (
+    EXPERIMENT_DELETED_TRIGGERED,
+    ExperimentDeletedTriggeredEvent
+)
+from events.registry.user import USER_ACTIVATED, UserActivatedEvent
 from factories.factory_experiments import ExperimentFactory
 from factories.factory_users import UserFactory
 from tests.base.case import BaseTest
@@ -46,3 +53,53 @@ class ActivityLogsTest(BaseTest):
         assert activity.event_type == EXPERIMENT_DELETED_TRIGGERED
         assert activity.content_object == self.experiment
         assert activity.actor == self.admin
+
+    def test_record_many_creates_activities_in_bulk(self):
+        assert ActivityLog.objects.count() == 0
+        events = [
+            UserActivatedEvent.from_instance(self.user,
+                                             ref_id=uuid.uuid4(),
+                                             actor_id=self.admin.id,
+                                             actor_name=self.admin.username),
+            ExperimentDeletedTriggeredEvent.from_instance(self.experiment,
+                                                          ref_id=uuid.uuid4(),
+                                                          actor_id=self.admin.id,
+                                                          actor_name=self.admin.username),
+        ]
+        activitylogs.record_many(events_data=[
+            event.serialize(dumps=False, include_instance_info=True) for event in events])
+
+        assert ActivityLog.objects.count() == 2
+        activities = ActivityLog.objects.order_by('id')
+        assert [a.event_type for a in activities] == [USER_ACTIVATED,
+                                                      EXPERIMENT_DELETED_TRIGGERED]
+        assert [a.content_object for a in activities] == [self.user, self.experiment]
+        assert all(a.actor == self.admin for a in activities)
+
+    def test_record_many_falls_back_to_single_inserts(self):
+        events = [
+            UserActivatedEvent.from_instance(self.user,
+                                             ref_id=uuid.uuid4(),
+                                             actor_id=self.admin.id,
+                                             actor_name=self.admin.username),
+            ExperimentDeletedTriggeredEvent.from_instance(self.experiment,
+                                                          ref_id=uuid.uuid4(),
+                                                          actor_id=self.admin.id,
+                                                          actor_name=self.admin.username),
+        ]
+        save = ActivityLog.save
+
+        def save_activity(activity, *args, **kwargs):
+            if activity.event_type == USER_ACTIVATED:
+                raise IntegrityError
+            save(activity, *args, **kwargs)
+
+        with patch.object(ActivityLog.objects, 'bulk_create', side_effect=IntegrityError):
+            with patch.object(ActivityLog, 'save', autospec=True, side_effect=save_activity):
+                activitylogs.record_many(events_data=[
+                    event.serialize(dumps=False, include_instance_info=True)
+                    for event in events])
+
+        # Only the failing activity is skipped
+        assert list(ActivityLog.objects.values_list('event_type', flat=True)) == [
+            EXPERIMENT_DELETED_TRIGGERED]
@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from auditor.buffer import EventsBuffer
+from tests.base.case import BaseTest
+
+
+@pytest.mark.auditor_mark
+class AuditorBufferTest(BaseTest):
+    def test_flushes_when_batch_size_is_reached(self):
+        flush_events = MagicMock()
+        buffer = EventsBuffer(flush_events=flush_events, batch_size=3, interval=60)
+        buffer.add({'type': 'a'})
+        buffer.add({'type': 'b'})
+        assert flush_events.call_count == 0
+        assert len(buffer) == 2
+
+        buffer.add({'type': 'c'})
+        assert flush_events.call_count == 1
+        assert flush_events.call_args[0][0] == [{'type': 'a'}, {'type': 'b'}, {'type': 'c'}]
+        assert len(buffer) == 0
+
+    def test_flush_sends_pending_events(self):
+        flush_events = MagicMock()
+        buffer = EventsBuffer(flush_events=flush_events, batch_size=10, interval=60)
+        buffer.flush()
+        assert flush_events.call_count == 0
+
+        buffer.add({'type': 'a'})
+        buffer.flush()
+        assert flush_events.call_count == 1
+        assert flush_events.call_args[0][0] == [{'type': 'a'}]
+        assert buffer._timer is None
@@ -36,6 +36,7 @@ class AuditorExperimentGroupTest(AuditorBaseTest):
             experiment_group_events.EXPERIMENT_GROUP_NEW_STATUS,
             experiment_group_events.EXPERIMENT_GROUP_EXPERIMENTS_VIEWED,
             experiment_group_events.EXPERIMENT_GROUP_ITERATION,
+            experiment_group_events.EXPERIMENT_GROUP_NEW_EXPERIMENTS,
             experiment_group_events.EXPERIMENT_GROUP_RANDOM,
             experiment_group_events.EXPERIMENT_GROUP_GRID,
             experiment_group_events.EXPERIMENT_GROUP_HYPERBAND,
@@ -334,6 +335,24 @@ class AuditorExperimentGroupTest(AuditorBaseTest):
         assert notifier_record.call_count == 0
         assert executor_record.call_count == 1
 
+    @patch('executor.executor_service.ExecutorService.record_event')
+    @patch('notifier.service.NotifierService.record_event')
+    @patch('tracker.service.TrackerService.record_event')
+    @patch('activitylogs.service.ActivityLogService.record_event')
+    def test_experiment_group_new_experiments(self,
+                                              activitylogs_record,
+                                              tracker_record,
+                                              notifier_record,
+                                              executor_record):
+        auditor.record(event_type=experiment_group_events.EXPERIMENT_GROUP_NEW_EXPERIMENTS,
+                       instance=self.experiment_group,
+                       n_experiments=10)
+
+        assert tracker_record.call_count == 1
+        assert activitylogs_record.call_count == 0
+        assert notifier_record.call_count == 0
+        assert executor_record.call_count == 0
+
     @patch('executor.executor_service.ExecutorService.record_event')
     @patch('notifier.service.NotifierService.record_event')
     @patch('tracker.service.TrackerService.record_event')
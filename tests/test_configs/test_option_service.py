@@ -1,8 +1,11 @@
 import pytest
 
+from mock import patch
+
 from django.conf import settings
 
 from conf.cluster_conf_service import ClusterConfService
+from conf.conf_manager import conf_cache_manager
 from conf.exceptions import ConfException
 from conf.service import ConfService
 from db.models.clusters import Cluster
@@ -249,3 +252,55 @@ class TestConfService(BaseTest):
 
         with self.assertRaises(ConfException):
             self.settings_service.delete(key=DummySettingsOption.key)
+
+    def test_get_from_db_is_cached(self):
+        self.db_service.option_manager.subscribe(DummyDBOption)
+        ConfigOption.objects.create(owner=self.owner, key=DummyDBOption.key, value='foo')
+
+        with patch('conf.handlers.cluster_options_handler.ClusterOptionsHandler.get',
+                   return_value='foo') as handler_get:
+            assert self.db_service.get(key=DummyDBOption.key) == 'foo'
+            assert self.db_service.get(key=DummyDBOption.key) == 'foo'
+            assert self.db_service.get(key=DummyDBOption.key, to_dict=True)['value'] == 'foo'
+        assert handler_get.call_count == 1
+
+    def test_get_from_settings_is_not_cached(self):
+        self.settings_service.option_manager.subscribe(DummySettingsOption)
+        settings.FOO_BAR = 'foo'
+        assert self.settings_service.get(key=DummySettingsOption.key) == 'foo'
+        settings.FOO_BAR = 'bar'
+        assert self.settings_service.get(key=DummySettingsOption.key) == 'bar'
+
+    def test_set_and_delete_invalidate_the_cache(self):
+        self.db_service.option_manager.subscribe(DummyDBOption)
+        assert self.db_service.get(key=DummyDBOption.key) is None
+
+        with patch('db.redis.conf_cache.RedisConfCache.publish') as publish:
+            self.db_service.set(key=DummyDBOption.key, value='foo')
+        assert publish.call_count >= 1
+        assert self.db_service.get(key=DummyDBOption.key) == 'foo'
+
+        self.db_service.delete(key=DummyDBOption.key)
+        assert self.db_service.get(key=DummyDBOption.key) is None
+
+    def test_cache_ttl(self):
+        conf_cache_manager.set_to_cache(key=DummyDBOption.key, value='foo', ttl=0)
+        assert conf_cache_manager.is_valid_value(
+            conf_cache_manager.get_from_cache(key=DummyDBOption.key)) is False
+
+        conf_cache_manager.set_to_cache(key=DummyDBOption.key, value='foo', ttl=10)
+        assert conf_cache_manager.get_from_cache(key=DummyDBOption.key) == 'foo'
+
+    def test_cache_clear_namespace(self):
+        conf_cache_manager.set_to_cache(key='FOO:BAR', value='foo')
+        conf_cache_manager.set_to_cache(key='FOO:BAZ', value='foo')
+        conf_cache_manager.set_to_cache(key='MOO:BAR', value='foo')
+        conf_cache_manager.clear_namespace(namespace='FOO', store=OptionStores.DB_OPTION)
+        assert conf_cache_manager.is_valid_value(
+            conf_cache_manager.get_from_cache(key='FOO:BAR')) is False
+        assert conf_cache_manager.is_valid_value(
+            conf_cache_manager.get_from_cache(key='FOO:BAZ')) is False
+        assert conf_cache_manager.get_from_cache(key='MOO:BAR') == 'foo'
+
+        with self.assertRaises(ConfException):
+            conf_cache_manager.clear_namespace(namespace='FOO', store='foo')
@@ -1,5 +1,7 @@
 import pytest
 
+from mock import patch
+
 import conf
 
 from crons.tasks.deletion import (
@@ -11,6 +13,7 @@ from crons.tasks.deletion import (
     delete_archived_projects,
     delete_archived_tensorboard_jobs
 )
+from db.models.bookmarks import Bookmark
 from db.models.build_jobs import BuildJob
 from db.models.experiment_groups import ExperimentGroup
 from db.models.experiments import Experiment
@@ -84,6 +87,33 @@ class TestDeletionCrons(BaseTest):
         # Although the other experiment is archived it's not deleted because of project1 and group1
         assert Experiment.all.count() == 2
 
+    @patch('scheduler.tasks.storage.stores_schedule_logs_deletion.apply_async')
+    @patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async')
+    def test_delete_experiments_in_batches(self, delete_outputs, delete_logs):
+        project = ProjectFactory()
+        experiments = [ExperimentFactory(project=project) for _ in range(3)]
+        for experiment in experiments:
+            experiment.archive()
+        Bookmark.objects.create(user=project.user, content_object=experiments[0])
+        group = ExperimentGroupFactory(project=project)
+        experiment_in_group = ExperimentFactory(project=project, experiment_group=group)
+        experiment_in_group.archive()
+        group.archive()
+
+        conf.set(CLEANING_INTERVALS_ARCHIVES, -10)
+        with patch('auditor.record') as auditor_record:
+            delete_archived_experiments()
+
+        assert Experiment.all.count() == 0
+        assert Bookmark.objects.count() == 0
+        # The runs are deleted without their receivers
+        assert auditor_record.call_count == 0
+        # One task per persistence for the independent experiments
+        assert delete_outputs.call_count == 1
+        assert delete_logs.call_count == 1
+        subpaths = delete_logs.call_args[0][1]['subpaths']
+        assert sorted(subpaths) == sorted(experiment.subpath for experiment in experiments)
+
     def test_delete_jobs(self):
         project1 = ProjectFactory()
         JobFactory(project=project1)
@@ -100,6 +130,26 @@ class TestDeletionCrons(BaseTest):
         # Although the other entity is archived it's not deleted because of project1
         assert Job.all.count() == 1
 
+    @patch('scheduler.tasks.storage.stores_schedule_logs_deletion.apply_async')
+    @patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async')
+    def test_delete_jobs_in_batches(self, delete_outputs, delete_logs):
+        project = ProjectFactory()
+        jobs = [JobFactory(project=project) for _ in range(3)]
+        for job in jobs:
+            job.archive()
+        Bookmark.objects.create(user=project.user, content_object=jobs[0])
+
+        conf.set(CLEANING_INTERVALS_ARCHIVES, -10)
+        with patch('libs.deletion.DELETION_BATCH_SIZE', 2):
+            delete_archived_jobs()
+
+        assert Job.all.count() == 0
+        assert Bookmark.objects.count() == 0
+        assert delete_outputs.call_count == 1
+        assert delete_logs.call_count == 1
+        subpaths = delete_outputs.call_args[0][1]['subpaths']
+        assert sorted(subpaths) == sorted(job.subpath for job in jobs)
+
     def test_delete_build_jobs(self):
         project1 = ProjectFactory()
         BuildJobFactory(project=project1)
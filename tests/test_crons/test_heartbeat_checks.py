@@ -1,8 +1,7 @@
 import pytest
 
-from mock import patch
-
 from crons.tasks.heartbeats import heartbeat_builds, heartbeat_experiments, heartbeat_jobs
+from db.redis.heartbeat import RedisHeartBeat
 from factories.factory_build_jobs import BuildJobFactory, BuildJobStatusFactory
 from factories.factory_experiments import ExperimentFactory, ExperimentStatusFactory
 from factories.factory_jobs import JobFactory, JobStatusFactory
@@ -24,12 +23,23 @@ class TestHeartBeatCrons(BaseTest):
         ExperimentStatusFactory(experiment=experiment4, status=ExperimentLifeCycle.STARTING)
         experiment5 = ExperimentFactory()
         ExperimentStatusFactory(experiment=experiment5, status=ExperimentLifeCycle.RUNNING)
+        experiment6 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment6, status=ExperimentLifeCycle.RUNNING)
+        RedisHeartBeat.experiment_ping(experiment_id=experiment6.id)
 
-        with patch('scheduler.tasks.experiments'
-                   '.experiments_check_heartbeat.apply_async') as mock_fct:
-            heartbeat_experiments()
+        heartbeat_experiments()
 
-        assert mock_fct.call_count == 1
+        statuses = [ExperimentLifeCycle.SCHEDULED,
+                    ExperimentLifeCycle.CREATED,
+                    ExperimentLifeCycle.FAILED,
+                    ExperimentLifeCycle.STARTING,
+                    ExperimentLifeCycle.FAILED,
+                    ExperimentLifeCycle.RUNNING]
+        experiments = [experiment1, experiment2, experiment3,
+                       experiment4, experiment5, experiment6]
+        for experiment, status in zip(experiments, statuses):
+            experiment.refresh_from_db()
+            assert experiment.last_status == status
 
     def test_heartbeat_jobs(self):
         job1 = JobFactory()
@@ -40,11 +50,20 @@ class TestHeartBeatCrons(BaseTest):
         JobStatusFactory(job=job3, status=JobLifeCycle.FAILED)
         job4 = JobFactory()
         JobStatusFactory(job=job4, status=JobLifeCycle.RUNNING)
+        job5 = JobFactory()
+        JobStatusFactory(job=job5, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat.job_ping(job_id=job5.id)
 
-        with patch('scheduler.tasks.jobs.jobs_check_heartbeat.apply_async') as mock_fct:
-            heartbeat_jobs()
+        heartbeat_jobs()
 
-        assert mock_fct.call_count == 1
+        statuses = [JobLifeCycle.SCHEDULED,
+                    JobLifeCycle.CREATED,
+                    JobLifeCycle.FAILED,
+                    JobLifeCycle.FAILED,
+                    JobLifeCycle.RUNNING]
+        for job, status in zip([job1, job2, job3, job4, job5], statuses):
+            job.refresh_from_db()
+            assert job.last_status == status
 
     def test_heartbeat_builds(self):
         build1 = BuildJobFactory()
@@ -55,8 +74,17 @@ class TestHeartBeatCrons(BaseTest):
         BuildJobStatusFactory(job=build3, status=JobLifeCycle.FAILED)
         build4 = BuildJobFactory()
         BuildJobStatusFactory(job=build4, status=JobLifeCycle.RUNNING)
+        build5 = BuildJobFactory()
+        BuildJobStatusFactory(job=build5, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat.build_ping(build_id=build5.id)
 
-        with patch('scheduler.tasks.build_jobs.build_jobs_check_heartbeat.apply_async') as mock_fct:
-            heartbeat_builds()
+        heartbeat_builds()
 
-        assert mock_fct.call_count == 1
+        statuses = [JobLifeCycle.SCHEDULED,
+                    JobLifeCycle.CREATED,
+                    JobLifeCycle.FAILED,
+                    JobLifeCycle.FAILED,
+                    JobLifeCycle.RUNNING]
+        for build, status in zip([build1, build2, build3, build4, build5], statuses):
+            build.refresh_from_db()
+            assert build.last_status == status
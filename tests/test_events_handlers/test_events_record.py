@@ -2,6 +2,10 @@ from unittest.mock import patch
 
 import pytest
 
+from celery.exceptions import Retry
+
+from django.db import IntegrityError
+
 from events_handlers.tasks.record import events_log, events_notify, events_track
 from tests.base.case import BaseTest
 
@@ -25,3 +29,37 @@ class BaseTestEventsHandling(BaseTest):
             events_track(None)
 
         self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_notify_many(self):
+        with patch('auditor.notify_many') as mock_fct:
+            events_notify(events=[{}, {}])
+
+        self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_log_many(self):
+        with patch('auditor.log_many') as mock_fct:
+            events_log(events=[{}, {}])
+
+        self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_track_many(self):
+        with patch('auditor.track_many') as mock_fct:
+            events_track(events=[{}, {}])
+
+        self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_log_retries_only_single_events(self):
+        with patch('auditor.log', side_effect=IntegrityError) as mock_fct:
+            with patch.object(events_log, 'retry', side_effect=Retry) as retry_mock:
+                with self.assertRaises(Retry):
+                    events_log(None)
+
+        self.assertEqual(mock_fct.call_count, 1)
+        self.assertEqual(retry_mock.call_count, 1)
+
+        with patch('auditor.log_many', side_effect=IntegrityError) as mock_fct:
+            with patch.object(events_log, 'retry') as retry_mock:
+                with self.assertRaises(IntegrityError):
+                    events_log(events=[{}, {}])
+
+        self.assertEqual(retry_mock.call_count, 0)
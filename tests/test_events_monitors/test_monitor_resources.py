@@ -0,0 +1,56 @@
+import uuid
+
+import pytest
+
+from docker.errors import APIError
+from mock import MagicMock, patch
+
+from constants.containers import ContainerStatuses
+from monitor_resources import monitor
+from tests.base.case import BaseTest
+
+
+@pytest.mark.monitors_mark
+class TestMonitorResources(BaseTest):
+    @staticmethod
+    def get_container(container_id, stats):
+        container = MagicMock(id=container_id, status=ContainerStatuses.RUNNING)
+        container.name = container_id
+        if isinstance(stats, Exception):
+            container.stats.side_effect = stats
+        else:
+            container.stats.return_value = stats
+        return container
+
+    def test_run_collects_the_other_containers_on_errors(self):
+        stats = {
+            'precpu_stats': {'cpu_usage': {'total_usage': 100}, 'system_cpu_usage': 1000},
+            'cpu_stats': {'cpu_usage': {'total_usage': 200, 'percpu_usage': [100, 100]},
+                          'system_cpu_usage': 2000},
+            'memory_stats': {'usage': 10, 'limit': 100},
+        }
+        containers = {
+            'container1': self.get_container('container1', APIError('error')),
+            'container2': self.get_container('container2', stats),
+            'container3': self.get_container('container3', {}),
+        }
+        jobs = {container_id: (uuid.uuid4().hex, uuid.uuid4().hex)
+                for container_id in containers}
+        docker_client = MagicMock()
+        docker_client.containers.get.side_effect = lambda container_id: containers[container_id]
+
+        with patch.object(monitor, 'docker_client', docker_client), \
+                patch.object(monitor, 'get_gpu_resources', return_value=[]), \
+                patch.object(monitor.RedisJobContainers, 'get_containers',
+                             return_value=list(containers)), \
+                patch.object(monitor.RedisJobContainers, 'get_jobs', return_value=jobs), \
+                patch.object(monitor.RedisToStream, 'get_monitored_resources',
+                             return_value=([job[0] for job in jobs.values()], [])), \
+                patch.object(monitor.RedisToStream,
+                             'set_latest_jobs_resources') as set_latest_jobs_resources:
+            monitor.run(containers={}, node=MagicMock(cpu=2), persist=False)
+
+        assert set_latest_jobs_resources.call_count == 1
+        latest_resources = set_latest_jobs_resources.call_args[0][0]
+        assert list(latest_resources.keys()) == [jobs['container2'][0]]
+        assert latest_resources[jobs['container2'][0]]['container_id'] == 'container2'
@@ -8,6 +8,8 @@ from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.client import MULTIPART_CONTENT
 
+import conf
+
 from constants.urls import API_V1
 from db.managers.deleted import ArchivedManager, LiveManager
 from db.models.build_jobs import BuildJobStatus
@@ -29,21 +31,27 @@ from factories.fixtures import (
     experiment_group_spec_content_hyperband_trigger_reschedule
 )
 from hpsearch.iteration_managers import (
+    ASHAIterationManager,
     BaseIterationManager,
     BOIterationManager,
     HyperbandIterationManager
 )
+from hpsearch.schemas import ASHAIterationConfig
 from hpsearch.search_managers import (
+    ASHASearchManager,
     BOSearchManager,
     GridSearchManager,
     HyperbandSearchManager,
     RandomSearchManager
 )
+from hpsearch.tasks.asha import hp_asha_start
+from hpsearch.tasks.base import create_group_experiments
 from hpsearch.tasks.bo import hp_bo_start
 from hpsearch.tasks.hyperband import hp_hyperband_start
 from lifecycles.experiment_groups import ExperimentGroupLifeCycle
 from lifecycles.experiments import ExperimentLifeCycle
 from lifecycles.jobs import JobLifeCycle
+from options.registry.groups import GROUPS_HYPERBAND_ASYNC
 from scheduler.tasks.experiment_groups import experiments_group_stop_experiments
 from schemas import GroupSpecification, HPTuningConfig, MatrixConfig, SearchAlgorithms
 from tests.base.case import BaseTest
@@ -446,6 +454,26 @@ class TestExperimentGroupModel(BaseTest):
         assert experiment_group.running_experiments.count() == 0
         assert experiment_group.succeeded_experiments.count() == 1
 
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_create_group_experiments_in_bulk(self, _):
+        experiment_group = ExperimentGroupFactory()
+
+        suggestions = [{'lr': 0.01}, {'lr': 0.1}, {'lr': 0.2}]
+        with patch('auditor.record') as auditor_record:
+            experiments = create_group_experiments(experiment_group=experiment_group,
+                                                   suggestions=suggestions)
+
+        assert len(experiments) == 3
+        assert auditor_record.call_count == 1
+        assert auditor_record.call_args[1]['n_experiments'] == 3
+        assert experiment_group.experiments.count() == 3
+        assert [xp.declarations for xp in experiment_group.experiments.order_by('id')] == [
+            {'lr': 0.01}, {'lr': 0.1}, {'lr': 0.2}]
+        for experiment in experiment_group.experiments.all():
+            assert experiment.last_status == ExperimentLifeCycle.CREATED
+            assert experiment.statuses.count() == 1
+            assert experiment.tags == ['fixtures']
+
     @patch('scheduler.dockerizer_scheduler.create_build_job')
     def test_experiment_group_deletion_triggers_stopping_for_running_experiment(self,
                                                                                 create_build_job):
@@ -745,6 +773,112 @@ class TestExperimentGroupModel(BaseTest):
             hp_bo_start(experiment_group.id)
         assert mock_fct1.call_count == 1
 
+    @patch('scheduler.dockerizer_scheduler.create_build_job')
+    def test_asha_creation(self, create_build_job):
+        build = BuildJobFactory()
+        BuildJobStatus.objects.create(status=JobLifeCycle.SUCCEEDED, job=build)
+        create_build_job.return_value = build, True, True
+
+        conf.set(key=GROUPS_HYPERBAND_ASYNC, value=True)
+        with patch('hpsearch.tasks.asha.hp_asha_start.apply_async') as mock_fct:
+            experiment_group = ExperimentGroupFactory(
+                content=experiment_group_spec_content_hyperband)
+
+        assert mock_fct.call_count == 1
+        assert mock_fct.call_args[0][1]['auto_retry'] is True
+        assert experiment_group.is_asha is True
+        assert isinstance(experiment_group.search_manager, ASHASearchManager)
+        assert isinstance(experiment_group.iteration_manager, ASHAIterationManager)
+        assert ExperimentGroupIteration.objects.count() == 1
+        assert ExperimentGroupIteration.objects.last().data['asha'] is True
+        assert isinstance(experiment_group.iteration_config, ASHAIterationConfig)
+        # The concurrency of the group is filled with configs of the bottom rung
+        assert experiment_group.iteration_config.num_suggestions == 2
+        assert experiment_group.experiments.count() == 2
+        rung_resources = experiment_group.search_manager.get_rung_resources(rung=0)
+        for xp in experiment_group.experiments.all():
+            assert xp.declarations['steps'] == rung_resources
+
+        # Running groups keep their algorithm when the option is updated
+        conf.set(key=GROUPS_HYPERBAND_ASYNC, value=False)
+        experiment_group = ExperimentGroup.objects.get(id=experiment_group.id)
+        assert experiment_group.is_asha is True
+        assert isinstance(experiment_group.iteration_config, ASHAIterationConfig)
+
+    @patch('scheduler.dockerizer_scheduler.create_build_job')
+    def test_asha_scheduling(self, create_build_job):
+        build = BuildJobFactory()
+        BuildJobStatus.objects.create(status=JobLifeCycle.SUCCEEDED, job=build)
+        create_build_job.return_value = build, True, True
+
+        conf.set(key=GROUPS_HYPERBAND_ASYNC, value=True)
+        with patch('hpsearch.tasks.asha.hp_asha_start.apply_async') as mock_fct:
+            experiment_group = ExperimentGroupFactory(
+                content=experiment_group_spec_content_hyperband)
+        assert mock_fct.call_count == 1
+        assert experiment_group.non_done_experiments.count() == 2
+
+        # No free slots, the pending experiments are started
+        with patch('hpsearch.tasks.asha.create_suggestions') as mock_fct1:
+            with patch('scheduler.tasks.experiments.experiments_build.apply_async') as mock_fct2:
+                hp_asha_start(experiment_group.id)
+        assert mock_fct1.call_count == 0
+        assert mock_fct2.call_count == 2
+
+        # Mark experiments as done
+        experiment1, experiment2 = list(experiment_group.experiments.order_by('id'))
+        with patch('scheduler.experiment_scheduler.stop_experiment') as _:  # noqa
+            with patch('hpsearch.tasks.asha.hp_asha_start.apply_async') as xp_trigger_start:
+                ExperimentMetric.objects.create(experiment=experiment1, values={'loss': 0.5})
+                ExperimentMetric.objects.create(experiment=experiment2, values={'loss': 0.8})
+                for xp in (experiment1, experiment2):
+                    ExperimentStatusFactory(experiment=xp, status=ExperimentLifeCycle.SUCCEEDED)
+        assert xp_trigger_start.call_count == 2
+
+        # Not enough done experiments to promote, a new config fills the bottom rung
+        GroupChecks(group=experiment_group.id).clear()
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as mock_fct:
+            hp_asha_start(experiment_group.id)
+        assert mock_fct.call_count == 1
+        experiment_group = ExperimentGroup.objects.get(id=experiment_group.id)
+        assert experiment_group.iteration_config.num_suggestions == 3
+        assert experiment_group.iteration_config.promotions == []
+        assert experiment_group.experiments.count() == 3
+
+        # The best config of the bottom rung is promoted
+        experiment3 = experiment_group.experiments.order_by('id').last()
+        with patch('scheduler.experiment_scheduler.stop_experiment') as _:  # noqa
+            with patch('hpsearch.tasks.asha.hp_asha_start.apply_async'):
+                ExperimentMetric.objects.create(experiment=experiment3, values={'loss': 0.6})
+                ExperimentStatusFactory(experiment=experiment3,
+                                        status=ExperimentLifeCycle.SUCCEEDED)
+
+        GroupChecks(group=experiment_group.id).clear()
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as mock_fct:
+            hp_asha_start(experiment_group.id)
+        assert mock_fct.call_count == 1
+        experiment_group = ExperimentGroup.objects.get(id=experiment_group.id)
+        iteration_config = experiment_group.iteration_config
+        assert iteration_config.num_suggestions == 3
+        assert iteration_config.promoted_ids == [experiment1.id]
+        promoted_experiment = experiment_group.experiments.get(
+            id=iteration_config.promotions[0][1])
+        assert promoted_experiment.declarations['steps'] == (
+            experiment_group.search_manager.get_rung_resources(rung=1))
+
+        # The group is done once the promoted experiment is done
+        with patch('scheduler.experiment_scheduler.stop_experiment') as _:  # noqa
+            with patch('hpsearch.tasks.asha.hp_asha_start.apply_async'):
+                ExperimentMetric.objects.create(experiment=promoted_experiment,
+                                                values={'loss': 0.4})
+                ExperimentStatusFactory(experiment=promoted_experiment,
+                                        status=ExperimentLifeCycle.SUCCEEDED)
+
+        GroupChecks(group=experiment_group.id).clear()
+        with patch('hpsearch.tasks.base.check_group_experiments_done') as mock_fct:
+            hp_asha_start(experiment_group.id)
+        assert mock_fct.call_count == 1
+
     def test_managers(self):
         assert isinstance(ExperimentGroup.objects, LiveManager)
         assert isinstance(ExperimentGroup.archived, ArchivedManager)
@@ -7,6 +7,7 @@ from factories.fixtures import (
     experiment_group_spec_content_hyperband
 )
 from hpsearch.schemas import (
+    ASHAIterationConfig,
     BaseIterationConfig,
     BOIterationConfig,
     HyperbandIterationConfig,
@@ -115,3 +116,22 @@ class TestBOIterationConfig(BaseTest):
         }
 
         assert BOIterationConfig.from_dict(config).to_dict() == config
+
+
+@pytest.mark.experiment_groups_mark
+class TestASHAIterationConfig(BaseTest):
+    def test_asha_iteration_config(self):
+        config = {
+            'iteration': 0,
+            'num_suggestions': 6,
+            'experiment_ids': [1, 2, 3, 4, 5, 6, 7],
+            'promotions': [[2, 7]],
+            'asha': True,
+        }
+        iteration_config = ASHAIterationConfig.from_dict(config)
+        assert iteration_config.to_dict() == config
+        assert iteration_config.promoted_ids == [2]
+        assert iteration_config.num_suggestions_in_flight == 0
+
+        iteration_config.num_suggestions = 10
+        assert iteration_config.num_suggestions_in_flight == 4
@@ -1,10 +1,13 @@
 # pylint:disable=too-many-lines
 import numpy as np
+import pickle
 
 from unittest.mock import patch
 
 import pytest
 
+from billiard import Pool
+
 from db.models.experiment_groups import ExperimentGroupIteration
 from factories.factory_experiment_groups import ExperimentGroupFactory
 from factories.fixtures import (
@@ -12,17 +15,23 @@ from factories.fixtures import (
     experiment_group_spec_content_early_stopping,
     experiment_group_spec_content_hyperband
 )
-from hpsearch.schemas import BOIterationConfig
+from hpsearch.schemas import ASHAIterationConfig, BOIterationConfig
 from hpsearch.search_managers import (
+    ASHASearchManager,
     BOSearchManager,
     GridSearchManager,
     HyperbandSearchManager,
     RandomSearchManager,
     get_search_algorithm_manager
 )
+from hpsearch.search_managers.bayesian_optimization.acquisition_function import (
+    get_process_pool
+)
 from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
 from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
-from schemas import HPTuningConfig, MatrixConfig
+from hpsearch.search_managers.bayesian_optimization.surrogate import GaussianProcessSurrogate
+from hpsearch.utils import is_asha
+from schemas import HPTuningConfig, MatrixConfig, SearchAlgorithms
 from tests.base.case import BaseTest
 
 
@@ -106,6 +115,65 @@ class TestGridSearchManager(BaseTest):
 
         assert to_numpy_mock.call_count == 2
 
+    def test_get_n_suggestions(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'grid_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_space().size == 3 * 5 * 4
+        assert manager.get_n_suggestions() == 10
+
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_n_suggestions() == 15
+
+    def test_grid_space_indexing(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        space = manager.get_space()
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == space.size
+        for index, suggestion in enumerate(suggestions):
+            assert space.get_suggestion(index) == suggestion
+        assert space.get_suggestion(-1) == suggestions[-1]
+        with self.assertRaises(IndexError):
+            space.get_suggestion(space.size)
+
+        assert space.get_page(page=2, page_size=7) == suggestions[14:21]
+        assert list(manager.iter_suggestions(offset=50, limit=20)) == suggestions[50:]
+
+    def test_iter_suggestions_respects_n_experiments(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'grid_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert len(list(manager.iter_suggestions(offset=8, limit=5))) == 2
+        assert list(manager.iter_suggestions(offset=10)) == []
+
 
 @pytest.mark.experiment_groups_mark
 class TestRandomSearchManager(BaseTest):
@@ -194,6 +262,82 @@ class TestRandomSearchManager(BaseTest):
 
         assert sample_mock.call_count == 4
 
+    def test_get_suggestions_with_pvalues_in_small_space(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 30},
+            'matrix': {
+                'feature1': {'pvalues': [(1, 0.99), (2, 0.01)]},
+                'feature2': {'range': [1, 51, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 30
+        # The weights of the pvalues are applied
+        assert len([s for s in suggestions if s['feature1'] == 1]) >= 25
+
+    def test_get_suggestions_with_list_values(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [[64, 32], [128, 64]]},
+                'feature2': {'range': [1, 50, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 10
+        for suggestion in suggestions:
+            assert suggestion['feature1'] in [[64, 32], [128, 64]]
+
+    def test_get_suggestions_are_unique(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 40},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3, 4, 5, 6, 7]},
+                'feature2': {'range': [1, 11, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 40
+        assert len({tuple(sorted(s.items())) for s in suggestions}) == 40
+
+        # Close to the exhaustion of the space
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 69},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3, 4, 5, 6, 7]},
+                'feature2': {'range': [1, 11, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 69
+        assert len({tuple(sorted(s.items())) for s in suggestions}) == 69
+
+    def test_get_suggestions_large_batches(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 10000},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'uniform': [0, 1]},
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        with patch.object(MatrixConfig, 'sample', wraps=MatrixConfig.sample,
+                          autospec=True) as sample_mock:
+            suggestions = manager.get_suggestions()
+
+        assert len(suggestions) == 10000
+        # One draw per hyperparam and per batch, not per suggestion
+        assert sample_mock.call_count < 10
+
 
 @pytest.mark.experiment_groups_mark
 class TestHyperbandSearchManager(BaseTest):
@@ -649,6 +793,121 @@ class TestHyperbandSearchManager(BaseTest):
             assert 'feature4' in suggestion
 
 
+@pytest.mark.experiment_groups_mark
+class TestASHASearchManager(BaseTest):
+    DISABLE_RUNNER = True
+    DISABLE_EXECUTOR = True
+    DISABLE_AUDITOR = True
+
+    def setUp(self):
+        super().setUp()
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 4,
+            'hyperband': {
+                'max_iter': 81,
+                'eta': 3,
+                'resource': {'name': 'size', 'type': 'int'},
+                'resume': False,
+                'metric': {'name': 'loss', 'optimization': 'minimize'}
+            },
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]},
+                'feature4': {'range': [1, 5, 1]}
+            }
+        })
+        self.manager = ASHASearchManager(hptuning_config=hptuning_config)
+
+    def test_get_search_manager(self):
+        manager = get_search_algorithm_manager(self.manager.hptuning_config, asha=True)
+        assert isinstance(manager, ASHASearchManager)
+
+        manager = get_search_algorithm_manager(self.manager.hptuning_config)
+        assert isinstance(manager, HyperbandSearchManager)
+        assert not isinstance(manager, ASHASearchManager)
+
+    def test_is_asha(self):
+        search_algorithm = self.manager.hptuning_config.search_algorithm
+        # The cluster option is read when the group starts
+        with patch('hpsearch.utils.conf.get') as conf_mock:
+            conf_mock.return_value = True
+            assert is_asha(search_algorithm) is True
+            conf_mock.return_value = False
+            assert is_asha(search_algorithm) is False
+            assert is_asha(SearchAlgorithms.RANDOM) is False
+        assert conf_mock.call_count == 2
+
+        # Afterwards, the choice is read from the group's iteration
+        asha_iteration = ASHAIterationConfig(iteration=0,
+                                             num_suggestions=0,
+                                             experiment_ids=[],
+                                             promotions=[]).to_dict()
+        assert asha_iteration['asha'] is True
+        hyperband_iteration = {'iteration': 0, 'num_suggestions': 0, 'bracket_iteration': 0}
+        with patch('hpsearch.utils.conf.get') as conf_mock:
+            conf_mock.return_value = False
+            assert is_asha(search_algorithm, iteration=asha_iteration) is True
+            conf_mock.return_value = True
+            assert is_asha(search_algorithm, iteration=hyperband_iteration) is False
+            # The flag is read, not inferred from the iteration's content
+            assert is_asha(search_algorithm,
+                           iteration=dict(hyperband_iteration, promotions=[])) is False
+        assert conf_mock.call_count == 0
+
+    def test_rungs(self):
+        assert self.manager.n_rungs == 5
+        assert self.manager.max_configs == 81
+        assert [self.manager.get_rung_resources(rung=i) for i in range(5)] == [1, 3, 9, 27, 81]
+        assert [self.manager.get_rung(resources=r) for r in [1, 3, 9, 27, 81]] == [0, 1, 2, 3, 4]
+
+    def test_get_suggestions(self):
+        suggestions = self.manager.get_suggestions()
+        assert len(suggestions) == 4
+        for suggestion in suggestions:
+            assert suggestion['size'] == 1
+
+        iteration_config = ASHAIterationConfig(iteration=0, num_suggestions=79)
+        assert len(self.manager.get_suggestions(iteration_config=iteration_config,
+                                                n_suggestions=4)) == 2
+        iteration_config = ASHAIterationConfig(iteration=0, num_suggestions=81)
+        assert self.manager.get_suggestions(iteration_config=iteration_config) == []
+
+    def test_get_promotions(self):
+        # Not enough results to promote from the bottom rung
+        rungs_metrics = {0: [(1, 0.5), (2, 0.4)]}
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[],
+                                           n_promotions=2) == []
+
+        # The best of 3 is promoted without waiting for the rest of the rung
+        rungs_metrics = {0: [(1, 0.5), (2, 0.4), (3, 0.9)]}
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[],
+                                           n_promotions=2) == [(2, 1)]
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[2],
+                                           n_promotions=2) == []
+
+        # Top rungs first
+        rungs_metrics = {
+            0: [(1, 0.5), (2, 0.4), (3, 0.9), (4, 0.1), (5, 0.3), (6, 0.8)],
+            1: [(7, 0.3), (8, 0.2), (9, 0.1)],
+        }
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[2],
+                                           n_promotions=2) == [(9, 2), (4, 1)]
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[2],
+                                           n_promotions=1) == [(9, 2)]
+
+        # Top rung is never promoted
+        rungs_metrics = {4: [(1, 0.5), (2, 0.4), (3, 0.9)]}
+        assert self.manager.get_promotions(rungs_metrics=rungs_metrics,
+                                           promoted_ids=[],
+                                           n_promotions=2) == []
+
+
 @pytest.mark.experiment_groups_mark
 class TestBOSearchManager(BaseTest):
     DISABLE_RUNNER = True
@@ -732,10 +991,12 @@ class TestBOSearchManager(BaseTest):
             'experiments_configs': [[4, {'feature1': 2, 'feature2': 1.5, 'feature3': 4}]],
             'experiments_metrics': [[4, 4]]
         })
-        with patch.object(BOOptimizer, 'get_suggestion') as get_suggestion_mock:
+        with patch.object(BOOptimizer, 'get_suggestions') as get_suggestions_mock:
             self.manager1.get_suggestions(iteration_config)
 
-        assert get_suggestion_mock.call_count == 1
+        assert get_suggestions_mock.call_count == 1
+        # One suggestion per concurrent experiment
+        assert get_suggestions_mock.call_args[1]['n_suggestions'] == 2
 
     def test_space_search(self):
         # Space 1
@@ -960,6 +1221,77 @@ class TestBOSearchManager(BaseTest):
         assert 1 <= suggestion['feature4'] <= 5
         assert suggestion['feature5'] in ['a', 'b', 'c']
 
+    def test_optimizer_get_suggestions_batch(self):
+        optimizer = BOOptimizer(hptuning_config=self.manager2.hptuning_config)
+        configs = [
+            {'feature1': 1, 'feature2': 1, 'feature3': 1, 'feature4': 1, 'feature5': 'a'},
+            {'feature1': 2, 'feature2': 1.2, 'feature3': 2, 'feature4': 4, 'feature5': 'b'},
+            {'feature1': 3, 'feature2': 1.3, 'feature3': 3, 'feature4': 3, 'feature5': 'a'}
+        ]
+        metrics = [1, 2, 3]
+        optimizer.add_observations(configs=configs, metrics=metrics)
+        n_observations = optimizer.surrogate.n_observations
+
+        suggestions = optimizer.get_suggestions(n_suggestions=3)
+        assert 1 <= len(suggestions) <= 3
+        for suggestion in suggestions:
+            assert suggestions.count(suggestion) == 1
+            assert suggestion['feature5'] in ['a', 'b', 'c']
+        # Fantasy observations are not added to the persisted surrogate
+        assert optimizer.surrogate.n_observations == n_observations
+
+    @staticmethod
+    def _max_compute_with_processes(hptuning_config):
+        optimizer = BOOptimizer(hptuning_config=hptuning_config)
+        configs = [
+            {'feature1': 1, 'feature2': 1, 'feature3': 1},
+            {'feature1': 2, 'feature2': 1.2, 'feature3': 2},
+            {'feature1': 3, 'feature2': 1.3, 'feature3': 3}
+        ]
+        optimizer.add_observations(configs=configs, metrics=[1, 2, 3])
+        # Only picklable values are sent to the worker processes
+        pickle.dumps(optimizer.surrogate.get_state())
+        with get_process_pool(n_jobs=2) as pool:
+            # No fallback to the sequential optimization
+            assert pool is not None
+            x_max = optimizer.utility_function.max_compute(y_max=optimizer.surrogate.y.max(),
+                                                           bounds=optimizer.space.bounds,
+                                                           n_warmup=25000,
+                                                           n_iter=4,
+                                                           gaussian_process=optimizer.surrogate,
+                                                           pool=pool)
+        bounds = optimizer.space.bounds
+        assert np.all(x_max >= bounds[:, 0])
+        assert np.all(x_max <= bounds[:, 1])
+
+    def test_max_compute_with_processes(self):
+        # The group is not seeded, the regressor uses the global numpy random module
+        assert self.manager1.hptuning_config.seed is None
+        self._max_compute_with_processes(hptuning_config=self.manager1.hptuning_config)
+
+    def test_max_compute_with_processes_seeded(self):
+        hptuning_config = HPTuningConfig.from_dict(
+            dict(self.manager1.hptuning_config.to_dict(), seed=33))
+        self._max_compute_with_processes(hptuning_config=hptuning_config)
+
+    def test_get_suggestions_uses_one_process_pool(self):
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config)
+        configs = [
+            {'feature1': 1, 'feature2': 1, 'feature3': 1},
+            {'feature1': 2, 'feature2': 1.2, 'feature3': 2},
+            {'feature1': 3, 'feature2': 1.3, 'feature3': 3}
+        ]
+        optimizer.add_observations(configs=configs, metrics=[1, 2, 3])
+        with patch('hpsearch.search_managers.bayesian_optimization.'
+                   'acquisition_function.Pool', wraps=Pool) as pool_mock:
+            suggestions = optimizer.get_suggestions(n_suggestions=3, n_jobs=2)
+        assert 1 <= len(suggestions) <= 3
+        assert pool_mock.call_count == 1
+
+    def test_get_process_pool_without_processes(self):
+        with get_process_pool(n_jobs=1) as pool:
+            assert pool is None
+
     @pytest.mark.filterwarnings('ignore::UserWarning')
     def test_concrete_example(self):
         hptuning_config = HPTuningConfig.from_dict({
@@ -1093,3 +1425,79 @@ class TestBOSearchManager(BaseTest):
         assert 0.001 <= suggestion['learning_rate'] <= 0.01
         assert suggestion['dropout'] in [0.25, 0.3]
         assert suggestion['activation'] in ['relu', 'sigmoid']
+
+    def test_surrogate_incremental_update(self):
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config)
+        surrogate = GaussianProcessSurrogate(
+            gaussian_process=optimizer.utility_function.gaussian_process)
+        x = np.array([[1, 1, 1], [2, 1.2, 2], [3, 1.3, 3], [2, 1.5, 4], [1, 1.8, 2]])
+        y = np.array([1., 2., 3., 4., 2.5])
+        surrogate.fit(x[:3], y[:3])
+        theta = surrogate.kernel.theta
+        surrogate.update(x[3:4], y[3:4])
+        surrogate.update(x[4:], y[4:])
+        # No refit before doubling the observations
+        assert surrogate.n_fitted == 3
+        assert np.allclose(surrogate.kernel.theta, theta)
+
+        # The incremental factor matches a full factorization with the same kernel
+        k = surrogate.kernel(x)
+        k[np.diag_indices_from(k)] += surrogate.noise
+        assert np.allclose(surrogate.cholesky.dot(surrogate.cholesky.T), k)
+        mean, std = surrogate.predict(x, return_std=True)
+        assert np.allclose(mean, y, atol=1e-3)
+
+        # Serialization, the factor is stored as its packed lower triangle
+        data = surrogate.to_dict()
+        assert set(data.keys()) == {'theta', 'x', 'y', 'cholesky', 'n_fitted'}
+        assert len(data['cholesky']) == len(x) * (len(x) + 1) // 2
+        restored = GaussianProcessSurrogate.from_dict(
+            gaussian_process=optimizer.utility_function.gaussian_process,
+            data=data)
+        assert np.allclose(restored.cholesky, surrogate.cholesky)
+        x_test = np.array([[1.5, 1.1, 3]])
+        assert np.allclose(restored.predict(x_test), surrogate.predict(x_test))
+
+        # Only the new observations extend the restored factor
+        with patch.object(GaussianProcessSurrogate, '_factorize') as factorize_mock:
+            restored.update(np.array([[2, 1.9, 1]]), np.array([1.5]), refit=False)
+        assert factorize_mock.call_count == 0
+        assert restored.n_observations == 6
+        assert np.allclose(restored.cholesky[:5, :5], surrogate.cholesky)
+
+    def test_get_suggestions_persists_surrogate_state(self):
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 2,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2, 3],
+            'old_experiments_configs': [[1, {'feature1': 1, 'feature2': 1, 'feature3': 1}],
+                                        [2, {'feature1': 2, 'feature2': 1.2, 'feature3': 2}],
+                                        [3, {'feature1': 3, 'feature2': 1.3, 'feature3': 3}]],
+            'old_experiments_metrics': [[1, 1], [2, 2], [3, 3]],
+            'experiment_ids': [4],
+            'experiments_configs': [[4, {'feature1': 2, 'feature2': 1.5, 'feature3': 4}]],
+            'experiments_metrics': [[4, 4]]
+        })
+        assert 1 <= len(self.manager1.get_suggestions(iteration_config)) <= 2
+        surrogate_state = self.manager1.surrogate_state
+        assert surrogate_state['observation_ids'] == [1, 2, 3, 4]
+
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 3,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2, 3, 4],
+            'old_experiments_configs': [[1, {'feature1': 1, 'feature2': 1, 'feature3': 1}],
+                                        [2, {'feature1': 2, 'feature2': 1.2, 'feature3': 2}],
+                                        [3, {'feature1': 3, 'feature2': 1.3, 'feature3': 3}],
+                                        [4, {'feature1': 2, 'feature2': 1.5, 'feature3': 4}]],
+            'old_experiments_metrics': [[1, 1], [2, 2], [3, 3], [4, 4]],
+            'experiment_ids': [5],
+            'experiments_configs': [[5, {'feature1': 1, 'feature2': 2, 'feature3': 3}]],
+            'experiments_metrics': [[5, 2]],
+            'surrogate_state': surrogate_state
+        })
+        with patch.object(GaussianProcessSurrogate, 'update') as update_mock:
+            self.manager1.get_suggestions(iteration_config)
+
+        # Only the new observation is added to the restored surrogate
+        assert len(update_mock.call_args_list[0][0][0]) == 1
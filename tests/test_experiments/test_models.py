@@ -1,5 +1,7 @@
 import os
 
+from datetime import timedelta
+
 from unittest.mock import patch
 
 import mock
@@ -14,11 +16,14 @@ import stores
 
 from constants.cloning_strategies import CloningStrategy
 from constants.urls import API_V1
-from crons.tasks.experiments_statuses import experiments_sync_jobs_statuses
+from crons.tasks.experiments_statuses import (
+    experiments_sync_jobs_statuses,
+    get_calculated_statuses
+)
 from db.managers.deleted import ArchivedManager, LiveManager
 from db.models.build_jobs import BuildJobStatus
 from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
-from db.models.experiments import Experiment, ExperimentStatus
+from db.models.experiments import Experiment, ExperimentMetricSeries, ExperimentStatus
 from db.models.job_resources import JobResources
 from factories.factory_build_jobs import BuildJobFactory
 from factories.factory_experiment_groups import ExperimentGroupFactory
@@ -448,6 +453,34 @@ class TestExperimentModel(BaseTest):
 
         assert experiment.metrics.count() == 3
 
+    def test_set_metrics_in_bulk(self):
+        config = ExperimentSpecification.read(experiment_spec_content)
+        experiment = ExperimentFactory(content=config.raw_data)
+        created_at = timezone.now()
+
+        with patch('auditor.record') as auditor_record:
+            experiments_set_metrics(experiment_id=experiment.id,
+                                    data=[{
+                                        'created_at': created_at + timedelta(seconds=1),
+                                        'values': {'accuracy': 0.9, 'precision': 0.8}
+                                    }, {
+                                        'created_at': created_at,
+                                        'values': {'accuracy': 0.7, 'loss': 0.1}
+                                    }, {
+                                        'created_at': created_at + timedelta(seconds=2),
+                                        'values': {'loss': 0.05}
+                                    }])
+
+        assert auditor_record.call_count == 1
+        assert experiment.metrics.count() == 3
+        experiment.refresh_from_db()
+        assert experiment.last_metric == {'accuracy': 0.9, 'precision': 0.8, 'loss': 0.05}
+
+        # A non valid batch is not created
+        experiments_set_metrics(experiment_id=experiment.id,
+                                data=[{'values': {'accuracy': 0.9}}, {'created_at': created_at}])
+        assert experiment.metrics.count() == 3
+
     def test_master_success_influences_other_experiment_workers_status(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             # with patch.object(Experiment, 'set_status') as _:  # noqa
@@ -494,12 +527,12 @@ class TestExperimentModel(BaseTest):
         xp_with_jobs.refresh_from_db()
         assert xp_with_jobs.last_status is None
 
-        # Mock sync experiments and jobs constants
-        with patch('scheduler.tasks.experiments.'
-                   'experiments_check_status.apply_async') as check_status_mock:
+        # Only the experiments with a new calculated status are updated
+        with patch.object(Experiment, 'set_calculated_status') as set_status_mock:
             experiments_sync_jobs_statuses()
 
-        assert check_status_mock.call_count == 1
+        assert set_status_mock.call_count == 1
+        assert set_status_mock.call_args[0] == (ExperimentLifeCycle.RUNNING,)
 
         # Call sync experiments and jobs constants
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as build_mock:
@@ -513,6 +546,29 @@ class TestExperimentModel(BaseTest):
         assert no_jobs_xp.last_status is None
         assert xp_with_jobs.last_status == ExperimentLifeCycle.RUNNING
 
+    def test_get_calculated_statuses(self):
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            with patch.object(Experiment, 'set_status') as _:  # noqa
+                experiments = [ExperimentFactory() for _ in range(3)]
+
+        master_done_xp, running_xp, unchanged_xp = experiments
+        with patch.object(Experiment, 'set_status') as _:  # noqa
+            master = ExperimentJobFactory(experiment=master_done_xp)
+            worker = ExperimentJobFactory(experiment=master_done_xp)
+            ExperimentJobStatusFactory(job=master, status=JobLifeCycle.SUCCEEDED)
+            ExperimentJobStatusFactory(job=worker, status=JobLifeCycle.RUNNING)
+            for _ in range(2):
+                job = ExperimentJobFactory(experiment=running_xp)
+                ExperimentJobStatusFactory(job=job, status=JobLifeCycle.RUNNING)
+            job = ExperimentJobFactory(experiment=unchanged_xp)
+            ExperimentJobStatusFactory(job=job, status=JobLifeCycle.RUNNING)
+        ExperimentStatusFactory(experiment=unchanged_xp, status=ExperimentLifeCycle.RUNNING)
+
+        assert get_calculated_statuses(Experiment.objects.all()) == {
+            master_done_xp.id: ExperimentLifeCycle.SUCCEEDED,
+            running_xp.id: ExperimentLifeCycle.RUNNING,
+        }
+
     def test_copying_an_experiment(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             experiment1 = ExperimentFactory()
@@ -568,6 +624,47 @@ class TestExperimentModel(BaseTest):
             ExperimentJobFactory(experiment=experiment, role=TaskType.WORKER)
         assert experiment.default_job_role == TaskType.PS
 
+    def test_metric_series_chunks(self):
+        experiment = ExperimentFactory()
+        created_at = timezone.now()
+        with patch.object(ExperimentMetricSeries, 'CHUNK_SIZE', 3):
+            for data in [[0, 1], [2, 3, 4, 5, 6, 7, 8], [9]]:
+                experiments_set_metrics(experiment_id=experiment.id, data=[
+                    {'created_at': created_at + timedelta(seconds=i), 'values': {'loss': i}}
+                    for i in data
+                ])
+            # A value reported late
+            experiments_set_metrics(experiment_id=experiment.id, data=[
+                {'created_at': created_at - timedelta(seconds=1), 'values': {'loss': -1}}])
+
+        chunks = ExperimentMetricSeries.objects.filter(experiment=experiment).order_by('chunk')
+        assert [chunk.n_points for chunk in chunks] == [3, 3, 3, 2]
+        # The late value is sorted in the series
+        assert [chunk.first_step for chunk in chunks] == [0, 3, 6, 9]
+        assert chunks[0].min_timestamp == (created_at - timedelta(seconds=1)).timestamp()
+        assert chunks[0].max_timestamp == (created_at + timedelta(seconds=1)).timestamp()
+        steps, timestamps, values = ExperimentMetricSeries.get_series(
+            experiment_id=experiment.id)['loss']
+        assert steps.tolist() == list(range(11))
+        assert values.tolist() == list(range(-1, 10))
+        assert timestamps.tolist() == sorted(timestamps.tolist())
+
+        # Only the chunks overlapping the ranges are read
+        with patch.object(ExperimentMetricSeries, 'CHUNK_SIZE', 3):
+            with self.assertNumQueries(1):
+                steps, _, values = ExperimentMetricSeries.get_series(
+                    experiment_id=experiment.id, start_step=4, end_step=7)['loss']
+            assert steps.tolist() == [4, 5, 6]
+            assert values.tolist() == [3, 4, 5]
+            steps, _, values = ExperimentMetricSeries.get_series(
+                experiment_id=experiment.id,
+                start=(created_at + timedelta(seconds=2)).timestamp(),
+                end=(created_at + timedelta(seconds=4)).timestamp())['loss']
+            assert steps.tolist() == [3, 4, 5]
+            assert values.tolist() == [2, 3, 4]
+        assert ExperimentMetricSeries.get_series(experiment_id=experiment.id,
+                                                 start=created_at.timestamp() + 100) == {}
+
 
 @pytest.mark.experiments_mark
 class TestExperimentCommit(BaseViewTest):
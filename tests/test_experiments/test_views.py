@@ -2,6 +2,7 @@
 import os
 import time
 
+from datetime import timedelta
 from faker import Faker
 from unittest.mock import patch
 
@@ -10,6 +11,8 @@ import pytest
 from hestia.internal_services import InternalServices
 from rest_framework import status
 
+from django.utils import timezone
+
 import conf
 import stores
 
@@ -63,6 +66,7 @@ from lifecycles.experiments import ExperimentLifeCycle
 from lifecycles.jobs import JobLifeCycle
 from options.registry.archives import ARCHIVES_ROOT_ARTIFACTS
 from options.registry.scheduler import SCHEDULER_GLOBAL_COUNTDOWN
+from scheduler.tasks.experiments import experiments_set_metrics
 from schemas import ExperimentSpecification
 from tests.base.clients import EphemeralClient
 from tests.base.views import BaseEntityCodeReferenceViewTest, BaseFilesViewTest, BaseViewTest
@@ -1420,6 +1424,63 @@ class TestExperimentMetricListViewV1(BaseViewTest):
         assert last_object.values == data['values']
 
 
+@pytest.mark.experiments_mark
+class TestExperimentMetricSeriesViewV1(BaseViewTest):
+    HAS_AUTH = True
+
+    def setUp(self):
+        super().setUp()
+        project = ProjectFactory(user=self.auth_client.user)
+        self.experiment = ExperimentFactory(project=project)
+        self.url = '/{}/{}/{}/experiments/{}/metrics/series/'.format(API_V1,
+                                                                     project.user.username,
+                                                                     project.name,
+                                                                     self.experiment.id)
+        self.created_at = timezone.now()
+        experiments_set_metrics(experiment_id=self.experiment.id, data=[
+            {'created_at': self.created_at + timedelta(seconds=i),
+             'values': {'accuracy': i / 100, 'loss': 1 - i / 100, 'tag': 'foo'}}
+            for i in range(100)
+        ])
+
+    def test_get(self):
+        resp = self.auth_client.get(self.url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert set(resp.data.keys()) == {'accuracy', 'loss'}
+        assert resp.data['accuracy']['steps'] == list(range(100))
+        assert resp.data['accuracy']['values'] == [i / 100 for i in range(100)]
+
+    def test_get_downsampled(self):
+        for method in ['lttb', 'minmax']:
+            resp = self.auth_client.get(
+                '{}?names=loss&resolution=10&method={}'.format(self.url, method))
+            assert resp.status_code == status.HTTP_200_OK
+            assert set(resp.data.keys()) == {'loss'}
+            steps = resp.data['loss']['steps']
+            assert len(steps) == 10
+            assert steps == sorted(steps)
+            assert steps[0] == 0
+            assert steps[-1] == 99
+
+    def test_get_range(self):
+        resp = self.auth_client.get('{}?names=accuracy&start_step=10&end_step=20'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['accuracy']['steps'] == list(range(10, 20))
+
+        start = (self.created_at + timedelta(seconds=50)).timestamp()
+        resp = self.auth_client.get('{}?names=accuracy&start={}'.format(self.url, start))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['accuracy']['steps'] == list(range(50, 100))
+
+    def test_get_wrong_params(self):
+        resp = self.auth_client.get('{}?method=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        resp = self.auth_client.get('{}?resolution=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        resp = self.auth_client.get('{}?start=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.experiments_mark
 class TestExperimentStatusDetailViewV1(BaseViewTest):
     serializer_class = ExperimentStatusSerializer
@@ -2135,6 +2196,66 @@ class TestExperimentLogsViewV1(BaseViewTest):
         assert len(data) == len(self.logs)
         assert data == self.logs
 
+    def test_get_done_experiment_tail(self):
+        self.experiment.set_status(ExperimentLifeCycle.SUCCEEDED)
+        self.create_logs(temp=False)
+        resp = self.auth_client.get(self.url + '?tail=3')
+        assert resp.status_code == status.HTTP_200_OK
+        data = b''.join(resp.streaming_content).decode('utf-8')
+        assert [d for d in data.split('\n') if d] == self.logs[-3:]
+
+    def test_get_experiment_logs_with_invalid_since(self):
+        self.experiment.set_status(ExperimentLifeCycle.SUCCEEDED)
+        self.create_logs(temp=False)
+        resp = self.auth_client.get(self.url + '?since=foo')
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    @patch('api.experiments.views.process_logs')
+    def test_get_experiment_logs_with_naive_since(self, _):
+        self.create_logs(temp=True)
+        log_path = stores.get_experiment_logs_path(experiment_name=self.experiment.unique_name,
+                                                   temp=True)
+        logs = ['2019-07-02T10:12:01.000000001Z line 1',
+                '2019-07-02T10:12:05.000000001Z line 2']
+        with open(log_path, 'w') as file:
+            file.write('\n'.join(logs) + '\n')
+
+        # Datetimes without timezone are read as UTC
+        resp = self.auth_client.get(self.url + '?since=2019-07-02T10:12:04')
+        assert resp.status_code == status.HTTP_200_OK
+        data = b''.join(resp.streaming_content).decode('utf-8')
+        assert [d for d in data.split('\n') if d] == logs[1:]
+
+    @patch('api.experiments.views.process_logs')
+    def test_get_non_done_experiment_tail(self, _):
+        self.create_logs(temp=True)
+        resp = self.auth_client.get(self.url + '?tail=3')
+        assert resp.status_code == status.HTTP_200_OK
+        data = [d for d in resp.content.decode('utf-8').split('\n') if d]
+        assert data == self.logs[-3:]
+
+        resp = self.auth_client.get(self.url + '?tail={}'.format(self.num_log_lines * 2))
+        assert resp.status_code == status.HTTP_200_OK
+        data = [d for d in resp.content.decode('utf-8').split('\n') if d]
+        assert data == self.logs
+
+    @patch('api.experiments.views.process_logs')
+    def test_get_non_done_experiment_range(self, _):
+        self.create_logs(temp=True)
+        content = ''.join('{}\n'.format(line) for line in self.logs).encode('utf-8')
+
+        resp = self.auth_client.get(self.url, HTTP_RANGE='bytes=10-')
+        assert resp.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert resp['Content-Range'] == 'bytes 10-{}/{}'.format(len(content) - 1, len(content))
+        assert b''.join(resp.streaming_content) == content[10:]
+
+        resp = self.auth_client.get(self.url, HTTP_RANGE='bytes=-5')
+        assert resp.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert b''.join(resp.streaming_content) == content[-5:]
+
+        resp = self.auth_client.get(self.url, HTTP_RANGE='bytes={}-'.format(len(content)))
+        assert resp.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+
     def test_post_logs(self):
         resp = self.auth_client.post(self.url)
         assert resp.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,37 @@
+import fcntl
+import os
+import tempfile
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from libs.archive import archive_repo
+from tests.base.case import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestArchiveRepo(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.archive_root = tempfile.mkdtemp()
+        self.repo_git = MagicMock()
+        self.repo_git.commit.return_value.hexsha = 'abc'
+        self.repo_git.archive.side_effect = lambda fp, **kwargs: fp.write(b'archive')
+
+    def archive_repo(self):
+        with patch('libs.archive.conf.get', return_value=self.archive_root):
+            return archive_repo(repo_git=self.repo_git, repo_name='repo')
+
+    def test_archive_repo_is_cached(self):
+        assert self.archive_repo() == (self.archive_root, 'repo-abc.tar.gz')
+        assert self.archive_repo() == (self.archive_root, 'repo-abc.tar.gz')
+        assert self.repo_git.archive.call_count == 1
+
+    def test_archive_repo_does_not_wait_for_other_archives(self):
+        # Another archive is being written
+        with open(os.path.join(self.archive_root, '.repo-other.tar.gz.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            assert self.archive_repo() == (self.archive_root, 'repo-abc.tar.gz')
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        assert os.path.exists(os.path.join(self.archive_root, '.repo-abc.tar.gz.lock'))
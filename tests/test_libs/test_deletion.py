@@ -0,0 +1,93 @@
+import pytest
+
+from mock import patch
+
+from constants.cloning_strategies import CloningStrategy
+from db.models.bookmarks import Bookmark
+from db.models.experiment_groups import ExperimentGroup
+from db.models.experiments import Experiment
+from db.models.jobs import Job
+from db.models.projects import Project
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from factories.factory_jobs import JobFactory
+from factories.factory_projects import ProjectFactory
+from libs.deletion import (
+    bulk_deletion,
+    delete_experiment_group,
+    delete_in_batches,
+    delete_project,
+    is_bulk_deletion
+)
+from tests.base.case import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestDeletion(BaseTest):
+    def test_bulk_deletion_context(self):
+        assert is_bulk_deletion() is False
+        with bulk_deletion():
+            assert is_bulk_deletion() is True
+            with bulk_deletion():
+                assert is_bulk_deletion() is True
+            assert is_bulk_deletion() is True
+        assert is_bulk_deletion() is False
+
+    def test_delete_in_batches(self):
+        project = ProjectFactory()
+        experiments = [ExperimentFactory(project=project) for _ in range(3)]
+        with patch('libs.deletion.DELETION_BATCH_SIZE', 2):
+            ids = delete_in_batches(Experiment.all.filter(project=project))
+        assert sorted(ids) == sorted(experiment.id for experiment in experiments)
+        assert Experiment.all.count() == 0
+
+    @patch('scheduler.tasks.storage.stores_schedule_logs_deletion.apply_async')
+    @patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async')
+    def test_delete_experiment_group(self, delete_outputs, delete_logs):
+        experiment_group = ExperimentGroupFactory()
+        experiment = ExperimentFactory(project=experiment_group.project,
+                                       experiment_group=experiment_group)
+        ExperimentFactory(project=experiment_group.project, experiment_group=experiment_group)
+        clone = ExperimentFactory(project=experiment_group.project,
+                                  original_experiment=experiment,
+                                  cloning_strategy=CloningStrategy.RESUME)
+        other_experiment = ExperimentFactory(project=experiment_group.project)
+        Bookmark.objects.create(user=experiment.user, content_object=experiment)
+        Bookmark.objects.create(user=clone.user, content_object=other_experiment)
+
+        with patch('auditor.record') as auditor_record:
+            delete_experiment_group(experiment_group)
+
+        assert ExperimentGroup.all.count() == 0
+        # The clone resumed outside of the group is deleted as well
+        assert list(Experiment.all.all()) == [other_experiment]
+        assert Bookmark.objects.count() == 1
+        # The group's storage and the clone's storage
+        assert delete_outputs.call_count == 2
+        assert delete_logs.call_count == 2
+        # The group's deleted event and the clone's events, not the group's experiments
+        assert auditor_record.call_count == 3
+
+    @patch('scheduler.tasks.storage.stores_schedule_logs_deletion.apply_async')
+    @patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async')
+    def test_delete_project(self, delete_outputs, delete_logs):
+        project = ProjectFactory()
+        experiment_group = ExperimentGroupFactory(project=project)
+        experiment = ExperimentFactory(project=project, experiment_group=experiment_group)
+        ExperimentFactory(project=project)
+        job = JobFactory(project=project)
+        other_experiment = ExperimentFactory()
+        Bookmark.objects.create(user=project.user, content_object=experiment)
+        Bookmark.objects.create(user=project.user, content_object=job)
+        Bookmark.objects.create(user=project.user, content_object=other_experiment)
+
+        delete_project(project)
+
+        assert Project.all.filter(id=project.id).exists() is False
+        assert ExperimentGroup.all.count() == 0
+        assert list(Experiment.all.all()) == [other_experiment]
+        assert Job.all.count() == 0
+        assert Bookmark.objects.count() == 1
+        # Only the project's storage is deleted
+        assert delete_outputs.call_count == 1
+        assert delete_logs.call_count == 1
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from libs.downsampling import LTTB, MIN_MAX, downsample, lttb, min_max
+from tests.base.case import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestDownsampling(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.x = np.arange(1000, dtype=float)
+        self.y = np.sin(self.x / 50.)
+        self.y[500] = 10.  # A spike should be kept
+
+    def test_lttb(self):
+        indices = lttb(self.x, self.y, 100)
+        assert len(indices) == 100
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert np.all(np.diff(indices) > 0)
+        assert 500 in indices
+
+    def test_min_max(self):
+        indices = min_max(self.x, self.y, 100)
+        assert len(indices) <= 100
+        assert np.all(np.diff(indices) > 0)
+        assert 500 in indices
+        assert np.argmin(self.y) in indices
+
+    def test_small_series_are_not_downsampled(self):
+        for method in [LTTB, MIN_MAX]:
+            assert downsample([0, 1, 2], [1, 2, 3], 10, method=method).tolist() == [0, 1, 2]
+
+    def test_wrong_method(self):
+        with self.assertRaises(ValueError):
+            downsample(self.x, self.y, 10, method='foo')
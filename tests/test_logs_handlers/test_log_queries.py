@@ -0,0 +1,97 @@
+import fcntl
+import os
+import tempfile
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from logs_handlers.log_queries import base
+from tests.base.case import BaseTest
+
+
+@pytest.mark.logs_heandlers_mark
+class TestLogQueries(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.log_path = os.path.join(tempfile.mkdtemp(), 'logs')
+        self.k8s_manager = MagicMock()
+
+    def write_logs(self, log_lines):
+        with open(self.log_path, 'w') as log_file:
+            log_file.write('\n'.join(log_lines) + '\n')
+
+    def test_get_log_timestamp(self):
+        timestamp = base.get_log_timestamp('2019-07-02T10:12:01.123456789Z some log')
+        assert timestamp.isoformat() == '2019-07-02T10:12:01.123456+00:00'
+        timestamp = base.get_log_timestamp('master.0 -- 2019-07-02T10:12:01Z some log')
+        assert timestamp.isoformat() == '2019-07-02T10:12:01+00:00'
+        assert base.get_log_timestamp('some log') is None
+
+    def test_process_new_logs_without_local_logs(self):
+        with patch.object(base, 'process_logs', return_value='logs') as process_logs:
+            log_lines, append = base.process_new_logs(k8s_manager=self.k8s_manager,
+                                                      pod_id='pod',
+                                                      container_job_name='container',
+                                                      log_path=self.log_path)
+        assert (log_lines, append) == ('logs', False)
+        assert process_logs.call_args[1].get('since_seconds') is None
+
+    def test_process_new_logs_appends_the_new_lines(self):
+        self.write_logs(['2019-07-02T10:12:01.000000001Z line 1',
+                         '2019-07-02T10:12:02.000000001Z line 2',
+                         '2019-07-02T10:12:02.000000001Z line 3'])
+        logs = '\n'.join(['2019-07-02T10:12:01.000000001Z line 1',
+                          '2019-07-02T10:12:02.000000001Z line 2',
+                          '2019-07-02T10:12:02.000000001Z line 3',
+                          '2019-07-02T10:12:02.000000001Z line 4',
+                          '2019-07-02T10:12:03.000000001Z line 5'])
+        with patch.object(base, 'process_logs', return_value=logs) as process_logs:
+            log_lines, append = base.process_new_logs(k8s_manager=self.k8s_manager,
+                                                      pod_id='pod',
+                                                      container_job_name='container',
+                                                      log_path=self.log_path)
+        assert append is True
+        assert log_lines.split('\n') == ['2019-07-02T10:12:02.000000001Z line 4',
+                                         '2019-07-02T10:12:03.000000001Z line 5']
+        assert process_logs.call_args[1]['since_seconds'] > 0
+
+    def test_update_logs_writes_all_the_logs_without_local_logs(self):
+        self.write_logs(['some log without timestamp'])
+        logs = '\n'.join(['2019-07-02T10:12:01.000000001Z line 1',
+                          '2019-07-02T10:12:02.000000001Z line 2'])
+        with patch.object(base, 'process_logs', return_value=logs):
+            base.update_logs(k8s_manager=self.k8s_manager,
+                             pod_id='pod',
+                             container_job_name='container',
+                             log_path=self.log_path)
+        with open(self.log_path) as log_file:
+            assert log_file.read() == logs + '\n'
+
+    def test_update_logs_appends_the_new_lines(self):
+        self.write_logs(['2019-07-02T10:12:01.000000001Z line 1'])
+        logs = '\n'.join(['2019-07-02T10:12:01.000000001Z line 1',
+                          '2019-07-02T10:12:02.000000001Z line 2'])
+        with patch.object(base, 'process_logs', return_value=logs):
+            for _ in range(2):
+                base.update_logs(k8s_manager=self.k8s_manager,
+                                 pod_id='pod',
+                                 container_job_name='container',
+                                 log_path=self.log_path)
+        with open(self.log_path) as log_file:
+            assert log_file.read() == logs + '\n'
+
+    def test_update_logs_locks_the_log_file(self):
+        def process_logs(**kwargs):
+            # The lock is held while the logs are fetched
+            with open(self.log_path) as log_file:
+                with self.assertRaises(BlockingIOError):
+                    fcntl.flock(log_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return '2019-07-02T10:12:01.000000001Z line 1'
+
+        with patch.object(base, 'process_logs', side_effect=process_logs) as process_logs_mock:
+            base.update_logs(k8s_manager=self.k8s_manager,
+                             pod_id='pod',
+                             container_job_name='container',
+                             log_path=self.log_path)
+        assert process_logs_mock.call_count == 1
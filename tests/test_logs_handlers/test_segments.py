@@ -0,0 +1,94 @@
+import os
+import tempfile
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from django.utils.dateparse import parse_datetime
+
+from logs_handlers import segments
+from tests.base.case import BaseTest
+
+
+@pytest.mark.logs_heandlers_mark
+class TestLogSegments(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.log_path = os.path.join(tempfile.mkdtemp(), 'logs')
+        self.log_lines = []
+        for i in range(10):
+            self.log_lines.append('{}.{} -- 2019-07-02T10:12:{:02d}.000000001Z line {}\n'.format(
+                'master' if i % 2 else 'worker', 0, i, i))
+        with open(self.log_path, 'w') as log_file:
+            log_file.writelines(self.log_lines)
+
+    def test_write_segments(self):
+        index = segments.write_segments(self.log_path, segment_lines=3)
+        assert index['n_lines'] == 10
+        assert [s['n_lines'] for s in index['segments']] == [3, 3, 3, 1]
+        assert [s['start'] for s in index['segments']] == [0, 3, 6, 9]
+        assert index['segments'][0]['names'] == ['master.0', 'worker.0']
+        assert index['segments'][-1]['names'] == ['master.0']
+        assert parse_datetime(index['segments'][1]['start_time']) == parse_datetime(
+            '2019-07-02T10:12:03.000000001Z')
+        assert os.path.exists(os.path.join(segments.get_segments_path(self.log_path),
+                                           segments.INDEX_NAME))
+
+    def test_get_index_rewrites_stale_segments(self):
+        index = segments.get_index(self.log_path)
+        assert index['n_lines'] == 10
+        with open(self.log_path, 'a') as log_file:
+            log_file.write('new line\n')
+        index = segments.get_index(self.log_path)
+        assert index['n_lines'] == 11
+
+    def test_read_logs(self):
+        segments.write_segments(self.log_path, segment_lines=3)
+        assert list(segments.read_logs(self.log_path)) == self.log_lines
+        assert list(segments.read_logs(self.log_path, tail=4)) == self.log_lines[-4:]
+        assert list(segments.read_logs(self.log_path, name='master.0')) == self.log_lines[1::2]
+        assert list(segments.read_logs(self.log_path, name='master.0', tail=2)) == [
+            self.log_lines[7], self.log_lines[9]]
+        since = parse_datetime('2019-07-02T10:12:04Z')
+        until = parse_datetime('2019-07-02T10:12:06Z')
+        assert list(segments.read_logs(self.log_path, since=since, until=until)) == [
+            self.log_lines[4], self.log_lines[5]]
+
+    def test_persist_segments_on_a_mounted_path(self):
+        persisted_log_path = os.path.join(tempfile.mkdtemp(), 'persisted', 'logs')
+        os.makedirs(os.path.dirname(persisted_log_path))
+        # The logs appended by the sidecars
+        with open(persisted_log_path, 'w') as log_file:
+            log_file.write('line\n')
+
+        with patch('logs_handlers.segments.stores') as stores_mock:
+            stores_mock.is_bucket_logs_persistence.return_value = False
+            segments.persist_segments(self.log_path, persisted_log_path)
+
+        # The plain log file is replaced by its segments
+        assert os.path.exists(self.log_path) is False
+        assert os.path.isdir(persisted_log_path)
+        assert segments.get_segments_path(persisted_log_path) == persisted_log_path
+        assert segments.get_index(persisted_log_path)['n_lines'] == 10
+        assert list(segments.read_logs(persisted_log_path)) == self.log_lines
+        assert list(segments.read_logs(persisted_log_path, tail=2)) == self.log_lines[-2:]
+
+    def test_persist_segments_on_a_bucket(self):
+        store = MagicMock()
+        uploaded = {}
+
+        def upload_dir(dirname, path, use_basename):
+            with open(os.path.join(dirname, segments.INDEX_NAME)) as index_file:
+                uploaded[path] = index_file.read()
+
+        store.upload_dir.side_effect = upload_dir
+        with patch('logs_handlers.segments.stores') as stores_mock:
+            stores_mock.is_bucket_logs_persistence.return_value = True
+            stores_mock.get_logs_store.return_value = store
+            segments.persist_segments(self.log_path, 'bucket/logs')
+
+        store.delete.assert_called_once_with('bucket/logs')
+        assert list(uploaded.keys()) == ['bucket/logs']
+        assert os.path.exists(self.log_path) is False
+        assert os.path.exists(self.log_path + segments.SEGMENTS_SUFFIX) is False
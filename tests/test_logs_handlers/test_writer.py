@@ -0,0 +1,94 @@
+import os
+import tempfile
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from logs_handlers.writer import LogWriter
+from tests.base.case import BaseTest
+
+
+@pytest.mark.logs_heandlers_mark
+class TestLogWriter(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.logs_dir = tempfile.mkdtemp()
+        self.writer = LogWriter(max_open_files=2, flush_interval=60, upload_interval=0)
+
+    def tearDown(self):
+        self.writer.close()
+        super().tearDown()
+
+    def get_log_path(self, name):
+        return os.path.join(self.logs_dir, name, 'logs')
+
+    def create_path(self, name):
+        def create_path():
+            os.makedirs(os.path.join(self.logs_dir, name), exist_ok=True)
+
+        return create_path
+
+    def test_append_coalesces_the_lines_until_flush(self):
+        log_path = self.get_log_path('run1')
+        self.writer.append(log_path=log_path,
+                           log_lines='line 1',
+                           create_path=self.create_path('run1'))
+        self.writer.append(log_path=log_path,
+                           log_lines=['line 2', 'line 3'],
+                           create_path=self.create_path('run1'))
+        assert os.path.exists(log_path) is False
+
+        self.writer.flush()
+        with open(log_path) as log_file:
+            assert log_file.read() == 'line 1\nline 2\nline 3\n'
+
+        self.writer.append(log_path=log_path,
+                           log_lines='line 4',
+                           create_path=self.create_path('run1'))
+        self.writer.flush()
+        with open(log_path) as log_file:
+            assert log_file.read() == 'line 1\nline 2\nline 3\nline 4\n'
+
+    def test_open_files_are_capped(self):
+        for name in ['run1', 'run2', 'run3']:
+            self.writer.append(log_path=self.get_log_path(name),
+                               log_lines='line',
+                               create_path=self.create_path(name))
+        self.writer.flush()
+        assert list(self.writer._files.keys()) == [  # pylint:disable=protected-access
+            self.get_log_path('run2'), self.get_log_path('run3')]
+
+    def test_uploads_after_flush(self):
+        upload = MagicMock()
+        self.writer.append(log_path=self.get_log_path('run1'),
+                           log_lines='line',
+                           create_path=self.create_path('run1'),
+                           upload=upload)
+        assert upload.call_count == 0
+        self.writer.flush()
+        assert upload.call_count == 1
+
+    def test_run_exists_caches_the_existing_runs(self):
+        exists = MagicMock(return_value=False)
+        assert self.writer.run_exists(run_uuid='uuid', exists=exists) is False
+        assert self.writer.run_exists(run_uuid='uuid', exists=exists) is False
+        assert exists.call_count == 2
+
+        exists.return_value = True
+        assert self.writer.run_exists(run_uuid='uuid', exists=exists) is True
+        assert self.writer.run_exists(run_uuid='uuid', exists=exists) is True
+        assert exists.call_count == 3
+
+    def test_run_exists_drops_the_expired_runs(self):
+        exists = MagicMock(return_value=True)
+        with patch('logs_handlers.writer.time.monotonic', return_value=0):
+            assert self.writer.run_exists(run_uuid='uuid1', exists=exists) is True
+        with patch('logs_handlers.writer.time.monotonic', return_value=LogWriter.RUNS_TTL / 2):
+            assert self.writer.run_exists(run_uuid='uuid2', exists=exists) is True
+        assert list(self.writer._runs) == ['uuid1', 'uuid2']  # pylint:disable=protected-access
+
+        with patch('logs_handlers.writer.time.monotonic', return_value=LogWriter.RUNS_TTL):
+            assert self.writer.run_exists(run_uuid='uuid2', exists=exists) is True
+        assert list(self.writer._runs) == ['uuid2']  # pylint:disable=protected-access
+        assert exists.call_count == 2
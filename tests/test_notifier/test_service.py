@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
+from django.db import IntegrityError
+
 import notifier
 
 from actions.registry.email import EmailAction
@@ -13,7 +15,11 @@ from actions.registry.webhooks.pagerduty_webhook import PagerDutyWebHookAction
 from actions.registry.webhooks.slack_webhook import SlackWebHookAction
 from actions.registry.webhooks.webhook import WebHookAction
 from db.models.notification import Notification, NotificationEvent
-from events.registry.experiment import EXPERIMENT_SUCCEEDED, EXPERIMENT_VIEWED
+from events.registry.experiment import (
+    EXPERIMENT_SUCCEEDED,
+    EXPERIMENT_VIEWED,
+    ExperimentSucceededEvent
+)
 from factories.factory_experiments import ExperimentFactory
 from tests.base.case import BaseTest
 
@@ -130,3 +136,42 @@ class NotifierTest(BaseTest):
         assert notification_event.content_object == self.experiment
         assert set(notifications.values_list('user__id', flat=True)) == {
             self.experiment.user.id, self.experiment.project.user.id}
+
+    def get_events_data(self, experiments):
+        return [
+            ExperimentSucceededEvent.from_instance(experiment).serialize(
+                dumps=False, include_instance_info=True)
+            for experiment in experiments
+        ]
+
+    @patch.object(EmailAction, 'execute')
+    @patch.object(WebHookAction, 'execute')
+    def test_record_many_does_not_orphan_notification_events(self, *_):
+        with patch.object(Notification.objects, 'bulk_create', side_effect=IntegrityError):
+            notifier.record_many(events_data=self.get_events_data([self.experiment]))
+
+        assert NotificationEvent.objects.count() == 0
+        assert Notification.objects.count() == 0
+
+    @patch.object(EmailAction, 'execute')
+    @patch.object(WebHookAction, 'execute')
+    def test_record_many_falls_back_to_single_inserts(self, *_):
+        other_experiment = ExperimentFactory()
+        save = NotificationEvent.save
+
+        def save_notification_event(notification_event, *args, **kwargs):
+            if notification_event.object_id == other_experiment.id:
+                raise IntegrityError
+            save(notification_event, *args, **kwargs)
+
+        with patch.object(NotificationEvent.objects, 'bulk_create', side_effect=IntegrityError):
+            with patch.object(NotificationEvent, 'save', autospec=True,
+                              side_effect=save_notification_event):
+                notifier.record_many(
+                    events_data=self.get_events_data([self.experiment, other_experiment]))
+
+        # Only the failing notification is skipped
+        notification_event = NotificationEvent.objects.get()
+        assert notification_event.content_object == self.experiment
+        assert set(Notification.objects.values_list('event', flat=True)) == {
+            notification_event.id}
@@ -1,5 +1,7 @@
 import pytest
 
+from mock import patch
+
 from db.redis.heartbeat import RedisHeartBeat
 from tests.base.case import BaseTest
 
@@ -72,3 +74,14 @@ class TestRedisHeartBeat(BaseTest):
         RedisHeartBeat.build_ping(1)
         self.assertEqual(heartbeat.is_alive(), True)
         self.assertEqual(RedisHeartBeat.build_is_alive(1), True)
+
+    def test_redis_heartbeats_are_alive(self):
+        assert RedisHeartBeat.experiments_are_alive([]) == set()
+        RedisHeartBeat.experiment_ping(1)
+        RedisHeartBeat.experiment_ping(3)
+        RedisHeartBeat.job_ping(2)
+        RedisHeartBeat.build_ping(1)
+        with patch.object(RedisHeartBeat, 'CHUNK_SIZE', 2):
+            assert RedisHeartBeat.experiments_are_alive([1, 2, 3, 4, 5]) == {1, 3}
+        assert RedisHeartBeat.jobs_are_alive([1, 2, 3]) == {2}
+        assert RedisHeartBeat.builds_are_alive([1, 2, 3]) == {1}
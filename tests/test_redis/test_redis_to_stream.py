@@ -1,3 +1,4 @@
+import json
 import uuid
 
 import pytest
@@ -36,6 +37,17 @@ class TestRedisToStream(BaseTest):
         RedisToStream.remove_experiment_logs(expeirment_uuid)
         assert RedisToStream.is_monitored_experiment_logs(expeirment_uuid) is False
 
+    def test_get_monitored_logs(self):
+        job_uuid = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        assert RedisToStream.get_monitored_logs() == [set(), set()]
+        RedisToStream.monitor_job_logs(job_uuid)
+        RedisToStream.monitor_experiment_logs(experiment_uuid)
+        RedisToStream.monitor_job_resources(uuid.uuid4().hex)
+        assert RedisToStream.get_monitored_logs() == [{job_uuid}, {experiment_uuid}]
+        RedisToStream.remove_job_logs(job_uuid)
+        assert RedisToStream.get_monitored_logs() == [set(), {experiment_uuid}]
+
     def test_set_latest_job_resources(self):
         gpu_resources = {
             'index': 0,
@@ -78,6 +90,41 @@ class TestRedisToStream(BaseTest):
         assert config_dict == RedisToStream.get_latest_job_resources(
             config_dict['job_uuid'], 'master.0', True)
 
+    def test_get_latest_experiment_resources(self):
+        jobs = [{'uuid': uuid.uuid4().hex, 'name': 'master.{}'.format(i)} for i in range(3)]
+        assert RedisToStream.get_latest_experiment_resources(jobs, True) == []
+        assert RedisToStream.get_latest_experiment_resources([], True) == []
+
+        for job in jobs[:2]:
+            RedisToStream.set_latest_job_resources(job['uuid'], {'job_uuid': job['uuid'],
+                                                                 'job_name': job['uuid'],
+                                                                 'cpu_percentage': 0.5})
+        assert RedisToStream.get_latest_experiment_resources(jobs, True) == [
+            {'job_uuid': job['uuid'], 'job_name': job['name'], 'cpu_percentage': 0.5}
+            for job in jobs[:2]
+        ]
+        assert json.loads(RedisToStream.get_latest_experiment_resources(jobs)) == (
+            RedisToStream.get_latest_experiment_resources(jobs, True))
+
+    def test_set_latest_jobs_resources(self):
+        RedisToStream.set_latest_jobs_resources({})
+        jobs = [{'uuid': uuid.uuid4().hex, 'name': 'master.{}'.format(i)} for i in range(2)]
+        RedisToStream.set_latest_jobs_resources({
+            job['uuid']: {'job_uuid': job['uuid'], 'cpu_percentage': 0.5} for job in jobs
+        })
+        assert RedisToStream.get_latest_experiment_resources(jobs, True) == [
+            {'job_uuid': job['uuid'], 'job_name': job['name'], 'cpu_percentage': 0.5}
+            for job in jobs
+        ]
+
+    def test_get_monitored_resources(self):
+        job_uuid = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        RedisToStream.monitor_job_resources(job_uuid)
+        RedisToStream.monitor_experiment_resources(experiment_uuid)
+        RedisToStream.monitor_job_logs(uuid.uuid4().hex)
+        assert RedisToStream.get_monitored_resources() == [{job_uuid}, {experiment_uuid}]
+
     def test_job_monitoring(self):
         job_uuid = uuid.uuid4().hex
         assert RedisToStream.is_monitored_job_resources(job_uuid) is False
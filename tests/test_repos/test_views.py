@@ -432,10 +432,53 @@ class RepoDownloadViewTest(BaseViewTest):
                              data={'repo': uploaded_file},
                              content_type=MULTIPART_CONTENT)
 
+    @staticmethod
+    def get_commit_hash(code_file_path):
+        return git.get_git_repo(code_file_path).head.commit.hexsha
+
     def test_raise_404_if_repo_does_not_exist(self):
         response = self.auth_client.get(self.download_url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_archives_are_cached_by_commit(self):
+        self.upload_file()
+        code_file_path = '{}/{}/{}/{}'.format(conf.get(REPOS_MOUNT_PATH),
+                                              self.auth_client.user.username,
+                                              self.project.name,
+                                              self.project.name)
+        commit_hash = self.get_commit_hash(code_file_path)
+        archive_path = '{}/{}-{}.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS),
+                                                self.project.name,
+                                                commit_hash)
+
+        response = self.auth_client.get(self.download_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], '"{}"'.format(commit_hash))
+        self.assertTrue(os.path.exists(archive_path))
+
+        with patch('git.Repo.archive') as archive_mock:
+            response = self.auth_client.get(self.download_url + '?commit=' + commit_hash)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response[ProtectedView.NGINX_REDIRECT_HEADER], archive_path)
+        assert archive_mock.call_count == 0
+
+    def test_not_modified_if_none_match(self):
+        self.upload_file()
+        code_file_path = '{}/{}/{}/{}'.format(conf.get(REPOS_MOUNT_PATH),
+                                              self.auth_client.user.username,
+                                              self.project.name,
+                                              self.project.name)
+        etag = '"{}"'.format(self.get_commit_hash(code_file_path))
+
+        with patch('api.repos.views.archive_repo') as archive_mock:
+            response = self.auth_client.get(self.download_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        assert archive_mock.call_count == 0
+
+        response = self.auth_client.get(self.download_url, HTTP_IF_NONE_MATCH='"foo"')
+        self.assertEqual(response.status_code, 200)
+
     def test_redirects_nginx_to_file_for_internal_repos(self):
         self.upload_file()
         user = self.auth_client.user
@@ -452,7 +495,9 @@ class RepoDownloadViewTest(BaseViewTest):
         self.assertTrue(ProtectedView.NGINX_REDIRECT_HEADER in response)
         self.assertEqual(
             response[ProtectedView.NGINX_REDIRECT_HEADER],
-            '{}/{}-master.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS), self.project.name))
+            '{}/{}-{}.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS),
+                                     self.project.name,
+                                     self.get_commit_hash(code_file_path)))
 
     def test_redirects_nginx_to_file_for_external_repos(self):
         ExternalRepo.objects.create(project=self.project,
@@ -471,7 +516,9 @@ class RepoDownloadViewTest(BaseViewTest):
         self.assertTrue(ProtectedView.NGINX_REDIRECT_HEADER in response)
         self.assertEqual(
             response[ProtectedView.NGINX_REDIRECT_HEADER],
-            '{}/{}-master.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS), self.project.name))
+            '{}/{}-{}.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS),
+                                     self.project.name,
+                                     self.get_commit_hash(code_file_path)))
 
     def test_redirects_nginx_to_file_works_with_internal_client(self):
         self.upload_file()
@@ -489,7 +536,9 @@ class RepoDownloadViewTest(BaseViewTest):
         self.assertTrue(ProtectedView.NGINX_REDIRECT_HEADER in response)
         self.assertEqual(
             response[ProtectedView.NGINX_REDIRECT_HEADER],
-            '{}/{}-master.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS), self.project.name))
+            '{}/{}-{}.tar.gz'.format(conf.get(ARCHIVES_ROOT_REPOS),
+                                     self.project.name,
+                                     self.get_commit_hash(code_file_path)))
 
 
 @pytest.mark.repos_mark
@@ -4,7 +4,16 @@ import pytest
 
 from db.models.experiment_jobs import ExperimentJob
 from factories.factory_experiments import ExperimentFactory
-from scheduler.experiment_scheduler import create_job, get_spawner_class, set_job_definition
+from db.models.job_resources import JobResources
+from lifecycles.jobs import JobLifeCycle
+from scheduler.experiment_scheduler import (
+    create_job,
+    create_jobs,
+    get_job,
+    get_spawner_class,
+    set_job_definition,
+    set_jobs_definitions
+)
 from scheduler.spawners.experiment_spawner import ExperimentSpawner
 from scheduler.spawners.horovod_spawner import HorovodSpawner
 from scheduler.spawners.mpi_job_spawner import MPIJobSpawner
@@ -13,7 +22,7 @@ from scheduler.spawners.pytorch_job_spawner import PytorchJobSpawner
 from scheduler.spawners.pytorch_spawner import PytorchSpawner
 from scheduler.spawners.tensorflow_spawner import TensorflowSpawner
 from scheduler.spawners.tf_job_spawner import TFJobSpawner
-from schemas import ExperimentBackend, ExperimentFramework, TaskType
+from schemas import ExperimentBackend, ExperimentFramework, PodResourcesConfig, TaskType
 from tests.base.case import BaseTest
 
 
@@ -75,6 +84,41 @@ class TestExperimentScheduler(BaseTest):
         job = ExperimentJob.objects.last()
         assert job.definition == definition
 
+    def test_create_jobs(self):
+        experiment = ExperimentFactory()
+        resources = PodResourcesConfig.from_dict({'cpu': {'requests': 1, 'limits': 2}})
+        job_uuids = [uuid.uuid4().hex for _ in range(3)]
+        create_jobs([get_job(job_uuid=job_uuids[0], experiment=experiment, resources=resources)] +
+                    [get_job(job_uuid=job_uuid,
+                             experiment=experiment,
+                             role=TaskType.WORKER,
+                             sequence=i)
+                     for i, job_uuid in enumerate(job_uuids[1:])])
+
+        assert ExperimentJob.objects.count() == 3
+        assert JobResources.objects.count() == 1
+        master = ExperimentJob.objects.get(uuid=job_uuids[0])
+        assert master.role == TaskType.MASTER
+        assert master.resources.cpu == {'requests': 1, 'limits': 2}
+        workers = ExperimentJob.objects.filter(role=TaskType.WORKER).order_by('sequence')
+        assert [job.uuid.hex for job in workers] == job_uuids[1:]
+        assert [job.resources for job in workers] == [None, None]
+        for job in ExperimentJob.objects.all():
+            assert job.last_status == JobLifeCycle.CREATED
+            assert job.statuses.count() == 1
+
+    def test_set_jobs_definitions(self):
+        experiment = ExperimentFactory()
+        job_uuids = [uuid.uuid4().hex for _ in range(2)]
+        create_jobs([get_job(job_uuid=job_uuid, experiment=experiment) for job_uuid in job_uuids])
+        responses = [
+            {'pod': {'metadata': {'labels': {'job_uuid': job_uuid}}}} for job_uuid in job_uuids
+        ]
+        set_jobs_definitions(responses)
+        for job_uuid, response in zip(job_uuids, responses):
+            job = ExperimentJob.objects.get(uuid=job_uuid)
+            assert job.definition == response
+
     def test_get_spawner_class(self):
         class DummySpec(object):
             def __init__(self, framework=None, backend=None, is_distributed=False):
@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+
+from mock import MagicMock, patch
+
+from options.registry.deployments import CHART_VERSION
+from scheduler.spawners.templates.experiment_jobs.manager import ResourceManager
+from tests.base.case import BaseTest
+
+
+@pytest.mark.spawner_mark
+class TestResourceManagerTemplates(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = ResourceManager(namespace='polyaxon',
+                                       project_name='user.project',
+                                       experiment_group_name=None,
+                                       experiment_name='user.project.1',
+                                       project_uuid=uuid.uuid4().hex,
+                                       experiment_group_uuid=None,
+                                       experiment_uuid=uuid.uuid4().hex,
+                                       job_container_name='polyaxon-experiment-job',
+                                       job_docker_image='image')
+
+    def test_get_option(self):
+        with patch('conf.get', return_value='0.5') as conf_get:
+            assert self.manager._get_option(CHART_VERSION) == '0.5'
+            assert self.manager._get_option(CHART_VERSION) == '0.5'
+        assert conf_get.call_count == 1
+
+    def test_get_template(self):
+        get_value = MagicMock(side_effect=lambda: object())
+        volume_mounts = [{'name': 'outputs'}]
+
+        value = self.manager._get_template('test', get_value, 'outputs', volume_mounts)
+        # Same objects
+        assert self.manager._get_template('test', get_value, 'outputs', volume_mounts) is value
+        # Equal objects
+        assert self.manager._get_template(
+            'test', get_value, 'outputs', [{'name': 'outputs'}]) is value
+        assert get_value.call_count == 1
+
+        # Different arguments
+        new_value = self.manager._get_template('test', get_value, 'data', volume_mounts)
+        assert new_value is not value
+        assert get_value.call_count == 2
+
+    def test_set_cluster_def_resets_templates(self):
+        get_value = MagicMock(side_effect=lambda: object())
+        self.manager.set_cluster_def({'master': ['master-0:2222']})
+        self.manager._get_template('container_env_vars', get_value)
+        self.manager._get_template('container_env_vars', get_value)
+        assert get_value.call_count == 1
+
+        self.manager.set_cluster_def({'master': ['master-0:2222'], 'worker': ['worker-0:2222']})
+        self.manager._get_template('container_env_vars', get_value)
+        assert get_value.call_count == 2
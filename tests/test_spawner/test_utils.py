@@ -88,3 +88,7 @@ class TestSpawner(BaseTest):
         job_uuid, experiment_uuid = RedisJobContainers.get_job(container_id)
         assert job.uuid.hex == job_uuid
         assert job.experiment.uuid.hex == experiment_uuid
+        assert RedisJobContainers.get_jobs([container_id, 'unknown']) == {
+            container_id: (job_uuid, experiment_uuid),
+            'unknown': (None, None),
+        }